@@ -1,7 +1,10 @@
+import functools
 import hashlib
 import os
 import re
 
+_UNSAFE_STEM_CHARS = re.compile(r"[^\w\-.]")
+
 
 def _load_cv2_numpy():
     import cv2
@@ -10,18 +13,27 @@ def _load_cv2_numpy():
     return cv2, np
 
 
-def sanitize_stem(path_or_name: str, default: str = "file") -> str:
-    stem = os.path.splitext(os.path.basename(str(path_or_name or "")))[0].strip()
+@functools.lru_cache(maxsize=4096)
+def _sanitize_stem_cached(name: str, default: str) -> str:
+    stem = os.path.splitext(os.path.basename(name))[0].strip()
     if not stem:
         stem = default
-    stem = re.sub(r"[^\w\-.]", "_", stem).strip("._")
+    stem = _UNSAFE_STEM_CHARS.sub("_", stem).strip("._")
     return stem[:80] or default
 
 
+def sanitize_stem(path_or_name: str, default: str = "file") -> str:
+    return _sanitize_stem_cached(str(path_or_name or ""), str(default))
+
+
+@functools.lru_cache(maxsize=4096)
+def _sha1_hex(key: str) -> str:
+    return hashlib.sha1(key.encode("utf-8", "ignore")).hexdigest()
+
+
 def path_token(path: str, length: int = 12) -> str:
     key = os.path.abspath(os.path.expanduser(str(path or "")))
-    digest = hashlib.sha1(key.encode("utf-8", "ignore")).hexdigest()
-    return digest[: max(4, int(length or 12))]
+    return _sha1_hex(key)[: max(4, int(length or 12))]
 
 
 def build_asset_path(
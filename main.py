@@ -8,6 +8,10 @@ import shutil
 import platform
 import contextlib
 import logging
+import functools
+import threading
+import concurrent.futures
+from collections import OrderedDict, deque
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QGridLayout,
@@ -19,11 +23,13 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QColorDialog,
     QComboBox,
-    QScrollArea
+    QScrollArea,
+    QStyledItemDelegate,
+    QStyle
 )
-from PySide6.QtCore import Qt, QSize, QThread, Signal, QTimer, QPointF, QPoint, QUrl, QLocale
+from PySide6.QtCore import Qt, QSize, QRect, QEventLoop, QThread, Signal, QTimer, QPointF, QPoint, QUrl, QLocale
 from PySide6.QtGui import (
-    QPixmap, QPen, QColor, QFont, QFontMetricsF, QTextOption, QImage, QIcon, QBrush, QAction, QKeySequence, QDesktopServices
+    QPixmap, QPen, QColor, QFont, QFontMetricsF, QTextOption, QImage, QImageReader, QImageIOHandler, QIcon, QBrush, QAction, QKeySequence, QDesktopServices, QTransform
 )
 import cv2
 import numpy as np
@@ -38,6 +44,10 @@ TARGET_IMAGE_HEIGHT = 1080          # 缩放目标高度
 # 字体大小
 FONT_SIZE_MIN = 6                   # 最小字号
 FONT_SIZE_MAX = 600                 # 最大字号
+PT_PER_PX = 72.0 / 96.0             # 96 DPI：像素 -> 磅
+PX_PER_PT = 96.0 / 72.0             # 96 DPI：磅 -> 像素
+LEGACY_FONT_CAP_MIN = 200           # 旧版自动字号上限 200pt（带少量取整误差）
+LEGACY_FONT_CAP_MAX = 205
 
 # 透明度
 DEFAULT_BG_ALPHA = 120              # 默认背景透明度
@@ -59,6 +69,22 @@ PREVIEW_FILE_MIN_AGE_SEC = 600      # 预览文件最小保留时间（秒）
 
 # 场景重建延迟
 SCENE_REBUILD_DELAY_MS = 80         # 场景重建延迟（毫秒）
+PROGRESS_UI_INTERVAL_SEC = 0.05     # 模态进度框刷新最小间隔（秒），约 20 次/秒
+
+# 撤销/重做
+UNDO_HISTORY_MAX = 50               # 撤销栈最多保留的步数
+SLIDE_PIXMAP_CACHE_SIZE = 6         # 已解码页面底图缓存条数（当前页 + 最近切换过的页）
+THUMB_CACHE_SIZE = 512              # 缩略图缓存条数上限（每张约 70KB；超出后淘汰最久未绘制的页）
+OCR_CACHE_PNG_COMPRESSION = 1       # OCR 缩放缓存图的 PNG 压缩级别（0-9；中间文件，取编码最快的一档）
+EXPORT_PREFETCH_PAGES = 3           # 导出 PPT 时后台预读的页图片数（读取与逐页构建重叠）
+PDF_IMPORT_ENCODE_WORKERS = max(2, min(8, os.cpu_count() or 2))  # PDF 导入时并行编码 PNG 的线程数
+PDF_IMPORT_PNG_COMPRESSION = 6      # PDF 页图 PNG 压缩级别（与 PyMuPDF pix.save 的 zlib 默认级别一致）
+PDF_IMPORT_DPI_DEFAULT = 144        # PDF 导入渲染 DPI 默认值（72 DPI 基准的 2 倍），可在 settings.json 用 pdf_import_dpi 调整
+PDF_IMPORT_JPEG_QUALITY = 90        # settings.json 中 pdf_import_format 为 "jpg" 时的 JPEG 质量
+PDF_IMPORT_RENDER_PROCESSES = min(os.cpu_count() or 1, 4)  # 长 PDF 渲染进程数（MuPDF 渲染持有 GIL，只能多进程并行）
+PDF_IMPORT_PROCESS_MIN_PAGES = 16   # 总页数达到该值才启用渲染进程池（抵消子进程启动开销）
+PAGE_BGR_CACHE_SIZE = 2             # 已解码原图 BGR 数组缓存条数（整页数组较大，只留最近用过的）
+BG_LOD_MAX_FACTOR = 8               # 缩小显示时底图最多预缩小到 1/8
 
 # ==================== Windows 控制台抑制 ====================
 @contextlib.contextmanager
@@ -220,8 +246,14 @@ except ImportError:
         def presentation_size_for_images(cls, image_paths):
             return 1, 1
 
+        @staticmethod
+        def image_size(image_path):
+            from PIL import Image
+            with Image.open(image_path) as img:
+                return img.size
+
         def __init__(self, **kwargs): pass
-        def add_image_with_text_boxes(self, *args): pass
+        def add_image_with_text_boxes(self, *args, **kwargs): pass
         def save(self, path): return True
 
 OCREngine = None  # 延迟 import（见 ensure_ocr_engine）
@@ -336,6 +368,154 @@ def _imwrite_any(path: str, image, params=None) -> bool:
     return imwrite_any(path, image, params=params)
 
 
+def _encode_pdf_page_image(samples, width: int, height: int, stride: int, channels: int, out_path: str) -> str:
+    """PyMuPDF 渲染出的像素 -> PNG/JPEG 文件（按 out_path 扩展名）。
+    可在线程池中执行：cv2 转换/编码期间释放 GIL，多页可以并行。"""
+    arr = np.frombuffer(samples, dtype=np.uint8).reshape(height, stride)[:, : width * channels]
+    arr = arr.reshape(height, width, channels)
+    if channels == 1:
+        arr = arr[:, :, 0]
+    elif channels == 3:
+        arr = cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
+    elif channels == 4:
+        arr = cv2.cvtColor(arr, cv2.COLOR_RGBA2BGRA)
+    if out_path.lower().endswith((".jpg", ".jpeg")):
+        if channels == 4:
+            arr = cv2.cvtColor(arr, cv2.COLOR_BGRA2BGR)
+        params = [cv2.IMWRITE_JPEG_QUALITY, PDF_IMPORT_JPEG_QUALITY]
+    else:
+        params = [cv2.IMWRITE_PNG_COMPRESSION, PDF_IMPORT_PNG_COMPRESSION]
+    if not _imwrite_any(out_path, arr, params):
+        raise RuntimeError(f"写入失败: {out_path}")
+    return out_path
+
+
+def _write_file_bytes(path: str, data: bytes) -> str:
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def _pdf_page_original_jpeg(doc, page):
+    """扫描版 PDF 页：整页只有一张铺满页面、正向放置的 JPEG 且没有文字/批注/矢量内容时，
+    直接返回该 JPEG 的原始字节（不再渲染+重新编码，也没有二次压缩损失）；否则返回 None。"""
+    try:
+        if int(page.rotation or 0) != 0 or page.first_annot is not None:
+            return None
+        images = page.get_images(full=True)
+        if len(images) != 1 or int(images[0][1] or 0) != 0:  # 有 SMask（透明通道）时不能直接用
+            return None
+        bbox, matrix = page.get_image_bbox(images[0], transform=True)
+        pr = page.rect
+        tol_x = pr.width * 0.01
+        tol_y = pr.height * 0.01
+        if (
+            abs(bbox.x0 - pr.x0) > tol_x or abs(bbox.x1 - pr.x1) > tol_x
+            or abs(bbox.y0 - pr.y0) > tol_y or abs(bbox.y1 - pr.y1) > tol_y
+        ):
+            return None
+        if abs(matrix.b) > 1e-6 or abs(matrix.c) > 1e-6 or matrix.a <= 0 or matrix.d <= 0:
+            return None
+        if page.get_text("text").strip():
+            return None
+        info = doc.extract_image(int(images[0][0]))
+        if not info or str(info.get("ext", "")).lower() not in ("jpeg", "jpg"):
+            return None
+        if int(info.get("colorspace", 0) or 0) not in (1, 3):  # CMYK JPEG 交给渲染路径转换
+            return None
+        raw = info.get("image") or None
+        # 带 EXIF 的 JPEG 可能有方向标记：PDF 渲染忽略它而 cv2.imread 会旋转，保守起见走渲染路径
+        if not raw or b"Exif\x00\x00" in raw[:65536]:
+            return None
+        if page.get_drawings():
+            return None
+        return raw
+    except Exception:
+        return None
+
+
+# 渲染进程内已打开的 PDF（按路径缓存，同一进程渲染同一文件的多页时只打开一次）。
+# 只在 spawn 出来的渲染进程里使用，随进程退出释放；主进程不往这里放文档
+_PDF_WORKER_DOCS = {}
+
+
+def _render_pdf_page(doc, page_index: int, zoom: float, out_path: str, jpg_path: str) -> str:
+    """用已打开的文档渲染 PDF 一页并落盘，返回实际写入的路径
+    （扫描页原样写到 jpg_path，其余按 out_path 扩展名写 PNG/JPEG）。"""
+    import fitz  # PyMuPDF
+
+    page = doc.load_page(page_index)
+    raw_jpeg = _pdf_page_original_jpeg(doc, page)
+    if raw_jpeg:
+        return _write_file_bytes(jpg_path, raw_jpeg)
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csRGB, alpha=False)
+    if out_path.lower().endswith(".png"):
+        pix.save(out_path)
+        return out_path
+    return _encode_pdf_page_image(pix.samples, int(pix.width), int(pix.height), int(pix.stride), int(pix.n), out_path)
+
+
+def _render_pdf_page_file(pdf_path: str, page_index: int, zoom: float, out_path: str, jpg_path: str) -> str:
+    """渲染进程池 worker：按路径打开（并在本进程内缓存）文档后渲染一页，见 _render_pdf_page。"""
+    import fitz  # PyMuPDF
+
+    doc = _PDF_WORKER_DOCS.get(pdf_path)
+    if doc is None:
+        doc = fitz.open(pdf_path)
+        _PDF_WORKER_DOCS[pdf_path] = doc
+    return _render_pdf_page(doc, page_index, zoom, out_path, jpg_path)
+
+
+def _scale_image_for_ocr(original_path: str, out_dir: str, target_h: int = TARGET_IMAGE_HEIGHT):
+    """Scale one image to ~target_h for OCR and write it under out_dir.
+
+    Returns the scaled path, the original path when no scaling is needed, or None if unreadable.
+    Safe to run in a worker thread (no Qt objects involved).
+    """
+    # 先只读文件头：高度已接近目标（最常见的 1080p 截图/PDF 页）时直接返回原图路径，整张图都不用解码
+    try:
+        from PIL import Image
+
+        with Image.open(original_path) as _im:
+            _w, _h = _im.size
+            # cv2 读图会按 EXIF 方向旋转；带旋转标记的图以解码结果为准
+            _orient = _im.getexif().get(0x0112, 1)
+        if _orient == 1 and _w > 0 and _h > 0 and abs(_h - target_h) < 100:
+            return original_path
+    except Exception:
+        pass
+
+    img = _imread_any(original_path)
+    if img is None:
+        return None
+
+    h, w = img.shape[:2]
+
+    # 防止除零：高度为0的图片跳过
+    if h <= 0 or w <= 0:
+        return original_path
+
+    # 如果图片高度已经接近1080p，不需要缩放
+    if abs(h - target_h) < 100:
+        return original_path
+
+    # 计算缩放比例
+    scale = target_h / max(1, h)
+    new_w = int(w * scale)
+    new_h = target_h
+
+    # 缩放图片：只给 OCR 检测用，对插值质量不敏感。大幅缩小（< 1/2）时用 INTER_AREA 防止细笔画混叠，
+    # 其余（轻度缩小/放大）用开销更小的双线性。
+    interp = cv2.INTER_AREA if scale < 0.5 else cv2.INTER_LINEAR
+    scaled_img = cv2.resize(img, (new_w, new_h), interpolation=interp)
+
+    # 保存到缓存目录：只给 OCR 读一次的中间文件，用最低 zlib 压缩级别（编码快数倍，文件稍大无所谓）
+    scaled_path = build_asset_path(out_dir, "scaled", original_path, ext=".png")
+    if not _imwrite_any(scaled_path, scaled_img, [cv2.IMWRITE_PNG_COMPRESSION, OCR_CACHE_PNG_COMPRESSION]):
+        raise RuntimeError("无法写入缩放后的临时图片")
+    return scaled_path
+
+
 def _srgb_to_linear(c):
     c = float(c)
     if c <= 0.04045:
@@ -520,41 +700,69 @@ def extract_text_color_from_region(image, rect_xywh, sample_ratio=0.3):
         return None
 
 
+_BASIC_TEXT_PALETTE = (
+    ((0, 0, 0), "黑"),
+    ((255, 255, 255), "白"),
+    ((255, 0, 0), "红"),
+    ((255, 165, 0), "橙"),
+    ((255, 255, 0), "黄"),
+    ((0, 255, 0), "绿"),
+    ((0, 255, 255), "青"),
+    ((0, 0, 255), "蓝"),
+    ((128, 0, 255), "紫"),
+)
+# 调色板的 Lab 值只需计算一次
+_BASIC_TEXT_PALETTE_LAB = tuple((_rgb_to_lab(prgb), prgb, name) for prgb, name in _BASIC_TEXT_PALETTE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _quantize_rgb_cached(r, g, b):
+    lab = _rgb_to_lab([r, g, b])
+    best = None
+    best_d = None
+    for plab, prgb, name in _BASIC_TEXT_PALETTE_LAB:
+        d = _ciede2000(lab, plab)
+        if best_d is None or d < best_d:
+            best_d = d
+            best = (prgb, name)
+    return best
+
+
 def quantize_text_color_basic(rgb):
     """将任意 RGB 颜色量化为常见基础色（用于 PPT 文本颜色），并返回 (rgb, name_zh)。
 
     使用 CIEDE2000（Lab 感知距离）在固定调色板中选最近颜色，比简单 HSV 区间更稳。
+    结果按 (r, g, b) 缓存：切换页面/撤销时会对每个框重复归一化颜色。
     """
     try:
         if not (isinstance(rgb, (list, tuple)) and len(rgb) == 3):
             return (None, None)
         r, g, b = [int(max(0, min(255, v))) for v in rgb]
-
-        palette = [
-            ([0, 0, 0], "黑"),
-            ([255, 255, 255], "白"),
-            ([255, 0, 0], "红"),
-            ([255, 165, 0], "橙"),
-            ([255, 255, 0], "黄"),
-            ([0, 255, 0], "绿"),
-            ([0, 255, 255], "青"),
-            ([0, 0, 255], "蓝"),
-            ([128, 0, 255], "紫"),
-        ]
-
-        lab = _rgb_to_lab([r, g, b])
-        best = None
-        best_d = None
-        for prgb, name in palette:
-            d = _ciede2000(lab, _rgb_to_lab(prgb))
-            if best_d is None or d < best_d:
-                best_d = d
-                best = (prgb, name)
-        return best if best is not None else (None, None)
+        best = _quantize_rgb_cached(r, g, b)
+        if best is None:
+            return (None, None)
+        prgb, name = best
+        return (list(prgb), name)
     except Exception:
         return (None, None)
 
 
+def font_size_hit_legacy_cap(fs, box_h_px):
+    """旧版自动拟合把字号封顶在 200pt；若框高明显容得下更大的字号，则应重新拟合。"""
+    if fs is None or not (LEGACY_FONT_CAP_MIN <= fs <= LEGACY_FONT_CAP_MAX):
+        return False
+    return float(box_h_px) * PT_PER_PX > (float(fs) + 30.0)
+
+
+@functools.lru_cache(maxsize=32)
+def _sample_font_metrics(family: str, bold: bool, sample_pt: float = 100.0):
+    """(字体, 加粗) 在参考字号下的 QFontMetricsF；同一字体的所有文本框共用，不再每个框构造 QFont。"""
+    f = QFont(str(family))
+    f.setBold(bool(bold))
+    f.setPointSizeF(float(sample_pt))
+    return QFontMetricsF(f)
+
+
 def normalize_box_text_color_fields(box):
     """Prefer the raw extracted text color; keep palette color only as metadata."""
     if not isinstance(box, dict):
@@ -593,6 +801,120 @@ def normalize_box_text_color_fields(box):
             pass
 
 
+def _copy_box_value(v):
+    if isinstance(v, list):
+        return [_copy_box_value(x) for x in v]
+    if isinstance(v, dict):
+        return {k: _copy_box_value(x) for k, x in v.items()}
+    if isinstance(v, tuple):
+        return tuple(_copy_box_value(x) for x in v)
+    if isinstance(v, np.ndarray):
+        return v.copy()
+    return v
+
+
+def copy_box(box):
+    """文本框 dict 的专用深拷贝。
+
+    值只有标量/字符串、（嵌套）列表/元组和 ndarray（PaddleOCR 3.x 的 bbox），
+    按类型直接复制，比通用的 copy.deepcopy（memo 表 + 反射分派）快得多；撤销快照/复制页时大量调用。
+    """
+    if not isinstance(box, dict):
+        return copy.deepcopy(box)
+    return {k: _copy_box_value(v) for k, v in box.items()}
+
+
+def copy_boxes(boxes):
+    return [copy_box(b) for b in (boxes or [])]
+
+
+def _collect_rect_rows(items):
+    """Collect valid `rect` values of dict items as rows for a (N, 4) array.
+
+    Returns (indices, rows) so results can be written back to the same items.
+    """
+    idx = []
+    rows = []
+    for i, item in enumerate(items or []):
+        rect = item.get("rect") if isinstance(item, dict) else None
+        if isinstance(rect, (list, tuple)) and len(rect) == 4:
+            idx.append(i)
+            rows.append(rect)
+    return idx, rows
+
+
+def _offset_result_rects(results, dx, dy):
+    """把识别结果的 rect 整体平移 (dx, dy)（选区裁剪坐标 -> 整图坐标），原地修改。
+
+    框多时收集成 (N, 4) 数组一次相加；框少或含异常值时逐框处理（跳过无法解析的 rect）。
+    """
+    idx, rows = _collect_rect_rows(results)
+    if not rows:
+        return
+    if len(rows) >= 16:
+        try:
+            moved = np.asarray(rows, dtype=np.float64).astype(np.int64) + np.array([int(dx), int(dy), 0, 0])
+            for i, rect in zip(idx, moved.tolist()):
+                results[i]["rect"] = rect
+            return
+        except Exception:
+            pass
+    for i, rect in zip(idx, rows):
+        try:
+            rx, ry, rw, rh = [int(v) for v in rect]
+            results[i]["rect"] = [rx + dx, ry + dy, rw, rh]
+        except Exception:
+            pass
+
+
+def _sort_by_yx(items):
+    """按 (y, x) 稳定排序 (y, x, ...) 元组列表，原地修改。
+
+    元素多时用 np.lexsort 在 C 层完成排序，再按下标重排；元素少时直接 list.sort。
+    """
+    if len(items) >= 64:
+        try:
+            ys = np.fromiter((t[0] for t in items), dtype=np.float64, count=len(items))
+            xs = np.fromiter((t[1] for t in items), dtype=np.float64, count=len(items))
+            order = np.lexsort((xs, ys)).tolist()
+            items[:] = [items[i] for i in order]
+            return
+        except Exception:
+            pass
+    items.sort(key=lambda t: (t[0], t[1]))
+
+
+def _rects_intersect_roi(rects, roi_xywh):
+    """Vectorized xywh rect vs ROI overlap test; invalid rects count as not intersecting."""
+    hit = [False] * len(rects)
+    try:
+        rx, ry, rw, rh = [int(v) for v in roi_xywh]
+    except Exception:
+        return hit
+    if rw <= 0 or rh <= 0:
+        return hit
+
+    idx = []
+    rows = []
+    for i, rect in enumerate(rects):
+        if not (isinstance(rect, (list, tuple)) and len(rect) == 4):
+            continue
+        try:
+            rows.append([int(v) for v in rect])
+        except Exception:
+            continue
+        idx.append(i)
+    if not rows:
+        return hit
+
+    a = np.asarray(rows, dtype=np.int64)
+    x, y, w, h = a[:, 0], a[:, 1], a[:, 2], a[:, 3]
+    mask = (w > 0) & (h > 0) & (x < rx + rw) & (x + w > rx) & (y < ry + rh) & (y + h > ry)
+    for i, m in zip(idx, mask.tolist()):
+        hit[i] = bool(m)
+    return hit
+
+
 def should_auto_refresh_text_color(box):
     if not isinstance(box, dict):
         return False
@@ -992,13 +1314,17 @@ class OCRThread(QThread):
     all_done = Signal()           # emitted once when the run loop ends
     error = Signal(str)           # emitted on first fatal OCR error
 
-    def __init__(self, ocr_engine, images, scaled_images, roi_by_image=None, roi_temp_dir=None):
+    BATCH_SIZE = 4                # 无选区页一次批量识别的最大张数
+    PREFETCH_PAGES = 8            # 识别当前批次时，后台预先解码的后续页数上限（限制内存占用）
+
+    def __init__(self, ocr_engine, images, scaled_images, roi_by_image=None):
         super().__init__()
         self.ocr_engine = ocr_engine
         self.images = images
         self.scaled_images = scaled_images
         self.roi_by_image = roi_by_image or {}
-        self.roi_temp_dir = roi_temp_dir
+        self._prefetched = {}  # 缩放图路径 -> 解码 Future
+        self._prefetch_next = 0
 
     @staticmethod
     def _parse_roi(roi_xywh):
@@ -1012,125 +1338,182 @@ class OCRThread(QThread):
             return None
         return [x, y, w, h]
 
-    def run(self):
-        import time
+    def _run_roi(self, i, img_path, scaled_path, roi_orig):
+        """只识别选区；返回 (是否已处理, 用于整图识别的路径)。选区无效/太小时回退整图识别。"""
         from PIL import Image
 
-        for i, img_path in enumerate(self.images):
-            if self.isInterruptionRequested():
-                break
+        # 如果设置了 ROI，就只识别选区（在缩放图上裁剪，结果坐标仍在“缩放图坐标系”里，主线程再还原到原图）。
+        orig_w = orig_h = None
+        try:
+            with Image.open(img_path) as _im:
+                orig_w, orig_h = _im.size
+        except Exception:
+            orig_w = orig_h = None
 
-            scaled_path = self.scaled_images.get(img_path, img_path) or img_path
-            roi_orig = self._parse_roi((self.roi_by_image or {}).get(img_path))
+        try:
+            x, y, w, h = [int(v) for v in roi_orig]
+        except Exception:
+            x = y = w = h = None
 
-            # 如果设置了 ROI，就只识别选区（在缩放图上裁剪，结果坐标仍在“缩放图坐标系”里，主线程再还原到原图）。
-            if roi_orig:
-                orig_w = orig_h = None
-                try:
-                    with Image.open(img_path) as _im:
-                        orig_w, orig_h = _im.size
-                except Exception:
-                    orig_w = orig_h = None
+        if orig_w and orig_h and x is not None:
+            # Clamp ROI to original bounds.
+            x = max(0, min(x, orig_w - 1))
+            y = max(0, min(y, orig_h - 1))
+            w = max(1, min(w, orig_w - x))
+            h = max(1, min(h, orig_h - y))
+            roi_orig = [x, y, w, h]
 
-                try:
-                    x, y, w, h = [int(v) for v in roi_orig]
-                except Exception:
-                    x = y = w = h = None
+        try:
+            img = _imread_any(scaled_path)
+            if img is None:
+                img = _imread_any(img_path)
+                scaled_path = img_path
+            if img is not None and x is not None:
+                Hs, Ws = img.shape[:2]
+                xs, ys, ws, hs = x, y, w, h
+                if scaled_path != img_path and orig_w and orig_h:
+                    # Map ROI from original coords -> scaled coords.
+                    sx = float(Ws) / max(1.0, float(orig_w))
+                    sy = float(Hs) / max(1.0, float(orig_h))
+                    xs = int(round(float(x) * sx))
+                    ys = int(round(float(y) * sy))
+                    ws = int(round(float(w) * sx))
+                    hs = int(round(float(h) * sy))
+
+                xs = max(0, min(int(xs), Ws - 1))
+                ys = max(0, min(int(ys), Hs - 1))
+                ws = max(1, min(int(ws), Ws - xs))
+                hs = max(1, min(int(hs), Hs - ys))
+
+                # Too small -> fallback to full image OCR (avoid accidental tiny drags).
+                if ws >= 5 and hs >= 5:
+                    # 裁剪图直接以数组交给 OCR，不再写 PNG 临时文件再读回
+                    crop = img[ys : ys + hs, xs : xs + ws]
+                    results = self.ocr_engine.recognize(crop) or []
+                    # Offset rects back to (scaled) full-image coordinates.
+                    _offset_result_rects(results, xs, ys)
+
+                    self.finished.emit(img_path, results, roi_orig)
+                    self.progress.emit(i + 1, len(self.images))
+                    return True, scaled_path
+        except Exception:
+            # Fall back to full-image OCR.
+            pass
+        return False, scaled_path
 
-                if orig_w and orig_h and x is not None:
-                    # Clamp ROI to original bounds.
-                    x = max(0, min(x, orig_w - 1))
-                    y = max(0, min(y, orig_h - 1))
-                    w = max(1, min(w, orig_w - x))
-                    h = max(1, min(h, orig_h - y))
-                    roi_orig = [x, y, w, h]
+    def _take_prefetched(self, scaled_path):
+        """取出预解码好的图像数组；未预取/解码失败时返回路径，交给 OCR 自己读。"""
+        fut = self._prefetched.pop(scaled_path, None)
+        if fut is None:
+            return scaled_path
+        try:
+            img = fut.result()
+        except Exception:
+            img = None
+        return img if img is not None else scaled_path
 
+    def _flush_pending(self, pending):
+        """识别攒下的整图页（多张时走一次批量调用）；失败时发出 error 并返回 False。"""
+        if not pending:
+            return True
+        paths = [scaled_path for _, _, scaled_path in pending]
+        inputs = [self._take_prefetched(p) for p in paths]
+        try:
+            if len(inputs) == 1:
+                batch = [self.ocr_engine.recognize(inputs[0])]
+            else:
+                batch = self.ocr_engine.recognize_batch(inputs)
+        except Exception as e:
+            if len(inputs) == 1:
+                self._emit_page_error(paths[0], e)
+                pending.clear()
+                return False
+            # 批量调用失败时逐页重试：能识别的页照常发出结果，只对真正失败的那一页报错并停止
+            # （与逐页识别时的行为一致，失败页之前的结果不丢）
+            for (i, img_path, scaled_path), inp in zip(pending, inputs):
                 try:
-                    img = _imread_any(scaled_path)
-                    if img is None:
-                        img = _imread_any(img_path)
-                        scaled_path = img_path
-                    if img is not None and x is not None:
-                        Hs, Ws = img.shape[:2]
-                        xs, ys, ws, hs = x, y, w, h
-                        if scaled_path != img_path and orig_w and orig_h:
-                            # Map ROI from original coords -> scaled coords.
-                            sx = float(Ws) / max(1.0, float(orig_w))
-                            sy = float(Hs) / max(1.0, float(orig_h))
-                            xs = int(round(float(x) * sx))
-                            ys = int(round(float(y) * sy))
-                            ws = int(round(float(w) * sx))
-                            hs = int(round(float(h) * sy))
-
-                        xs = max(0, min(int(xs), Ws - 1))
-                        ys = max(0, min(int(ys), Hs - 1))
-                        ws = max(1, min(int(ws), Ws - xs))
-                        hs = max(1, min(int(hs), Hs - ys))
-
-                        # Too small -> fallback to full image OCR (avoid accidental tiny drags).
-                        if ws >= 5 and hs >= 5:
-                            crop = img[ys : ys + hs, xs : xs + ws]
-                            out_dir = str(self.roi_temp_dir or tempfile.gettempdir())
-                            try:
-                                os.makedirs(out_dir, exist_ok=True)
-                            except Exception:
-                                pass
-                            ts = int(time.time() * 1000)
-                            crop_path = build_asset_path(
-                                out_dir,
-                                "roi_ocr",
-                                img_path,
-                                suffix=f"{ts}_{xs}_{ys}_{ws}x{hs}",
-                                ext=".png",
-                            )
-                            if not _imwrite_any(crop_path, crop):
-                                raise RuntimeError(_t_global("无法写入 ROI 临时图片", "Failed to write ROI temp image"))
-
-                            results = self.ocr_engine.recognize(crop_path) or []
-                            # Offset rects back to (scaled) full-image coordinates.
-                            for r in results:
-                                if not isinstance(r, dict):
-                                    continue
-                                rect = r.get("rect")
-                                if isinstance(rect, (list, tuple)) and len(rect) == 4:
-                                    try:
-                                        rx, ry, rw, rh = [int(v) for v in rect]
-                                        r["rect"] = [rx + xs, ry + ys, rw, rh]
-                                    except Exception:
-                                        pass
-
-                            self.finished.emit(img_path, results, roi_orig)
-                            self.progress.emit(i + 1, len(self.images))
-                            continue
-                except Exception:
-                    # Fall back to full-image OCR below.
-                    pass
+                    results = self.ocr_engine.recognize(inp)
+                except Exception as page_e:
+                    self._emit_page_error(scaled_path, page_e)
+                    pending.clear()
+                    return False
+                self.finished.emit(img_path, results, None)
+                self.progress.emit(i + 1, len(self.images))
+            pending.clear()
+            return True
+        for (i, img_path, _), results in zip(pending, batch):
+            self.finished.emit(img_path, results, None)
+        # 一批结果同时到达：进度只报最后一页。模态进度框每次 setValue 都会同步处理一轮事件，
+        # 逐页上报只会在一瞬间连续重绘多次
+        self.progress.emit(pending[-1][0] + 1, len(self.images))
+        pending.clear()
+        return True
+
+    def _emit_page_error(self, path, e):
+        # Avoid "Error calling Python override of QThread::run()" and let the UI show the error.
+        try:
+            self.error.emit(f"OCR 识别失败: {os.path.basename(path)}\n{type(e).__name__}: {e}")
+        except Exception:
+            pass
 
+    def _prefetch(self, pool, plan, upto):
+        """把 [已提交, upto) 范围内无选区页的解码提交到后台线程（cv2 解码会释放 GIL，与识别重叠）。"""
+        while self._prefetch_next < min(upto, len(plan)):
+            _, scaled_path, roi_orig = plan[self._prefetch_next]
+            self._prefetch_next += 1
+            if not roi_orig and scaled_path not in self._prefetched:
+                self._prefetched[scaled_path] = pool.submit(_imread_any, scaled_path)
+
+    def run(self):
+        # 无选区的页攒成一批（最多 BATCH_SIZE 张）再识别，分摊每次调用 OCR 的固定开销；
+        # 有选区的页在识别前先把已攒的批次处理掉，保证结果/进度按页顺序发出。
+        # 识别只在本线程串行进行（OCR 引擎实例不可重入），后续页的解码由一个后台线程提前做好。
+        plan = []
+        for img_path in self.images:
+            scaled_path = self.scaled_images.get(img_path, img_path) or img_path
+            plan.append((img_path, scaled_path, self._parse_roi((self.roi_by_image or {}).get(img_path))))
+        self._prefetched = {}
+        self._prefetch_next = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr-read") as pool:
             try:
-                results = self.ocr_engine.recognize(scaled_path)
-            except Exception as e:
-                # Avoid "Error calling Python override of QThread::run()" and let the UI show the error.
-                try:
-                    self.error.emit(f"OCR 识别失败: {os.path.basename(scaled_path)}\n{type(e).__name__}: {e}")
-                except Exception:
-                    pass
-                break
-            self.finished.emit(img_path, results, None)
-            self.progress.emit(i + 1, len(self.images))
+                self._run_plan(pool, plan)
+            finally:
+                for fut in self._prefetched.values():
+                    fut.cancel()
+                self._prefetched = {}
         self.all_done.emit()
 
+    def _run_plan(self, pool, plan):
+        pending = []
+        for i, (img_path, scaled_path, roi_orig) in enumerate(plan):
+            if self.isInterruptionRequested():
+                break
+            self._prefetch(pool, plan, i + self.PREFETCH_PAGES)
+
+            if roi_orig:
+                if not self._flush_pending(pending):
+                    break
+                handled, scaled_path = self._run_roi(i, img_path, scaled_path, roi_orig)
+                if handled:
+                    continue
+
+            pending.append((i, img_path, scaled_path))
+            if len(pending) >= self.BATCH_SIZE and not self._flush_pending(pending):
+                break
+        else:
+            self._flush_pending(pending)
+
 
 class OCRRoiThread(QThread):
     """OCR only within a ROI; results are emitted in original-image coordinates."""
     finished = Signal(str, list)  # (image_path, results)
     error = Signal(str)
 
-    def __init__(self, ocr_engine, image_path: str, roi_xywh, out_dir: str):
+    def __init__(self, ocr_engine, image_path: str, roi_xywh):
         super().__init__()
         self.ocr_engine = ocr_engine
         self.image_path = str(image_path or "")
         self.roi = roi_xywh
-        self.out_dir = str(out_dir or "")
 
     def run(self):
         try:
@@ -1153,28 +1536,9 @@ class OCRRoiThread(QThread):
             h = max(1, min(h, H - y))
 
             crop = img[y : y + h, x : x + w]
-            out_path = build_asset_path(
-                self.out_dir,
-                "roi_ocr",
-                self.image_path,
-                suffix=f"{x}_{y}_{w}x{h}",
-                ext=".png",
-            )
-            if not _imwrite_any(out_path, crop):
-                raise RuntimeError(_t_global("无法写入 ROI 临时图片", "Failed to write ROI temp image"))
-
-            results = self.ocr_engine.recognize(out_path) or []
+            results = self.ocr_engine.recognize(crop) or []
             # Offset rects back to original coordinates
-            for r in results:
-                if not isinstance(r, dict):
-                    continue
-                rect = r.get("rect")
-                if isinstance(rect, (list, tuple)) and len(rect) == 4:
-                    try:
-                        rx, ry, rw, rh = [int(v) for v in rect]
-                        r["rect"] = [rx + x, ry + y, rw, rh]
-                    except Exception:
-                        pass
+            _offset_result_rects(results, x, y)
 
             self.finished.emit(self.image_path, results)
         except Exception as e:
@@ -1235,6 +1599,10 @@ class InpaintThread(QThread):
         self.remote_pad_x = max(0, int(remote_pad_x or 0))
         self.remote_pad_y = max(0, int(remote_pad_y or 0))
         self.results = []  # list[(src, out)]
+        # 每个请求线程一个 requests.Session：对 IOPaint 服务保持 keep-alive，不再每个裁剪块都新建 TCP 连接
+        self._http_local = threading.local()
+        self._http_sessions = []
+        self._http_lock = threading.Lock()
 
     @classmethod
     def _normalize_box_clean_mode(cls, value):
@@ -1385,6 +1753,21 @@ class InpaintThread(QThread):
             or (by + bh + g) < ay
         )
 
+    @staticmethod
+    def _touch_matrix(rects, gap):
+        """Upper-triangular (i < j) matrix of `_rects_touch` results for xywh rects."""
+        a = np.asarray(rects, dtype=np.int64).reshape(-1, 4)
+        g = max(0, int(gap or 0))
+        x1, y1 = a[:, 0], a[:, 1]
+        x2, y2 = x1 + a[:, 2] + g, y1 + a[:, 3] + g
+        apart = (
+            (x2[:, None] < x1[None, :])
+            | (x2[None, :] < x1[:, None])
+            | (y2[:, None] < y1[None, :])
+            | (y2[None, :] < y1[:, None])
+        )
+        return np.triu(~apart, k=1)
+
     @classmethod
     def _cluster_boxes(cls, boxes, merge_gap):
         valid = []
@@ -1411,29 +1794,23 @@ class InpaintThread(QThread):
             if ra != rb:
                 parent[rb] = ra
 
-        for i in range(n):
-            rect_i, _ = valid[i]
-            for j in range(i + 1, n):
-                rect_j, _ = valid[j]
-                if cls._rects_touch(rect_i, rect_j, merge_gap):
-                    union(i, j)
+        if n > 1:
+            # 所有框两两相邻判定一次性用 NumPy 广播完成（等价于逐对 _rects_touch），只对命中的对做 union
+            for i, j in zip(*np.nonzero(cls._touch_matrix([rect for rect, _ in valid], merge_gap))):
+                union(int(i), int(j))
 
         groups = {}
         for idx, (rect, box) in enumerate(valid):
             root = find(idx)
             groups.setdefault(root, []).append((rect[1], rect[0], box))
 
-        clusters = []
+        # 组内按 (y, x) 排序；组间按首框的 (y, x) 排序——首框坐标排序时已知，不必再逐次 _extract_rect
+        keyed = []
         for items in groups.values():
-            items.sort(key=lambda t: (t[0], t[1]))
-            clusters.append([box for _, _, box in items])
-        clusters.sort(
-            key=lambda grp: (
-                cls._extract_rect(grp[0])[1] if cls._extract_rect(grp[0]) else 0,
-                cls._extract_rect(grp[0])[0] if cls._extract_rect(grp[0]) else 0,
-            )
-        )
-        return clusters
+            _sort_by_yx(items)
+            keyed.append((items[0][0], items[0][1], [box for _, _, box in items]))
+        _sort_by_yx(keyed)
+        return [boxes for _, _, boxes in keyed]
 
     @staticmethod
     def _crop_from_mask(image_pil, mask_pil, crop_padding):
@@ -1569,18 +1946,14 @@ class InpaintThread(QThread):
 
     @staticmethod
     def _extract_runs_1d(mask_line):
-        runs = []
-        start = None
-        for idx, val in enumerate(mask_line):
-            if bool(val):
-                if start is None:
-                    start = idx
-            elif start is not None:
-                runs.append((start, idx - 1))
-                start = None
-        if start is not None:
-            runs.append((start, len(mask_line) - 1))
-        return runs
+        """返回一维掩码中连续为真的区间 [(start, end), ...]（end 含）；用 np.diff 找边界，不逐像素循环。"""
+        line = np.asarray(mask_line).astype(bool, copy=False).ravel()
+        if line.size == 0:
+            return []
+        edges = np.diff(np.concatenate(([False], line, [False])).astype(np.int8))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1) - 1
+        return list(zip(starts.tolist(), ends.tolist()))
 
     @staticmethod
     def _sample_median_color(img_rgb, sample_mask):
@@ -1693,17 +2066,19 @@ class InpaintThread(QThread):
         horizontal = cv2.bitwise_or(horizontal_dark, horizontal_light)
         vertical = cv2.bitwise_or(vertical_dark, vertical_light)
 
+        # 循环外一次性算好布尔图和候选行/列，逐行/逐列循环里只剩切片与取样
+        h_supports = (horizontal_dark > 0, horizontal_light > 0)
+        v_supports = (vertical_dark > 0, vertical_light > 0)
+        unmasked = ~mask_bool
         overlays = []
-        rows = np.where(mask_bool.any(axis=1))[0]
-        cols = np.where(mask_bool.any(axis=0))[0]
+        rows = np.flatnonzero(mask_bool.any(axis=1) & (horizontal > 0).any(axis=1))
+        cols = np.flatnonzero(mask_bool.any(axis=0) & (vertical > 0).any(axis=0))
 
         for y in rows:
-            if not (horizontal[y] > 0).any():
-                continue
             for start, end in cls._extract_runs_1d(mask_bool[y]):
                 best = None
-                for support_src in (horizontal_dark, horizontal_light):
-                    support_row = support_src[y] > 0
+                for support_src in h_supports:
+                    support_row = support_src[y]
                     left_idx = np.where(support_row[:start])[0]
                     right_idx = np.where(support_row[end + 1 :])[0]
                     if left_idx.size == 0 or right_idx.size == 0:
@@ -1716,7 +2091,7 @@ class InpaintThread(QThread):
                     y2 = min(h, y + 2)
                     sx1 = max(0, x1 - 12)
                     sx2 = min(w, x2 + 13)
-                    support_strip = (support_src[y1:y2, sx1:sx2] > 0) & (~mask_bool[y1:y2, sx1:sx2])
+                    support_strip = support_src[y1:y2, sx1:sx2] & unmasked[y1:y2, sx1:sx2]
                     color = cls._sample_median_color(img_rgb[y1:y2, sx1:sx2], support_strip)
                     if color is None:
                         continue
@@ -1728,19 +2103,17 @@ class InpaintThread(QThread):
                             "x2": x2,
                             "color": color,
                             "score": score,
-                            "thickness": int(np.clip(np.sum(np.any(support_src[max(0, y - 2) : min(h, y + 3), x1 : x2 + 1] > 0, axis=1)), 1, 3)),
+                            "thickness": int(np.clip(np.sum(np.any(support_src[max(0, y - 2) : min(h, y + 3), x1 : x2 + 1], axis=1)), 1, 3)),
                             "contrast": contrast,
                         }
                 if best and best["contrast"] >= 8.0:
                     cls._register_overlay(overlays, "h", y, best["x1"], best["x2"], best["color"], best["thickness"])
 
         for x in cols:
-            if not (vertical[:, x] > 0).any():
-                continue
             for start, end in cls._extract_runs_1d(mask_bool[:, x]):
                 best = None
-                for support_src in (vertical_dark, vertical_light):
-                    support_col = support_src[:, x] > 0
+                for support_src in v_supports:
+                    support_col = support_src[:, x]
                     top_idx = np.where(support_col[:start])[0]
                     bottom_idx = np.where(support_col[end + 1 :])[0]
                     if top_idx.size == 0 or bottom_idx.size == 0:
@@ -1753,7 +2126,7 @@ class InpaintThread(QThread):
                     x2 = min(w, x + 2)
                     sy1 = max(0, y1 - 12)
                     sy2 = min(h, y2 + 13)
-                    support_strip = (support_src[sy1:sy2, x1:x2] > 0) & (~mask_bool[sy1:sy2, x1:x2])
+                    support_strip = support_src[sy1:sy2, x1:x2] & unmasked[sy1:sy2, x1:x2]
                     color = cls._sample_median_color(img_rgb[sy1:sy2, x1:x2], support_strip)
                     if color is None:
                         continue
@@ -1765,7 +2138,7 @@ class InpaintThread(QThread):
                             "y2": y2,
                             "color": color,
                             "score": score,
-                            "thickness": int(np.clip(np.sum(np.any(support_src[y1 : y2 + 1, max(0, x - 2) : min(w, x + 3)] > 0, axis=0)), 1, 3)),
+                            "thickness": int(np.clip(np.sum(np.any(support_src[y1 : y2 + 1, max(0, x - 2) : min(w, x + 3)], axis=0)), 1, 3)),
                             "contrast": contrast,
                         }
                 if best and best["contrast"] >= 8.0:
@@ -1846,15 +2219,15 @@ class InpaintThread(QThread):
     def _run_local_cv2(cls, crop_img, crop_mask, analysis):
         from PIL import Image
 
-        img_bgr = cv2.cvtColor(np.asarray(crop_img, dtype=np.uint8), cv2.COLOR_RGB2BGR)
+        # cv2.inpaint 对各通道独立处理，与通道顺序无关：直接用 RGB 数组，省去 RGB<->BGR 两次整块转换
+        img_rgb = np.ascontiguousarray(np.asarray(crop_img, dtype=np.uint8))
         mask_u8 = (np.asarray(crop_mask, dtype=np.uint8) > 0).astype(np.uint8) * 255
 
         edge_density = float((analysis or {}).get("edge_density", 1.0))
         plane_residual = float((analysis or {}).get("plane_residual", 999.0))
         radius = 3 if edge_density <= 0.05 else 4
         method = cv2.INPAINT_NS if plane_residual <= 10.0 and edge_density <= 0.04 else cv2.INPAINT_TELEA
-        out_bgr = cv2.inpaint(img_bgr, mask_u8, radius, method)
-        out_rgb = cv2.cvtColor(out_bgr, cv2.COLOR_BGR2RGB)
+        out_rgb = cv2.inpaint(img_rgb, mask_u8, radius, method)
         return Image.fromarray(out_rgb, mode="RGB")
 
     @classmethod
@@ -1866,11 +2239,30 @@ class InpaintThread(QThread):
             return cls._run_local_cv2(crop_img, crop_mask, analysis)
         return None
 
+    def _http_session(self):
+        session = getattr(self._http_local, "session", None)
+        if session is None:
+            import requests
+
+            session = requests.Session()
+            self._http_local.session = session
+            with self._http_lock:
+                self._http_sessions.append(session)
+        return session
+
+    def _close_http_sessions(self):
+        with self._http_lock:
+            sessions, self._http_sessions = self._http_sessions, []
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+
     def _call_api_crop(self, url, image_pil, mask_pil, crop_padding):
         import base64
         from io import BytesIO
 
-        import requests
         from PIL import Image
 
         payload_crop = self._crop_from_mask(image_pil, mask_pil, crop_padding=crop_padding)
@@ -1891,7 +2283,7 @@ class InpaintThread(QThread):
             "sd_sampler": "UniPC",
         }
 
-        resp = requests.post(str(url), json=payload, timeout=self.timeout_sec)
+        resp = self._http_session().post(str(url), json=payload, timeout=self.timeout_sec)
         if resp.status_code != 200:
             raise RuntimeError(
                 _t_global(
@@ -1986,7 +2378,7 @@ class InpaintThread(QThread):
         for requested_mode, sortable in buckets.items():
             if not sortable:
                 continue
-            sortable.sort(key=lambda t: (t[0], t[1]))
+            _sort_by_yx(sortable)
             boxes = [t[2] for t in sortable]
             if requested_mode in (self.MODE_FILL, self.MODE_REMOTE, self.MODE_AUTO):
                 # Decide per OCR box. Smart mode also needs per-box analysis so the background
@@ -2244,7 +2636,11 @@ class InpaintThread(QThread):
                 except Exception:
                     pass
 
-                img = Image.open(in_path).convert("RGB")
+                # 已是 RGB 时 convert 也会整页拷贝一次：只在模式不同时转换
+                img = Image.open(in_path)
+                img.load()
+                if img.mode != "RGB":
+                    img = img.convert("RGB")
                 roi = self._normalize_roi((self.roi_by_image or {}).get(src), img.size)
                 tasks = self._build_tasks(src, img, boxes_raw, roi)
                 if not tasks:
@@ -2273,7 +2669,8 @@ class InpaintThread(QThread):
                     canceled = True
                     break
 
-                final = img.copy()
+                # 所有裁剪块都已取出，原图之后不再使用：直接在其上合成，省掉一次整页拷贝
+                final = img
                 for _, crop_res in sorted((local_results or []) + (remote_results or []), key=lambda t: t[0]):
                     self._apply_crop_result(final, crop_res)
 
@@ -2285,6 +2682,7 @@ class InpaintThread(QThread):
                 self.error.emit(str(e))
                 break
 
+        self._close_http_sessions()
         self.all_done.emit(bool(canceled))
 
 class RibbonGroup(QFrame):
@@ -2351,6 +2749,49 @@ class RibbonSmallBtn(QToolButton):
         self.setFixedWidth(70)
         self.setStyleSheet("font-size: 11px; text-align: left; padding-left: 5px;")
 
+class ThumbItemDelegate(QStyledItemDelegate):
+    """左侧缩略图：直接绘制序号+缩略图，不再为每页创建 QWidget。
+
+    QListView 只会绘制可见行，缩略图也在首次绘制时才加载，页数很多时布局/内存开销不随页数增长。
+    """
+    ITEM_SIZE = QSize(200, 140)
+
+    def __init__(self, parent_win, parent=None):
+        super().__init__(parent)
+        self.parent_win = parent_win
+
+    def sizeHint(self, option, index):
+        return QSize(self.ITEM_SIZE)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        try:
+            widget = option.widget
+            style = widget.style() if widget is not None else QApplication.style()
+            style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, widget)
+
+            r = option.rect.adjusted(15, 5, -15, -5)
+            font = QFont(painter.font())
+            font.setPixelSize(10)
+            painter.setFont(font)
+            label_h = int(QFontMetricsF(font).height()) + 2
+            painter.setPen(QColor("#555"))
+            painter.drawText(QRect(r.left(), r.top(), r.width(), label_h), Qt.AlignLeft | Qt.AlignVCenter, str(index.row() + 1))
+
+            pix = self.parent_win._thumb_pixmap(index.row())
+            if pix is not None and not pix.isNull():
+                x = r.left() + (r.width() - pix.width()) // 2
+                y = r.top() + label_h + max(0, (r.height() - label_h - pix.height()) // 2)
+                painter.fillRect(QRect(x, y, pix.width(), pix.height()), Qt.white)
+                painter.drawPixmap(x, y, pix)
+                painter.setPen(QPen(QColor("#BBB"), 1))
+                painter.setBrush(Qt.NoBrush)
+                painter.drawRect(QRect(x - 1, y - 1, pix.width() + 1, pix.height() + 1))
+        except Exception as e:
+            logger.debug(f"绘制缩略图失败: {e}")
+        finally:
+            painter.restore()
+
 # ==================== 画布与主逻辑 ====================
 
 class ShortcutsDialog(QDialog):
@@ -2452,28 +2893,23 @@ class CustomGraphicsView(QGraphicsView):
             pass
 
     def _evt_pos(self, event):
-        """Best-effort event position as QPoint (Qt6 vs bindings differences)."""
-        # Prefer Qt6 API: QSinglePointEvent.position() -> QPointF
+        """Event position as QPoint (Qt6 position(); falls back to Qt5-style pos())."""
         try:
-            v = getattr(event, "position", None)
-            if v is not None:
-                p = v() if callable(v) else v
-                try:
-                    return p.toPoint()  # QPointF -> QPoint
-                except Exception:
-                    return p
+            return event.position().toPoint()
+        except AttributeError:
+            pass
         except Exception as e:
             logger.debug(f"获取事件位置(position)失败: {e}")
-        # Fallback: Qt5-style pos()
         try:
-            v = getattr(event, "pos", None)
-            if v is not None:
-                p = v() if callable(v) else v
-                return p
+            return event.pos()
         except Exception as e:
             logger.debug(f"获取事件位置(pos)失败: {e}")
         return QPoint(0, 0)
 
+    def event_scene_pos(self, event):
+        """鼠标事件在场景（图片像素）坐标系中的位置。"""
+        return self.mapToScene(self._evt_pos(event))
+
     def mousePressEvent(self, event):
         # Middle-mouse drag to pan
         try:
@@ -2481,6 +2917,7 @@ class CustomGraphicsView(QGraphicsView):
                 self._panning = True
                 self._pan_last = self._evt_pos(event)
                 self.setCursor(Qt.ClosedHandCursor)
+                self.parent_win.set_interactive_preview(True)
                 event.accept()
                 return
         except Exception as e:
@@ -2488,7 +2925,7 @@ class CustomGraphicsView(QGraphicsView):
 
         # ROI selection mode: drag a rectangle to set OCR/inpaint region
         try:
-            if getattr(self.parent_win, "roi_select_mode", False) and event.button() == Qt.LeftButton:
+            if self.parent_win.roi_select_mode and event.button() == Qt.LeftButton:
                 self.parent_win.canvas_roi_press(event)
                 event.accept()
                 return
@@ -2520,7 +2957,7 @@ class CustomGraphicsView(QGraphicsView):
                 event.accept()
                 return
             try:
-                if getattr(self.parent_win, "roi_select_mode", False):
+                if self.parent_win.roi_select_mode:
                     self.parent_win.canvas_roi_move(event)
                     event.accept()
                     return
@@ -2544,6 +2981,7 @@ class CustomGraphicsView(QGraphicsView):
             if event.button() == Qt.MiddleButton and self._panning:
                 self._panning = False
                 self._pan_last = None
+                self.parent_win.set_interactive_preview(False)
                 # Restore cursor depending on current tool mode.
                 self.setCursor(Qt.CrossCursor if getattr(self.parent_win, "eyedropper_mode", False) else Qt.ArrowCursor)
                 event.accept()
@@ -2551,7 +2989,7 @@ class CustomGraphicsView(QGraphicsView):
         except Exception as e:
             logger.debug(f"处理中键释放事件失败: {e}")
         try:
-            if getattr(self.parent_win, "roi_select_mode", False) and event.button() == Qt.LeftButton:
+            if self.parent_win.roi_select_mode and event.button() == Qt.LeftButton:
                 self.parent_win.canvas_roi_release(event)
                 event.accept()
                 return
@@ -2587,6 +3025,12 @@ class CustomGraphicsView(QGraphicsView):
         super().wheelEvent(event)
 
 class CanvasTextBox(QGraphicsItemGroup):
+    # 选中态的虚线框与四角手柄样式：所有文本框共用，paint() 中不再每次构造
+    _SELECTED_PEN = QPen(QColor("#666"), 1, Qt.DashLine)
+    _HANDLE_PEN = QPen(QColor(Qt.black))
+    _HANDLE_BRUSH = QBrush(Qt.white)
+    _HANDLE_RADIUS = 3
+
     def __init__(self, rect, text, index, parent_win):
         super().__init__()
         self.parent_win = parent_win
@@ -2607,6 +3051,7 @@ class CanvasTextBox(QGraphicsItemGroup):
         self._press_pos_item = None
         self._start_pos = None
         self._start_rect = None
+        self._restyle_pending = False
 
         # 每个文本框自己的背景颜色（None表示使用全局颜色）
         self.custom_bg_color = None
@@ -2663,6 +3108,39 @@ class CanvasTextBox(QGraphicsItemGroup):
         self._sync_model_geometry()
         self._sync_model_bg()
 
+    def rebind_model(self, model, index):
+        """原地换绑 model：只更新位置/尺寸/文字/样式，复用已有图元（撤销/重做时避免整页重建）。"""
+        self.model = model
+        self.model_index = index
+        self.use_custom_bg = bool(model.get("use_custom_bg", False))
+        self.custom_bg_color = None
+        bg = model.get("bg_color")
+        if isinstance(bg, (tuple, list)) and len(bg) == 3:
+            try:
+                self.custom_bg_color = QColor(int(bg[0]), int(bg[1]), int(bg[2]))
+            except Exception:
+                self.custom_bg_color = None
+        try:
+            self.bg_alpha = int(model.get("bg_alpha", 120))
+        except Exception:
+            self.bg_alpha = DEFAULT_BG_ALPHA
+
+        rect = model.get("rect")
+        if isinstance(rect, (tuple, list)) and len(rect) == 4:
+            x, y, w, h = rect
+        else:
+            logger.warning(f"无效的rect格式: {rect}")
+            x, y, w, h = 0, 0, 100, 50
+
+        self.box.setRect(0, 0, w, h)
+        self.txt.setTextWidth(w)
+        self.txt.setPlainText(str(model.get("text", "") or ""))
+        self.setPos(x, y)
+
+        self.apply_style_from_model()
+        self._sync_model_geometry()
+        self._sync_model_bg()
+
     def _hit_test_handle(self, pos):
         """返回点击位置命中的缩放手柄（tl/tr/bl/br）或 None"""
         r = self.box.rect()
@@ -2721,6 +3199,27 @@ class CanvasTextBox(QGraphicsItemGroup):
         except Exception:
             pass
 
+    def _schedule_restyle(self):
+        """缩放拖动中：约 16ms 内的多次样式刷新只执行一次。"""
+        if self._restyle_pending:
+            return
+        self._restyle_pending = True
+        QTimer.singleShot(16, self._flush_restyle)
+
+    def _flush_restyle(self):
+        if not self._restyle_pending:
+            return
+        self._restyle_pending = False
+        try:
+            # 如果字号是自动（None），缩放时跟随高度变化
+            if isinstance(self.model, dict) and self.model.get("font_size") is None:
+                self.apply_style_from_model()
+            else:
+                self.update_background()
+        except RuntimeError:
+            # 定时器触发前 item 已随场景重建被销毁
+            pass
+
     def itemChange(self, change, value):
         if change == QGraphicsItem.ItemPositionHasChanged:
             self._sync_model_geometry()
@@ -2748,10 +3247,7 @@ class CanvasTextBox(QGraphicsItemGroup):
             avail_h = max(1.0, float(box_h) - 2.0)
 
             sample_pt = 100.0
-            f = QFont(str(family))
-            f.setBold(bool(bold))
-            f.setPointSizeF(sample_pt)
-            fm = QFontMetricsF(f)
+            fm = _sample_font_metrics(str(family), bool(bold), sample_pt)
 
             # Multi-line: fit the widest line + total line spacing.
             lines = [ln for ln in t.splitlines()] or [t]
@@ -2780,15 +3276,12 @@ class CanvasTextBox(QGraphicsItemGroup):
 
         # Backward compatibility: older builds capped auto-fit at 200pt which makes big titles too small.
         # If the stored value looks like it hit that cap, re-fit with the higher limit.
-        if fs is not None and 200 <= fs <= 205:
-            try:
-                r = self.box.rect()
-                h_pt_est = float(r.height()) * 72.0 / 96.0
-                if h_pt_est > (float(fs) + 30.0):
-                    fs = None
-                    self.model["font_size"] = None
-            except Exception:
-                pass
+        try:
+            if font_size_hit_legacy_cap(fs, self.box.rect().height()):
+                fs = None
+                self.model["font_size"] = None
+        except Exception:
+            pass
         if fs is None:
             # Prefer the same font-fitting logic used by PPT export, so canvas preview matches PPT more closely.
             try:
@@ -2802,7 +3295,7 @@ class CanvasTextBox(QGraphicsItemGroup):
 
         # PPT uses points (pt) at 96 DPI mapping; for the canvas we set a pixel size derived from pt so it
         # scales with the scene and stays consistent across screens.
-        px = max(1, int(round(float(fs) * 96.0 / 72.0)))
+        px = max(1, int(round(float(fs) * PX_PER_PT)))
         font = QFont(str(family))
         font.setPixelSize(px)
         font.setBold(bool(self.model.get("bold", False)))
@@ -2853,18 +3346,12 @@ class CanvasTextBox(QGraphicsItemGroup):
                 color = QColor(self.custom_bg_color.red(), self.custom_bg_color.green(),
                              self.custom_bg_color.blue(), int(self.bg_alpha))
                 self.box.setBrush(QBrush(color))
-            elif hasattr(self.parent_win, 'use_text_bg') and self.parent_win.use_text_bg:
-                # 使用全局背景色
-                if hasattr(self.parent_win, 'text_bg_color'):
-                    src_color = self.parent_win.text_bg_color
-                    alpha = int(getattr(self.parent_win, "text_bg_alpha", 200))
-                    color = QColor(src_color.red(), src_color.green(), src_color.blue(), alpha)
-                    self.box.setBrush(QBrush(color))
-                else:
-                    # 默认白色
-                    alpha = int(getattr(self.parent_win, "text_bg_alpha", 200))
-                    color = QColor(255, 255, 255, alpha)
-                    self.box.setBrush(QBrush(color))
+            elif self.parent_win.use_text_bg:
+                # 使用全局背景色（use_text_bg/text_bg_color/text_bg_alpha 均在主窗口 __init__ 中初始化）
+                src_color = self.parent_win.text_bg_color
+                color = QColor(src_color.red(), src_color.green(), src_color.blue(),
+                               int(self.parent_win.text_bg_alpha))
+                self.box.setBrush(QBrush(color))
             else:
                 # 完全透明
                 self.box.setBrush(QBrush(QColor(255, 255, 255, 1)))
@@ -2880,13 +3367,15 @@ class CanvasTextBox(QGraphicsItemGroup):
 
     def paint(self, painter, option, widget):
         if self.isSelected():
-            painter.setPen(QPen(QColor("#666"), 1, Qt.DashLine))
-            painter.setBrush(Qt.NoBrush)
-            painter.drawRect(self.box.rect())
-            painter.setBrush(Qt.white); painter.setPen(Qt.black)
             r = self.box.rect()
-            for p in [r.topLeft(), r.topRight(), r.bottomLeft(), r.bottomRight()]:
-                painter.drawEllipse(p, 3, 3)
+            painter.setPen(self._SELECTED_PEN)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRect(r)
+            painter.setBrush(self._HANDLE_BRUSH)
+            painter.setPen(self._HANDLE_PEN)
+            rad = self._HANDLE_RADIUS
+            for p in (r.topLeft(), r.topRight(), r.bottomLeft(), r.bottomRight()):
+                painter.drawEllipse(p, rad, rad)
         else:
             painter.setPen(self._clean_outline_pen())
             painter.drawRect(self.box.rect())
@@ -2894,6 +3383,8 @@ class CanvasTextBox(QGraphicsItemGroup):
     def mousePressEvent(self, event):
         # 选中
         self.parent_win.on_item_clicked(self)
+        if event.button() == Qt.LeftButton:
+            self.parent_win.set_interactive_preview(True)
 
         # 缩放：只有选中状态下，点到角上的小圆点才进入缩放
         if self.isSelected():
@@ -2935,24 +3426,25 @@ class CanvasTextBox(QGraphicsItemGroup):
                 new_h = max(min_h, new_h + dy)
                 new_pos = self._start_pos + QPointF(dx, 0)
 
-            self.setPos(new_pos)
             self.box.setRect(0, 0, new_w, new_h)
             self.txt.setTextWidth(new_w)
-
-            # 如果字号是自动（None），缩放时跟随高度变化
-            if isinstance(self.model, dict) and self.model.get("font_size") is None:
-                self.apply_style_from_model()
+            # 先改尺寸再改位置：位置变化时 itemChange 会带着新尺寸写回 model，不必再同步一次
+            if new_pos != self.pos():
+                self.setPos(new_pos)
             else:
-                self.update_background()
+                self._sync_model_geometry()
 
-            self._sync_model_geometry()
+            # 样式刷新合并到每帧最多一次（鼠标事件频率远高于屏幕刷新率）
+            self._schedule_restyle()
             event.accept()
             return
 
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):
+        self.parent_win.set_interactive_preview(False)
         if self._resizing:
+            self._flush_restyle()
             self._resizing = False
             self._resize_handle = None
             self._press_pos_item = None
@@ -2976,6 +3468,9 @@ class CanvasTextBox(QGraphicsItemGroup):
         super().hoverMoveEvent(event)
 
 class PPTCloneApp(QMainWindow):
+    # 后台线程解码好的缩略图：(显示路径, mtime_ns, QImage)；QPixmap 只能在主线程创建
+    thumb_loaded = Signal(str, object, object)
+
     def __init__(self):
         super().__init__()
         # Set a safe default title first; final title is set after UI language is resolved.
@@ -2985,6 +3480,8 @@ class PPTCloneApp(QMainWindow):
 
         self.settings_path = os.path.join(os.path.dirname(__file__), "settings.json")
         self.settings = self.load_settings()
+        # 最近一次与 settings.json 一致的设置内容；没有变化时 save_settings 不再重写文件
+        self._settings_saved = copy.deepcopy(self.settings)
         # UI language (affects visible labels/buttons; stored in settings.json).
         self.ui_lang_setting = str(self.settings.get("ui_lang") or "auto").strip()
         self.ui_lang = self._resolve_ui_lang(self.ui_lang_setting)
@@ -3001,12 +3498,21 @@ class PPTCloneApp(QMainWindow):
         self._paste_nudge = 0
         self._format_brush_active = False
         self._format_brush_style = None
-        self.undo_stack = []
-        self.redo_stack = []
+        # deque(maxlen) 超出上限时自动丢弃最旧的一步（O(1)），不再 list.pop(0) 整体搬移
+        self.undo_stack = deque(maxlen=UNDO_HISTORY_MAX)
+        self.redo_stack = deque(maxlen=UNDO_HISTORY_MAX)
         # 预览生成的临时 PPT：path -> create_ts；定时清理“足够旧且未被占用”的文件
         self._temp_preview_ppts = {}
+        self._last_preview_ppt = None  # (内容签名, 预览 PPT 路径, 生成时的 (mtime_ns, size))：内容和文件都未变时复用
         self.scaled_images = {}  # 存储缩放后的图片路径
+        self._thumb_cache = OrderedDict()  # 显示路径 -> (mtime_ns, 缩略图 QPixmap)；仅可见行按需加载，LRU 封顶 THUMB_CACHE_SIZE
+        self._thumb_pending = set()  # 正在后台解码的 (显示路径, mtime_ns)
+        self.thumb_loaded.connect(self._on_thumb_loaded)
         self.temp_dir = None     # 临时目录（缩放图片）
+        # 缩放结果缓存：(原图路径, mtime_ns, 文件大小, 目标高度) -> 缩放图路径；重复识别时不再解码原图
+        self._scaled_image_cache = {}
+        self._scaled_cache_dir = None
+        self._io_pool = None     # 后台 I/O 线程池（见 _get_io_pool）
         # 运行期缓存目录（缩放图片/临时图层/PDF渲染/去字输出等）：默认放到项目目录，避免跑到 C 盘 Temp。
         # 注意：OCR 模型缓存（official_models）不是这里，它由 PADDLE_PDX_CACHE_HOME 控制，默认也在项目目录 model/ 下。
         self.run_cache_dir = None
@@ -3030,11 +3536,23 @@ class PPTCloneApp(QMainWindow):
         self._bg_white_item = None
         self._bg_pixmap_item = None
         self._current_pixmap = None
+        self._current_pixmap_key = None
+        self._scene_boxes = []  # 当前画布上的 CanvasTextBox（按添加顺序）；避免遍历 scene.items() 的全部子图元
+        self._slide_pixmap_cache = OrderedDict()  # 显示路径 -> (mtime_ns, 整页 QPixmap)；LRU，避免重建画布/来回切页时重复解码
+        self._page_bgr_cache = OrderedDict()  # 图片路径 -> (mtime_ns, 只读 BGR ndarray)；取色/坐标还原共用一次解码
+        self._interactive_preview = False  # 正在拖动/缩放/平移：底图用低成本缩放
+        self._bg_lod_cache = {}  # (原图 cacheKey, 缩小倍数) -> 预缩小的底图；缩放 < 50% 时使用
         # 拖动透明度滑块时，Qt 偶发出现“底图不重绘”。用一个短延迟的重建作为兜底（不会频繁重建）。
         self._scene_rebuild_timer = QTimer(self)
         self._scene_rebuild_timer.setSingleShot(True)
         self._scene_rebuild_timer.setInterval(SCENE_REBUILD_DELAY_MS)
         self._scene_rebuild_timer.timeout.connect(self._rebuild_scene_keep_view)
+        # UI 脏标记：同一轮事件里的多次刷新请求合并为一次（见 _invalidate_ui / _flush_dirty_ui）
+        self._dirty_ui = set()
+        self._dirty_ui_timer = QTimer(self)
+        self._dirty_ui_timer.setSingleShot(True)
+        self._dirty_ui_timer.setInterval(0)
+        self._dirty_ui_timer.timeout.connect(self._flush_dirty_ui)
 
         # OCR 引擎延迟初始化（首次识别才加载）
         self.ocr_engine = None
@@ -3240,11 +3758,24 @@ class PPTCloneApp(QMainWindow):
         return defaults
 
     def save_settings(self):
+        # 设置对话框点“确定”、重复点同一个语言按钮等场景下内容常常没变，跳过整文件重写
+        if self.settings == getattr(self, "_settings_saved", None):
+            return
+        # 先写临时文件再 os.replace 原子替换：写到一半被打断也不会留下损坏的 settings.json
+        tmp_path = self.settings_path + ".tmp"
         try:
-            with open(self.settings_path, "w", encoding="utf-8") as f:
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(self.settings, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.settings_path)
+            self._settings_saved = copy.deepcopy(self.settings)
         except Exception as e:
             logger.warning(f"保存设置失败: {e}")
+            try:
+                os.remove(tmp_path)
+            except Exception:
+                pass
 
     def _apply_ocr_env(self):
         # Work around a PaddlePaddle OneDNN + PIR limitation that can raise:
@@ -3590,50 +4121,148 @@ class PPTCloneApp(QMainWindow):
         self.box_data.setdefault(path, [])
 
         item = QListWidgetItem()
-        item.setSizeHint(QSize(200, 140))
+        item.setSizeHint(ThumbItemDelegate.ITEM_SIZE)
         self.list_thumb.addItem(item)
 
-        w = QWidget()
-        vl = QVBoxLayout(w)
-        vl.setContentsMargins(15, 5, 15, 5)
-        lb_idx = QLabel(str(len(self.images)))
-        lb_idx.setObjectName("ThumbIndex")
-        lb_idx.setStyleSheet("font-size: 10px; color: #555;")
-        pix = QPixmap(self._get_display_image_path(path)).scaled(180, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        lb_img = QLabel()
-        lb_img.setObjectName("ThumbImage")
-        lb_img.setPixmap(pix)
-        lb_img.setStyleSheet("border: 1px solid #BBB; background: white;")
-        vl.addWidget(lb_idx)
-        vl.addWidget(lb_img, 0, Qt.AlignCenter)
-        self.list_thumb.setItemWidget(item, w)
+    def _thumb_pixmap(self, row):
+        """返回第 row 页的缩略图；由 ThumbItemDelegate 在绘制可见行时调用，首次调用才解码图片。"""
+        if row < 0 or row >= len(self.images):
+            return None
+        p, stamp = self._display_path_stamp(self.images[row])
+        cached = self._thumb_cache.get(p)
+        if cached is not None and cached[0] == stamp:
+            self._thumb_cache.move_to_end(p)
+            return cached[1]
+        # 解码+缩放放到后台 I/O 线程，绘制不再卡住主线程（导入大量页面后滚动列表时尤其明显）；
+        # 解码完成前先画旧缩略图（文件被改写时）或留空
+        key = (p, stamp)
+        if key not in self._thumb_pending:
+            self._thumb_pending.add(key)
+
+            def job(path=p, st=stamp):
+                self.thumb_loaded.emit(path, st, self._load_thumb_image(path, 180, 100))
+
+            try:
+                self._get_io_pool().submit(job)
+            except Exception:
+                self._thumb_pending.discard(key)
+                pix = QPixmap.fromImage(self._load_thumb_image(p, 180, 100))
+                self._store_thumb(p, stamp, pix)
+                return pix
+        return cached[1] if cached is not None else None
+
+    def _store_thumb(self, path, stamp, pix):
+        self._thumb_cache[path] = (stamp, pix)
+        self._thumb_cache.move_to_end(path)
+        while len(self._thumb_cache) > THUMB_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False)
+
+    def _on_thumb_loaded(self, path, stamp, img):
+        self._thumb_pending.discard((path, stamp))
+        pix = QPixmap.fromImage(img) if isinstance(img, QImage) and not img.isNull() else QPixmap()
+        self._store_thumb(path, stamp, pix)
+        try:
+            self.list_thumb.viewport().update()
+        except Exception:
+            pass
+
+    def _load_slide_pixmap(self, path: str) -> QPixmap:
+        """读取整页底图（带 LRU 缓存）；文件被修改（mtime 变化）时重新解码。"""
+        try:
+            stamp = os.stat(path).st_mtime_ns
+        except Exception:
+            stamp = None
+        cached = self._slide_pixmap_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            self._slide_pixmap_cache.move_to_end(path)
+            return cached[1]
+        pix = QPixmap(path)
+        if pix.isNull():
+            self._slide_pixmap_cache.pop(path, None)
+            return pix
+        self._slide_pixmap_cache[path] = (stamp, pix)
+        while len(self._slide_pixmap_cache) > SLIDE_PIXMAP_CACHE_SIZE:
+            self._slide_pixmap_cache.popitem(last=False)
+        return pix
+
+    def _load_page_bgr(self, path: str):
+        """读取整页 BGR 数组（带 LRU 缓存，mtime 变化时重新解码）；返回只读数组，调用方需要修改时自行 copy()。"""
+        try:
+            stamp = os.stat(path).st_mtime_ns
+        except Exception:
+            stamp = None
+        cached = self._page_bgr_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            self._page_bgr_cache.move_to_end(path)
+            return cached[1]
+        img = _imread_any(path)
+        if img is None:
+            self._page_bgr_cache.pop(path, None)
+            return None
+        img.setflags(write=False)
+        self._page_bgr_cache[path] = (stamp, img)
+        while len(self._page_bgr_cache) > PAGE_BGR_CACHE_SIZE:
+            self._page_bgr_cache.popitem(last=False)
+        return img
+
+    @staticmethod
+    def _image_size(path: str):
+        """只读文件头取 (w, h)，不解码像素；失败返回 None。"""
+        size = QImageReader(path).size()
+        if size.isValid() and size.width() > 0 and size.height() > 0:
+            return size.width(), size.height()
+        return None
+
+    @staticmethod
+    def _load_thumb_image(path: str, max_w: int, max_h: int) -> QImage:
+        """解码时直接缩到缩略图尺寸（JPEG 等格式可在解码阶段降采样），避免先解出整张大图再缩放。
+
+        只用 QImageReader/QImage，可在后台线程调用。
+        """
+        try:
+            reader = QImageReader(path)
+            size = reader.size()
+            # 只有解码器原生支持降采样（如 JPEG）时才交给 reader；否则 Qt 会对整张图做平滑缩放，更慢。
+            if size.isValid() and size.width() > 0 and size.height() > 0 and reader.supportsOption(QImageIOHandler.ScaledSize):
+                target = size.scaled(max_w, max_h, Qt.KeepAspectRatio)
+                if target.width() < size.width():
+                    reader.setScaledSize(target)
+            img = reader.read()
+            if not img.isNull():
+                return PPTCloneApp._scale_thumb_image(img, max_w, max_h)
+        except Exception as e:
+            logger.debug(f"读取缩略图失败 {path}: {e}")
+        src = QImage(path)
+        return PPTCloneApp._scale_thumb_image(src, max_w, max_h) if not src.isNull() else QImage()
+
+    @staticmethod
+    def _scale_thumb_image(img: QImage, max_w: int, max_h: int) -> QImage:
+        """缩略图缩放：大倍率时先用最近邻降到目标 2 倍，再做一次平滑缩放。
+
+        小尺寸缩略图上与整图平滑缩放肉眼无差别，但平滑缩放的开销只剩目标尺寸级别。
+        """
+        if img.width() <= max_w and img.height() <= max_h:
+            return img
+        if img.width() > max_w * 4 or img.height() > max_h * 4:
+            img = img.scaled(max_w * 2, max_h * 2, Qt.KeepAspectRatio, Qt.FastTransformation)
+        return img.scaled(max_w, max_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
     def _rebuild_thumb_list(self, select_index=None):
         """重建左侧缩略图列表（用于删除/复制/移动页之后）"""
         if select_index is None:
             select_index = self.list_thumb.currentRow()
 
+        # 丢弃已不在列表中的缩略图缓存
+        alive = {self._get_display_image_path(p) for p in self.images}
+        self._thumb_cache = OrderedDict((k, v) for k, v in self._thumb_cache.items() if k in alive)
+        for k in [k for k in self._slide_pixmap_cache if k not in alive]:
+            self._slide_pixmap_cache.pop(k, None)
+        self._page_bgr_cache.clear()
+
         self.list_thumb.blockSignals(True)
         self.list_thumb.clear()
-        for idx, p in enumerate(self.images, start=1):
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(200, 140))
-            self.list_thumb.addItem(item)
-
-            w = QWidget()
-            vl = QVBoxLayout(w)
-            vl.setContentsMargins(15, 5, 15, 5)
-            lb_idx = QLabel(str(idx))
-            lb_idx.setObjectName("ThumbIndex")
-            lb_idx.setStyleSheet("font-size: 10px; color: #555;")
-            pix = QPixmap(self._get_display_image_path(p)).scaled(180, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            lb_img = QLabel()
-            lb_img.setObjectName("ThumbImage")
-            lb_img.setPixmap(pix)
-            lb_img.setStyleSheet("border: 1px solid #BBB; background: white;")
-            vl.addWidget(lb_idx)
-            vl.addWidget(lb_img, 0, Qt.AlignCenter)
-            self.list_thumb.setItemWidget(item, w)
+        # 一次 addItems 批量建行（内容和尺寸都由 ThumbItemDelegate 决定），不再逐页跨 Python/C++ 调 addItem
+        self.list_thumb.addItems([""] * len(self.images))
         self.list_thumb.blockSignals(False)
 
         if self.images:
@@ -3642,29 +4271,16 @@ class PPTCloneApp(QMainWindow):
         else:
             self.current_img = None
             self.scene.clear()
+            self._scene_boxes = []
         self.update_status()
 
     def _refresh_thumb_images(self):
-        """刷新左侧缩略图（用于原图/去字图预览切换等不改变页数的操作）。"""
+        """刷新左侧缩略图（用于原图/去字图预览切换等不改变页数的操作）。
+
+        缓存按显示路径+mtime 失效，原图/去字图来回切换时不会重复解码。
+        """
         try:
-            for idx, p in enumerate(self.images):
-                item = self.list_thumb.item(idx)
-                if item is None:
-                    continue
-                w = self.list_thumb.itemWidget(item)
-                if w is None:
-                    continue
-                lb_idx = w.findChild(QLabel, "ThumbIndex")
-                if lb_idx is not None:
-                    try:
-                        lb_idx.setText(str(idx + 1))
-                    except Exception:
-                        pass
-                lb_img = w.findChild(QLabel, "ThumbImage")
-                if lb_img is None:
-                    continue
-                pix = QPixmap(self._get_display_image_path(p)).scaled(180, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                lb_img.setPixmap(pix)
+            self.list_thumb.viewport().update()
         except Exception:
             pass
 
@@ -3679,6 +4295,24 @@ class PPTCloneApp(QMainWindow):
                 return v
         return p
 
+    def _display_path_stamp(self, image_path: str):
+        """同 _get_display_image_path，并一起返回该文件的 mtime_ns（读取失败为 None）。
+
+        缩略图每次重绘都会调用：去字变体的存在性检查和取 mtime 合并成一次 stat。
+        """
+        p = str(image_path or "")
+        if p and bool(getattr(self, "show_inpaint_preview", False)):
+            v = (getattr(self, "inpaint_variants", {}) or {}).get(p)
+            if v:
+                try:
+                    return v, os.stat(v).st_mtime_ns
+                except OSError:
+                    pass
+        try:
+            return p, os.stat(p).st_mtime_ns
+        except Exception:
+            return p, None
+
     def _get_export_image_path(self, image_path: str) -> str:
         """Return the image path used for PPT export (prefer inpainted variant when available)."""
         p = str(image_path or "")
@@ -3737,11 +4371,7 @@ class PPTCloneApp(QMainWindow):
 
         self.show_inpaint_preview = enabled
         self._sync_inpaint_preview_toggle()
-        self._refresh_thumb_images()
-        try:
-            self._rebuild_scene_keep_view()
-        except Exception:
-            pass
+        self._invalidate_ui("thumbs", "background")
 
     def toggle_inpaint_preview(self, *args):
         self.set_inpaint_preview(not bool(getattr(self, "show_inpaint_preview", False)))
@@ -3778,11 +4408,7 @@ class PPTCloneApp(QMainWindow):
             self.show_inpaint_preview = False
 
         self._sync_inpaint_preview_toggle()
-        self._refresh_thumb_images()
-        try:
-            self._rebuild_scene_keep_view()
-        except Exception:
-            pass
+        self._invalidate_ui("thumbs", "background")
 
     def _snapshot_state(self):
         try:
@@ -3792,13 +4418,38 @@ class PPTCloneApp(QMainWindow):
         return {
             "kind": "full",
             "images": list(self.images),
-            "box_data": copy.deepcopy(self.box_data),
+            "box_data": self._snapshot_box_data_shared(),
             "inpaint_variants": dict(getattr(self, "inpaint_variants", {}) or {}),
             "show_inpaint_preview": bool(getattr(self, "show_inpaint_preview", False)),
             "roi_by_image": copy.deepcopy(getattr(self, "roi_by_image", {}) or {}),
             "current_index": int(curr_idx) if curr_idx is not None else -1,
         }
 
+    def _snapshot_box_data_shared(self):
+        """整项目快照里的 box_data：与最近一次整项目快照相比没变的页直接共用那份拷贝，
+        只有变化的页才重新拷贝。增删/移动页这类操作每一步只占用变化部分的内存。
+
+        快照里的列表因此可能被多个快照共用，恢复时必须再拷贝一份（见 _restore_state），不能原地修改。
+        """
+        prev = None
+        for entry in reversed(self.undo_stack):
+            if entry.get("kind") == "full":
+                prev = entry.get("box_data") or {}
+                break
+        out = {}
+        for k, v in (self.box_data or {}).items():
+            old = prev.get(k) if prev is not None else None
+            if old is not None:
+                try:
+                    if old == v:
+                        out[k] = old
+                        continue
+                except Exception:
+                    # OCR 结果的 bbox 已在 ocr_engine 转成列表；仍有无法比较的值时按已变化处理
+                    pass
+            out[k] = copy_boxes(v)
+        return out
+
     def _snapshot_current_slide_state(self, image_path=None):
         image_path = image_path or self.current_img
         if not image_path:
@@ -3811,37 +4462,133 @@ class PPTCloneApp(QMainWindow):
         return {
             "kind": "slide",
             "image_path": image_path,
-            "boxes": copy.deepcopy((self.box_data or {}).get(image_path, []) or []),
+            "boxes": copy_boxes((self.box_data or {}).get(image_path, []) or []),
             "roi": roi_value,
             "current_index": int(curr_idx) if curr_idx is not None else -1,
         }
 
+    def _snapshot_box_state(self, image_path, index):
+        """单个文本框的快照：只改一个框的样式/颜色时，不必深拷贝整页。"""
+        boxes = (self.box_data or {}).get(image_path, []) or []
+        try:
+            curr_idx = self.images.index(image_path)
+        except Exception:
+            curr_idx = self.list_thumb.currentRow()
+        return {
+            "kind": "box",
+            "image_path": image_path,
+            "index": int(index),
+            "count": len(boxes),
+            "box": copy_box(boxes[index]),
+            "current_index": int(curr_idx) if curr_idx is not None else -1,
+        }
+
+    def _push_undo_snapshot(self, snap):
+        """快照入栈；与栈顶内容完全相同（上一步操作实际没改任何东西）时不重复入栈，避免出现“撤销了但什么都没变”的空步骤。"""
+        top = self.undo_stack[-1] if self.undo_stack else None
+        same = False
+        if top is not None and top.get("kind") == snap.get("kind"):
+            try:
+                same = bool(top == snap)
+            except Exception:
+                # OCR 结果的 bbox 已在 ocr_engine 转成列表，正常不会走到这里；仍有无法比较的值时按不同处理
+                same = False
+        if not same:
+            self.undo_stack.append(snap)
+        self.redo_stack.clear()
+
     def push_undo(self):
         """保存当前状态到撤销栈（用于 Ctrl+Z）"""
-        self.undo_stack.append(self._snapshot_state())
-        if len(self.undo_stack) > 50:
-            self.undo_stack.pop(0)
-        self.redo_stack.clear()
+        self._push_undo_snapshot(self._snapshot_state())
 
     def push_undo_current_slide(self, image_path=None):
         """仅保存当前页状态，避免频繁编辑时深拷贝整个项目。"""
-        self.undo_stack.append(self._snapshot_current_slide_state(image_path=image_path))
-        if len(self.undo_stack) > 50:
-            self.undo_stack.pop(0)
-        self.redo_stack.clear()
+        self._push_undo_snapshot(self._snapshot_current_slide_state(image_path=image_path))
+
+    def push_undo_selected_box(self):
+        """仅保存选中文本框的状态；找不到对应的 box_data 项时退回整页快照。"""
+        m = self._get_selected_model()
+        boxes = (self.box_data or {}).get(self.current_img, []) or []
+        try:
+            idx = int(getattr(self.selected_box, "model_index", -1))
+        except Exception:
+            idx = -1
+        if m is None or not (0 <= idx < len(boxes)) or boxes[idx] is not m:
+            self.push_undo_current_slide()
+            return
+        self._push_undo_snapshot(self._snapshot_box_state(self.current_img, idx))
 
     def _snapshot_for_history_entry(self, entry):
         kind = str((entry or {}).get("kind") or "full")
+        if kind == "box":
+            image_path = entry.get("image_path")
+            idx = int(entry.get("index", -1))
+            boxes = (self.box_data or {}).get(image_path, []) or []
+            if 0 <= idx < len(boxes):
+                return self._snapshot_box_state(image_path, idx)
+            return self._snapshot_current_slide_state(image_path)
         if kind == "slide":
             return self._snapshot_current_slide_state(entry.get("image_path"))
         return self._snapshot_state()
 
+    def _history_entry_applicable(self, snap) -> bool:
+        """单框快照只有在该页仍存在、文本框数量未变时才能恢复；其余类型总是可以恢复。"""
+        if str((snap or {}).get("kind") or "full") != "box":
+            return True
+        image_path = snap.get("image_path")
+        boxes = (self.box_data or {}).get(image_path)
+        idx = int(snap.get("index", -1))
+        if image_path not in self.images or not isinstance(boxes, list) or not (0 <= idx < len(boxes)):
+            return False
+        return len(boxes) == int(snap.get("count", len(boxes)))
+
+    def _pop_applicable_history(self, stack):
+        """从撤销/重做栈弹出下一个能恢复的快照；已无法对应当前内容的单框快照直接丢弃。"""
+        while stack:
+            snap = stack.pop()
+            if self._history_entry_applicable(snap):
+                return snap
+            logger.warning("跳过无法恢复的单个文本框快照: 页面已删除或文本框数量已变化")
+        return None
+
+    def _restore_box_state(self, snap):
+        """恢复单个文本框；当前页只换绑对应图元，其余框不动。"""
+        if not self._history_entry_applicable(snap):
+            return
+        image_path = snap.get("image_path")
+        boxes = self.box_data[image_path]
+        idx = int(snap.get("index", -1))
+        model = copy_box(snap.get("box"))
+        boxes[idx] = model
+        if self.current_img != image_path:
+            row = int(snap.get("current_index", -1))
+            if 0 <= row < len(self.images):
+                self.list_thumb.setCurrentRow(row)
+                self.switch_slide(row)
+            return
+        for it in self._canvas_boxes():
+            if int(getattr(it, "model_index", -1)) == idx:
+                try:
+                    normalize_box_text_color_fields(model)
+                except Exception:
+                    pass
+                it.rebind_model(model, idx)
+                if it is self.selected_box:
+                    self.refresh_right_panel_from_selected()
+                break
+        else:
+            self._rebuild_scene_keep_view()
+        self.view.viewport().update()
+
     def _restore_state(self, snap):
         kind = str((snap or {}).get("kind") or "full")
+        if kind == "box":
+            self._restore_box_state(snap)
+            return
         if kind == "slide":
             image_path = snap.get("image_path")
             if image_path in self.images:
-                self.box_data[image_path] = copy.deepcopy(snap.get("boxes", []) or [])
+                self.box_data[image_path] = copy_boxes(snap.get("boxes", []) or [])
                 roi_map = getattr(self, "roi_by_image", {}) or {}
                 roi_value = copy.deepcopy(snap.get("roi"))
                 if roi_value is None:
@@ -3850,17 +4597,22 @@ class PPTCloneApp(QMainWindow):
                     roi_map[image_path] = roi_value
                 self.roi_by_image = roi_map
                 idx = int(snap.get("current_index", -1))
-                if 0 <= idx < len(self.images):
-                    self.list_thumb.setCurrentRow(idx)
-                    self.switch_slide(idx)
-                elif self.current_img == image_path:
-                    try:
-                        self._rebuild_scene_keep_view()
-                    except Exception:
-                        self.switch_slide(self.list_thumb.currentRow())
+                # 仍停在同一页时先尝试原地更新已有图元；不满足条件或原地更新失败时再切页/整页重建
+                same_slide = self.current_img == image_path and idx == self.list_thumb.currentRow()
+                synced = same_slide and self._sync_scene_boxes_in_place(image_path)
+                if not synced:
+                    if 0 <= idx < len(self.images):
+                        self.list_thumb.setCurrentRow(idx)
+                        self.switch_slide(idx)
+                    elif self.current_img == image_path:
+                        try:
+                            self._rebuild_scene_keep_view()
+                        except Exception:
+                            self.switch_slide(self.list_thumb.currentRow())
             return
         self.images = list(snap.get("images", []))
-        self.box_data = snap.get("box_data", {}) or {}
+        # 快照之间共用未变化页的列表，恢复出来的必须是独立拷贝
+        self.box_data = {k: copy_boxes(v) for k, v in (snap.get("box_data", {}) or {}).items()}
         self.inpaint_variants = snap.get("inpaint_variants", {}) or {}
         self.show_inpaint_preview = bool(snap.get("show_inpaint_preview", False))
         self.roi_by_image = snap.get("roi_by_image", {}) or {}
@@ -3871,17 +4623,113 @@ class PPTCloneApp(QMainWindow):
         except Exception:
             pass
 
+    def _add_scene_box(self, item):
+        """把文本框加入画布并登记到 _scene_boxes。"""
+        self.scene.addItem(item)
+        self._scene_boxes.append(item)
+
+    def _canvas_boxes(self):
+        """当前画布上的文本框列表（过滤掉已被移出场景的项）。"""
+        boxes = [it for it in self._scene_boxes if it.scene() is self.scene]
+        if len(boxes) != len(self._scene_boxes):
+            self._scene_boxes = boxes
+        return list(boxes)
+
+    def _sync_scene_boxes_by_identity(self, image_path) -> bool:
+        """按 model 对象身份增量同步当前页图元：仍在 box_data 里的框只更新序号，
+        已移除的框删掉图元，新出现的框才新建图元；开销与变化的框数成正比，底图/视图不动。
+
+        返回 False 表示场景背景不在（例如刚 clear 过），需要整页重建。
+        """
+        if not image_path or image_path != self.current_img:
+            return False
+        try:
+            if self._bg_pixmap_item is None or self._bg_pixmap_item.scene() is not self.scene:
+                return False
+        except RuntimeError:
+            return False
+        boxes = self.box_data.get(image_path, []) or []
+        if not all(isinstance(b, dict) for b in boxes):
+            return False
+
+        alive = {id(b) for b in boxes}
+        by_model = {}
+        for it in self._canvas_boxes():
+            if id(it.model) in alive and id(it.model) not in by_model:
+                by_model[id(it.model)] = it
+                continue
+            if it is self.selected_box:
+                self.selected_box = None
+                if hasattr(self, "txt_edit"):
+                    self.txt_edit.blockSignals(True)
+                    self.txt_edit.clear()
+                    self.txt_edit.blockSignals(False)
+                self._reset_right_panel_state()
+            self.scene.removeItem(it)
+        self._canvas_boxes()
+
+        for i, b in enumerate(boxes):
+            it = by_model.get(id(b))
+            if it is not None:
+                it.model_index = i
+                continue
+            try:
+                normalize_box_text_color_fields(b)
+            except Exception:
+                pass
+            self._add_scene_box(CanvasTextBox(b, "", i, self))
+        self._draw_roi_overlay()
+        self.view.viewport().update()
+        return True
+
+    def _sync_scene_boxes_in_place(self, image_path) -> bool:
+        """当前页文本框数量/顺序未变时原地更新已有图元；返回 False 表示需要整页重建。"""
+        if not image_path or image_path != self.current_img:
+            return False
+        boxes = self.box_data.get(image_path, []) or []
+        if not all(isinstance(b, dict) for b in boxes):
+            return False
+        items = self._canvas_boxes()
+        if len(items) != len(boxes):
+            return False
+        try:
+            items.sort(key=lambda it: int(getattr(it, "model_index", -1)))
+            if [int(it.model_index) for it in items] != list(range(len(boxes))):
+                return False
+        except Exception:
+            return False
+
+        # 与 switch_slide 一致：恢复后不保留选中
+        self.selected_box = None
+        self.scene.clearSelection()
+        if hasattr(self, "txt_edit"):
+            self.txt_edit.blockSignals(True)
+            self.txt_edit.clear()
+            self.txt_edit.blockSignals(False)
+        self._reset_right_panel_state()
+
+        for it, b in zip(items, boxes):
+            try:
+                normalize_box_text_color_fields(b)
+            except Exception:
+                pass
+            it.rebind_model(b, it.model_index)
+        self._draw_roi_overlay()
+        self.view.viewport().update()
+        return True
+
     def undo(self, *args):
-        if not self.undo_stack:
+        # 先确认快照能恢复再动另一个栈，避免一次撤销什么都没做却多出一条重做记录
+        snap = self._pop_applicable_history(self.undo_stack)
+        if snap is None:
             return
-        snap = self.undo_stack.pop()
         self.redo_stack.append(self._snapshot_for_history_entry(snap))
         self._restore_state(snap)
 
     def redo(self, *args):
-        if not self.redo_stack:
+        snap = self._pop_applicable_history(self.redo_stack)
+        if snap is None:
             return
-        snap = self.redo_stack.pop()
         self.undo_stack.append(self._snapshot_for_history_entry(snap))
         self._restore_state(snap)
 
@@ -4514,6 +5362,9 @@ class PPTCloneApp(QMainWindow):
         self.list_thumb.setMinimumWidth(230)
         self.list_thumb.setMaximumWidth(230)
         self.list_thumb.setStyleSheet("background: #F3F3F3; border: none; border-right: 1px solid #DDD;")
+        # 缩略图由 delegate 绘制；固定行高让 QListView 不必逐项测量
+        self.list_thumb.setUniformItemSizes(True)
+        self.list_thumb.setItemDelegate(ThumbItemDelegate(self, self.list_thumb))
         self.list_thumb.currentRowChanged.connect(self.switch_slide)
         splitter.addWidget(self.list_thumb)
         
@@ -4666,7 +5517,7 @@ class PPTCloneApp(QMainWindow):
         self.slider_font.setRange(FONT_SIZE_MIN, FONT_SIZE_MAX)
         self.slider_font.setValue(12)
         self.slider_font.valueChanged.connect(self.on_font_size_changed)
-        self.slider_font.sliderPressed.connect(self.push_undo)
+        self.slider_font.sliderPressed.connect(self.push_undo_selected_box)
         l.addWidget(self.slider_font)
         l.addSpacing(10)
 
@@ -4810,7 +5661,7 @@ class PPTCloneApp(QMainWindow):
         if not images:
             return
 
-        # Drop previous scaling outputs to avoid temp-dir accumulation across multiple OCR runs.
+        # Drop previous per-run temp outputs (ROI crops) to avoid temp-dir accumulation across multiple OCR runs.
         try:
             if getattr(self, "temp_dir", None) and os.path.exists(self.temp_dir):
                 shutil.rmtree(self.temp_dir, ignore_errors=True)
@@ -4828,43 +5679,59 @@ class PPTCloneApp(QMainWindow):
             self.temp_dir = tempfile.mkdtemp(prefix="ocr_scaled_")
         self.scaled_images = {}
 
+        # 缩放结果放在独立目录（本次运行内复用），不随 temp_dir 轮换删除。
+        if not self._scaled_cache_dir:
+            base_dir = getattr(self, "run_cache_dir", None) or tempfile.gettempdir()
+            self._scaled_cache_dir = os.path.join(str(base_dir), "ocr_scaled_cache")
+        try:
+            os.makedirs(self._scaled_cache_dir, exist_ok=True)
+        except Exception:
+            self._scaled_cache_dir = self.temp_dir
+
+        target_h = TARGET_IMAGE_HEIGHT
+        pending = {}
         for original_path in images:
             try:
-                img = _imread_any(original_path)
-                if img is None:
-                    continue
+                st = os.stat(original_path)
+                cache_key = (original_path, st.st_mtime_ns, st.st_size, target_h)
+            except Exception:
+                cache_key = None
 
-                h, w = img.shape[:2]
-                target_h = TARGET_IMAGE_HEIGHT
+            # 已缩放过且缓存文件仍在：直接复用，不再 imread 原图
+            cached = self._scaled_image_cache.get(cache_key) if cache_key else None
+            if cached and (cached == original_path or os.path.exists(cached)):
+                self.scaled_images[original_path] = cached
+                continue
 
-                # 防止除零：高度为0的图片跳过
-                if h <= 0 or w <= 0:
-                    self.scaled_images[original_path] = original_path
-                    continue
+            # 解码/缩放/PNG 编码交给后台线程（cv2 会释放 GIL），主线程继续处理事件
+            fut = self._get_io_pool().submit(_scale_image_for_ocr, original_path, self._scaled_cache_dir, target_h)
+            pending[fut] = (original_path, cache_key)
 
-                # 如果图片高度已经接近1080p，不需要缩放
-                if abs(h - target_h) < 100:
+        while pending:
+            done, _ = concurrent.futures.wait(list(pending), timeout=0.05)
+            if not done:
+                # 只处理重绘等非用户输入事件，避免缩放途中再次触发识别
+                QApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
+                continue
+            for fut in done:
+                original_path, cache_key = pending.pop(fut)
+                try:
+                    out_path = fut.result()
+                except Exception as e:
+                    logger.warning(f"缩放图片失败 {original_path}: {e}")
                     self.scaled_images[original_path] = original_path
                     continue
+                if out_path is None:
+                    continue
+                self.scaled_images[original_path] = out_path
+                if cache_key:
+                    self._scaled_image_cache[cache_key] = out_path
 
-                # 计算缩放比例
-                scale = target_h / max(1, h)
-                new_w = int(w * scale)
-                new_h = target_h
-
-                # 缩放图片
-                scaled_img = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_AREA)
-
-                # 保存到临时目录
-                scaled_path = build_asset_path(self.temp_dir, "scaled", original_path, ext=".png")
-                if not _imwrite_any(scaled_path, scaled_img):
-                    raise RuntimeError("无法写入缩放后的临时图片")
-
-                self.scaled_images[original_path] = scaled_path
-
-            except Exception as e:
-                logger.warning(f"缩放图片失败 {original_path}: {e}")
-                self.scaled_images[original_path] = original_path
+    def _get_io_pool(self):
+        """后台 I/O 线程池（图片解码/编码等），延迟创建，退出时关闭。"""
+        if self._io_pool is None:
+            self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="io")
+        return self._io_pool
 
     def import_images(self):
         paths, _ = QFileDialog.getOpenFileNames(
@@ -4923,41 +5790,130 @@ class PPTCloneApp(QMainWindow):
         progress.setMinimumDuration(0)
         progress.setValue(0)
 
+        def _warn_render_failed(pdf_path, page_index, e):
+            QMessageBox.warning(
+                self,
+                self._t("提示", "Info"),
+                self._t(f"PDF渲染失败：{pdf_path}\n第 {page_index+1} 页\n{e}", f"PDF render failed: {pdf_path}\nPage {page_index+1}\n{e}"),
+            )
+
+        # 长 PDF：整页渲染+编码交给进程池（每个进程自己打开文档，MuPDF 渲染持有 GIL，线程无法并行）；
+        # 中等页数：只把 PNG 编码交给线程池（MuPDF 渲染本身非线程安全，仍在这里逐页做）。
+        # 结果都按页序收回再加入列表，页序与串行导入一致
+        render_pool = None
+        encode_pool = None
+        if total_pages >= PDF_IMPORT_PROCESS_MIN_PAGES and PDF_IMPORT_RENDER_PROCESSES > 1:
+            try:
+                import multiprocessing
+                render_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=PDF_IMPORT_RENDER_PROCESSES,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            except Exception as e:
+                logger.debug(f"PDF 渲染进程池不可用，改为线程池编码: {e}")
+                render_pool = None
+        if render_pool is None and total_pages >= 4:
+            encode_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=PDF_IMPORT_ENCODE_WORKERS, thread_name_prefix="pdf-encode"
+            )
+        doc_by_path = dict(docs)
+        window = 2 * (PDF_IMPORT_RENDER_PROCESSES if render_pool is not None else PDF_IMPORT_ENCODE_WORKERS)
+        pending = deque()
+
+        def _collect_encoded(block: bool):
+            while pending and (block or pending[0][0].done() or len(pending) >= window):
+                fut, pdf_path, page_index, retry = pending.popleft()
+                try:
+                    self._add_image_item(fut.result())
+                except Exception as e:
+                    if retry is not None and isinstance(e, concurrent.futures.process.BrokenProcessPool):
+                        # 渲染进程异常退出：这一页在本进程用已打开的文档重新渲染（文档随导入结束统一关闭）
+                        try:
+                            self._add_image_item(_render_pdf_page(doc_by_path[pdf_path], *retry[1:]))
+                            continue
+                        except Exception as e2:
+                            e = e2
+                    _warn_render_failed(pdf_path, page_index, e)
+
         imported = 0
         canceled = False
         try:
             import time
             stamp = int(time.time())
-            # Render scale: 2x (approx 144 DPI on a 72 DPI base), good balance for OCR.
-            zoom = 2.0
+            # Render scale: 144 DPI by default (2x on a 72 DPI base), good balance for OCR.
+            try:
+                dpi = float(self.settings.get("pdf_import_dpi", PDF_IMPORT_DPI_DEFAULT) or PDF_IMPORT_DPI_DEFAULT)
+            except Exception:
+                dpi = float(PDF_IMPORT_DPI_DEFAULT)
+            zoom = max(72.0, min(600.0, dpi)) / 72.0
+            mat = fitz.Matrix(zoom, zoom)
+            # 渲染页的存盘格式：默认无损 PNG；"jpg" 体积小得多，但文字边缘会有压缩痕迹
+            page_ext = ".jpg" if str(self.settings.get("pdf_import_format", "png") or "png").strip().lower() in ("jpg", "jpeg") else ".png"
+            last_progress_ui = 0.0
             for pdf_path, doc in docs:
                 for page_index in range(int(doc.page_count or 0)):
                     if progress.wasCanceled():
                         canceled = True
                         break
-                    try:
-                        page = doc.load_page(page_index)
-                        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
-                        out_path = build_asset_path(
-                            self.slide_assets_dir,
-                            "pdf",
+                    if render_pool is not None:
+                        args = (
                             pdf_path,
-                            suffix=f"{stamp}_p{page_index+1:04d}",
-                            ext=".png",
-                        )
-                        pix.save(out_path)
-                        self._add_image_item(out_path)
-                    except Exception as e:
-                        QMessageBox.warning(
-                            self,
-                            self._t("提示", "Info"),
-                            self._t(f"PDF渲染失败：{pdf_path}\n第 {page_index+1} 页\n{e}", f"PDF render failed: {pdf_path}\nPage {page_index+1}\n{e}"),
+                            page_index,
+                            zoom,
+                            build_asset_path(self.slide_assets_dir, "pdf", pdf_path, suffix=f"{stamp}_p{page_index+1:04d}", ext=page_ext),
+                            build_asset_path(self.slide_assets_dir, "pdf", pdf_path, suffix=f"{stamp}_p{page_index+1:04d}", ext=".jpg"),
                         )
+                        try:
+                            fut = render_pool.submit(_render_pdf_page_file, *args)
+                        except Exception as e:
+                            fut = concurrent.futures.Future()
+                            fut.set_exception(e)
+                        pending.append((fut, pdf_path, page_index, args))
+                    else:
+                        try:
+                            page = doc.load_page(page_index)
+                            raw_jpeg = _pdf_page_original_jpeg(doc, page)
+                            out_path = build_asset_path(
+                                self.slide_assets_dir,
+                                "pdf",
+                                pdf_path,
+                                suffix=f"{stamp}_p{page_index+1:04d}",
+                                ext=".jpg" if raw_jpeg else page_ext,
+                            )
+                            if raw_jpeg:
+                                # 扫描页：原始 JPEG 原样落盘，不渲染也不重新编码
+                                job = (_write_file_bytes, out_path, raw_jpeg)
+                            else:
+                                pix = page.get_pixmap(matrix=mat, colorspace=fitz.csRGB, alpha=False)
+                                job = (
+                                    _encode_pdf_page_image,
+                                    pix.samples, int(pix.width), int(pix.height), int(pix.stride), int(pix.n), out_path,
+                                )
+                            if encode_pool is not None:
+                                pending.append((encode_pool.submit(*job), pdf_path, page_index, None))
+                            elif raw_jpeg or page_ext != ".png":
+                                self._add_image_item(job[0](*job[1:]))
+                            else:
+                                pix.save(out_path)
+                                self._add_image_item(out_path)
+                        except Exception as e:
+                            _warn_render_failed(pdf_path, page_index, e)
+                    _collect_encoded(block=False)
                     imported += 1
-                    progress.setValue(imported)
+                    # 模态进度框的 setValue 会同步处理事件并重绘；页面渲染很快时限制到 ~20 次/秒
+                    now = time.monotonic()
+                    if now - last_progress_ui >= PROGRESS_UI_INTERVAL_SEC or imported >= total_pages:
+                        last_progress_ui = now
+                        progress.setValue(imported)
                 if canceled:
                     break
+            # 取消时已渲染的页也照常收回
+            _collect_encoded(block=True)
         finally:
+            if encode_pool is not None:
+                encode_pool.shutdown(wait=True)
+            if render_pool is not None:
+                render_pool.shutdown(wait=True, cancel_futures=True)
             try:
                 progress.close()
             except Exception:
@@ -4998,11 +5954,7 @@ class PPTCloneApp(QMainWindow):
         # Auto switch to inpaint preview so user sees the result; can toggle back for compare.
         self.show_inpaint_preview = True
         self._sync_inpaint_preview_toggle()
-        self._refresh_thumb_images()
-        try:
-            self._rebuild_scene_keep_view()
-        except Exception:
-            pass
+        self._invalidate_ui("thumbs", "background")
 
     def _clean_mode_meta(self, run_mode):
         run_mode = InpaintThread._normalize_run_mode(run_mode)
@@ -5263,7 +6215,6 @@ class PPTCloneApp(QMainWindow):
             images_to_run,
             self.scaled_images,
             roi_by_image=getattr(self, "roi_by_image", {}) or {},
-            roi_temp_dir=getattr(self, "temp_dir", None),
         )
         progress.canceled.connect(self.ocr_thread.requestInterruption)
         # 显式使用 QueuedConnection 确保跨线程信号在主线程中处理
@@ -5298,7 +6249,7 @@ class PPTCloneApp(QMainWindow):
             # 默认用 1920x1080；若已有当前页则复用当前尺寸
             w, h = 1920, 1080
             if self.current_img and os.path.exists(self.current_img):
-                pix = QPixmap(self.current_img)
+                pix = self._current_slide_pixmap()
                 if not pix.isNull():
                     w, h = max(1, pix.width()), max(1, pix.height())
 
@@ -5365,13 +6316,17 @@ class PPTCloneApp(QMainWindow):
             ext=ext or ".png",
         )
         try:
-            shutil.copyfile(src, dst)
+            # 页面图片只读不改：同一文件系统上用硬链接，不复制任何数据；跨盘/不支持时再整文件复制
+            try:
+                os.link(src, dst)
+            except OSError:
+                shutil.copyfile(src, dst)
         except Exception as e:
             QMessageBox.critical(self, self._t("错误", "Error"), self._t(f"复制页面图片失败: {e}", f"Failed to duplicate slide image: {e}"))
             return
 
         # 深拷贝文本框数据
-        boxes = copy.deepcopy(self.box_data.get(src, []))
+        boxes = copy_boxes(self.box_data.get(src, []))
         self.images.insert(idx + 1, dst)
         self.box_data[dst] = boxes
         self._rebuild_thumb_list(select_index=idx + 1)
@@ -5400,7 +6355,7 @@ class PPTCloneApp(QMainWindow):
             if not self.current_img:
                 return
 
-        pix = QPixmap(self.current_img)
+        pix = self._current_slide_pixmap()
         if pix.isNull():
             return
 
@@ -5430,14 +6385,14 @@ class PPTCloneApp(QMainWindow):
         self.box_data.setdefault(self.current_img, []).append(model)
 
         item = CanvasTextBox(model, "", len(self.box_data[self.current_img]) - 1, self)
-        self.scene.addItem(item)
+        self._add_scene_box(item)
         self.on_item_clicked(item)
         self.view.viewport().update()
 
     def copy_selected_box(self, *args):
         if not (self.selected_box and isinstance(self.selected_box, CanvasTextBox) and isinstance(self.selected_box.model, dict)):
             return
-        self._clipboard_box = copy.deepcopy(self.selected_box.model)
+        self._clipboard_box = copy_box(self.selected_box.model)
         self._paste_nudge = 0
 
     def cut_selected_box(self, *args):
@@ -5551,12 +6506,12 @@ class PPTCloneApp(QMainWindow):
             if not self.current_img:
                 return
 
-        pix = QPixmap(self.current_img)
+        pix = self._current_slide_pixmap()
         if pix.isNull():
             return
 
         self.push_undo_current_slide()
-        model = copy.deepcopy(self._clipboard_box)
+        model = copy_box(self._clipboard_box)
         rect = model.get("rect", [0, 0, 120, 50])
         if not (isinstance(rect, (list, tuple)) and len(rect) == 4):
             rect = [0, 0, 120, 50]
@@ -5577,9 +6532,9 @@ class PPTCloneApp(QMainWindow):
 
         self.box_data.setdefault(self.current_img, []).append(model)
         item = CanvasTextBox(model, "", len(self.box_data[self.current_img]) - 1, self)
-        self.scene.addItem(item)
+        # addItem / setSelected 已经让场景按新图元区域重绘，这里不再整块刷新视口
+        self._add_scene_box(item)
         self.on_item_clicked(item)
-        self.view.viewport().update()
 
     def activate_format_brush(self, *args):
         """格式刷：复制当前选中框的样式，下一次点击其他框时应用（一次性）"""
@@ -5602,37 +6557,30 @@ class PPTCloneApp(QMainWindow):
         scaled_path = self.scaled_images.get(image_path, image_path)
 
         if scaled_path != image_path:
-            # 读取原图和缩放图的尺寸
-            original_img = _imread_any(image_path)
-            scaled_img = _imread_any(scaled_path)
+            # 读取原图和缩放图的尺寸（缩放图只读文件头；原图数组下面取色还要用，走缓存）
+            original_img = self._load_page_bgr(image_path)
+            scaled_size = self._image_size(scaled_path)
 
-            if original_img is not None and scaled_img is not None:
+            if original_img is not None and scaled_size is not None:
                 orig_h, orig_w = original_img.shape[:2]
-                scaled_h, scaled_w = scaled_img.shape[:2]
+                scaled_w, scaled_h = scaled_size
 
                 # 计算缩放比例（防止除零）
                 scale_x = orig_w / max(1, scaled_w)
                 scale_y = orig_h / max(1, scaled_h)
 
-                # 还原坐标
-                for result in results:
-                    if 'rect' in result:
-                        rect = result['rect']
-                        # 确保rect是元组或列表
-                        if isinstance(rect, (tuple, list)) and len(rect) == 4:
-                            x, y, w, h = rect
-                            result['rect'] = [
-                                int(x * scale_x),
-                                int(y * scale_y),
-                                int(w * scale_x),
-                                int(h * scale_y)
-                            ]
+                # 还原坐标：把所有 rect 收集成 (N, 4) 数组一次缩放，避免逐框 Python 乘法
+                rect_idx, rect_rows = _collect_rect_rows(results)
+                if rect_rows:
+                    scaled = np.asarray(rect_rows, dtype=np.float64) * np.array([scale_x, scale_y, scale_x, scale_y])
+                    for i, rect in zip(rect_idx, scaled.astype(np.int64).tolist()):
+                        results[i]['rect'] = rect
 
         # 初始化每个文本框的可编辑字段（用于后续：移动/改字/自定义背景色/删除）
         # 读取原图用于提取文字颜色（用更稳的读取方式，兼容 Windows 非 ASCII 路径）
         original_img = None
         try:
-            original_img = _imread_any(image_path)
+            original_img = self._load_page_bgr(image_path)
         except Exception as e:
             logger.debug(f"读取原图用于颜色提取失败: {e}")
 
@@ -5670,28 +6618,11 @@ class PPTCloneApp(QMainWindow):
                 rx = ry = rw = rh = None
 
             if rx is not None:
-                def intersects(rect_xywh):
-                    if not (isinstance(rect_xywh, (list, tuple)) and len(rect_xywh) == 4):
-                        return False
-                    try:
-                        x, y, w, h = [int(v) for v in rect_xywh]
-                    except Exception:
-                        return False
-                    if w <= 0 or h <= 0 or rw <= 0 or rh <= 0:
-                        return False
-                    ax1, ay1, ax2, ay2 = x, y, x + w, y + h
-                    bx1, by1, bx2, by2 = rx, ry, rx + rw, ry + rh
-                    return (ax1 < bx2) and (ax2 > bx1) and (ay1 < by2) and (ay2 > by1)
-
                 existing = self.box_data.get(image_path, []) or []
                 if results:
-                    kept = []
-                    for b in existing:
-                        if not isinstance(b, dict):
-                            continue
-                        r0 = b.get("rect")
-                        if not intersects(r0):
-                            kept.append(b)
+                    boxes = [b for b in existing if isinstance(b, dict)]
+                    hit = _rects_intersect_roi([b.get("rect") for b in boxes], (rx, ry, rw, rh))
+                    kept = [b for b, h in zip(boxes, hit) if not h]
                     merged = kept + results
                 else:
                     # OCR 失败/无结果时不要把选区内旧框清空，避免误伤；用户可重试或手动删除。
@@ -5699,9 +6630,9 @@ class PPTCloneApp(QMainWindow):
 
         self.box_data[image_path] = merged
 
-        # 如果是当前显示的图片，刷新显示
-        if self.current_img == image_path:
-            self.switch_slide(self.list_thumb.currentRow())
+        # 如果是当前显示的图片，刷新显示：选区识别只替换了部分框，增量同步；背景缺失时再整页重建（多次结果合并为一次）
+        if self.current_img == image_path and not self._sync_scene_boxes_by_identity(image_path):
+            self._invalidate_ui("slide")
 
     def switch_slide(self, row):
         if row < 0 or row >= len(self.images): return
@@ -5714,19 +6645,21 @@ class PPTCloneApp(QMainWindow):
         # 右侧面板状态重置（避免切换页后仍显示上一个框的自定义设置）
         self._reset_right_panel_state()
         self.scene.clear()
+        self._scene_boxes = []
         try:
             self._refresh_auto_text_colors_for_image(self.current_img)
         except Exception:
             pass
-        pix = QPixmap(self._get_display_image_path(self.current_img))
+        pix = self._load_slide_pixmap(self._get_display_image_path(self.current_img))
         self._current_pixmap = pix
+        self._current_pixmap_key = self.current_img
         self._build_scene_background(pix)
         for i, b in enumerate(self.box_data.get(self.current_img, [])):
             try:
                 normalize_box_text_color_fields(b)
             except Exception:
                 pass
-            self.scene.addItem(CanvasTextBox(b, "", i, self))
+            self._add_scene_box(CanvasTextBox(b, "", i, self))
         self._draw_roi_overlay()
         self.scene.setSceneRect(-50, -50, pix.width()+100, pix.height()+100)
         self.fit_view_to_window(); self.update_status()
@@ -5757,7 +6690,7 @@ class PPTCloneApp(QMainWindow):
         candidates = [b for b in boxes if isinstance(b, dict) and should_auto_refresh_text_color(b)]
         if not candidates:
             return
-        original_img = _imread_any(image_path)
+        original_img = self._load_page_bgr(image_path)
         if original_img is None:
             return
         for box in candidates:
@@ -5829,6 +6762,10 @@ class PPTCloneApp(QMainWindow):
 
             pm = self.scene.addPixmap(pix)
             pm.setZValue(-10)
+            self._bg_pixmap_item = pm
+            self._apply_background_lod(pix)
+            # 静止时平滑缩放；拖动/缩放/平移期间切到最近邻（见 set_interactive_preview）
+            pm.setTransformationMode(Qt.FastTransformation if self._interactive_preview else Qt.SmoothTransformation)
             try:
                 pm.setCacheMode(QGraphicsItem.NoCache)
             except Exception:
@@ -5840,6 +6777,79 @@ class PPTCloneApp(QMainWindow):
         except Exception as e:
             logger.warning(f"重建背景层失败: {e}")
 
+    def _bg_lod_pixmap(self, pix: QPixmap):
+        """按当前视图缩放返回 (底图, 缩小倍数)：缩放不到 50% 时用预缩小的底图，
+        避免每次重绘都对整张原图做平滑缩放（显示像素只有原图的 1/4 甚至更少）。"""
+        try:
+            view_scale = float(self.view.transform().m11() or 1.0)
+        except Exception:
+            view_scale = 1.0
+        factor = 1
+        while factor < BG_LOD_MAX_FACTOR and view_scale * factor * 2 <= 1.0:
+            factor *= 2
+        if factor == 1:
+            return pix, 1
+        key = (pix.cacheKey(), factor)
+        lod = self._bg_lod_cache.get(key)
+        if lod is None:
+            lod = pix.scaled(
+                max(1, pix.width() // factor),
+                max(1, pix.height() // factor),
+                Qt.IgnoreAspectRatio,
+                Qt.SmoothTransformation,
+            )
+            # 只保留当前底图的各级缓存
+            self._bg_lod_cache = {k: v for k, v in self._bg_lod_cache.items() if k[0] == key[0]}
+            self._bg_lod_cache[key] = lod
+        return lod, factor
+
+    def _apply_background_lod(self, pix=None, force=False):
+        """根据视图缩放切换底图图元的 pixmap，并用变换放大回原图尺寸（场景坐标不变）。"""
+        pm = self._bg_pixmap_item
+        if pix is None:
+            pix = self._current_pixmap
+        if pm is None or pix is None or pix.isNull():
+            return
+        try:
+            lod, factor = self._bg_lod_pixmap(pix)
+            if force or pm.pixmap().cacheKey() != lod.cacheKey():
+                pm.setPixmap(lod)
+            if factor == 1:
+                pm.setTransform(QTransform())
+            else:
+                pm.setTransform(QTransform.fromScale(pix.width() / lod.width(), pix.height() / lod.height()))
+        except Exception as e:
+            logger.debug(f"切换底图分辨率失败: {e}")
+
+    def set_interactive_preview(self, active: bool):
+        """拖动/缩放/平移期间用最近邻绘制底图，松开后恢复平滑缩放（每帧全视口重绘时差别很明显）。"""
+        active = bool(active)
+        if active == self._interactive_preview:
+            return
+        self._interactive_preview = active
+        pm = self._bg_pixmap_item
+        if pm is None:
+            return
+        try:
+            pm.setTransformationMode(Qt.FastTransformation if active else Qt.SmoothTransformation)
+            if not active:
+                pm.update()
+        except Exception:
+            pass
+
+    def _current_slide_pixmap(self) -> QPixmap:
+        """返回当前页已解码的底图（switch_slide 时缓存），避免插入/粘贴/框选时重复解码整张图片。"""
+        if not self.current_img:
+            return QPixmap()
+        pix = getattr(self, "_current_pixmap", None)
+        if pix is not None and not pix.isNull() and self._current_pixmap_key == self.current_img:
+            return pix
+        pix = self._load_slide_pixmap(self._get_display_image_path(self.current_img))
+        if not pix.isNull():
+            self._current_pixmap = pix
+            self._current_pixmap_key = self.current_img
+        return pix
+
     def _ensure_scene_background(self):
         """确保背景图片层存在且有效；用于拖动透明度时修复 Qt 偶发的“底图不见”重绘问题。"""
         try:
@@ -5861,7 +6871,7 @@ class PPTCloneApp(QMainWindow):
 
             # 重新 setPixmap 会触发底层刷新；能修复“拖动后不重绘”的情况
             try:
-                pm.setPixmap(pix)
+                self._apply_background_lod(pix, force=True)
                 pm.update()
             except Exception:
                 self._build_scene_background(pix)
@@ -5955,10 +6965,12 @@ class PPTCloneApp(QMainWindow):
         val = self.zoom_slider.value() / 100.0
         self.view.resetTransform(); self.view.scale(val, val)
         self.lbl_zoom_val.setText(f"{self.zoom_slider.value()}%")
+        self._apply_background_lod()
     def _update_zoom_label(self):
         curr = int(self.view.transform().m11() * 100)
         self.zoom_slider.blockSignals(True); self.zoom_slider.setValue(curr); self.zoom_slider.blockSignals(False)
         self.lbl_zoom_val.setText(f"{curr}%")
+        self._apply_background_lod()
     def on_item_clicked(self, item):
         # 格式刷：先应用样式（一次性）
         if self._format_brush_active and self._format_brush_style and isinstance(item, CanvasTextBox):
@@ -5978,8 +6990,12 @@ class PPTCloneApp(QMainWindow):
                 self.view.setCursor(Qt.ArrowCursor)
 
         self.selected_box = item
-        for i in self.scene.items():
-            if isinstance(i, CanvasTextBox): i.setSelected(i==item)
+        # 只改动选中状态发生变化的项（旧选中 -> 取消，新选中 -> 选中），不遍历整个场景
+        for i in self.scene.selectedItems():
+            if i is not item:
+                i.setSelected(False)
+        if isinstance(item, CanvasTextBox) and not item.isSelected():
+            item.setSelected(True)
         self.txt_edit.blockSignals(True)
         for c in item.childItems():
             if isinstance(c, QGraphicsTextItem):
@@ -6095,7 +7111,10 @@ class PPTCloneApp(QMainWindow):
             initial = QColor(0, 0, 0)
         color = QColorDialog.getColor(initial, self, self._t("选择文字颜色", "Choose text color"))
         if color.isValid():
-            self.push_undo_current_slide()
+            new_tc = [color.red(), color.green(), color.blue()]
+            if list(tc or []) == new_tc and bool(m.get("text_color_manual", False)):
+                return
+            self.push_undo_selected_box()
             m["text_color"] = [color.red(), color.green(), color.blue()]
             m["text_color_auto"] = False
             m["text_color_manual"] = True
@@ -6106,7 +7125,9 @@ class PPTCloneApp(QMainWindow):
         m = self._get_selected_model()
         if not m:
             return
-        self.push_undo_current_slide()
+        if bool(m.get("bold", False)) == bool(state):
+            return
+        self.push_undo_selected_box()
         m["bold"] = bool(state)
         self._apply_selected_style()
 
@@ -6114,7 +7135,9 @@ class PPTCloneApp(QMainWindow):
         m = self._get_selected_model()
         if not m:
             return
-        self.push_undo_current_slide()
+        if str(m.get("align") or "left") == align:
+            return
+        self.push_undo_selected_box()
         m["align"] = align
         self._apply_selected_style()
 
@@ -6143,7 +7166,7 @@ class PPTCloneApp(QMainWindow):
         enabled = bool(state)
         if bool(m.get("clean_enabled", True)) == enabled:
             return
-        self.push_undo_current_slide()
+        self.push_undo_selected_box()
         m["clean_enabled"] = enabled
         if self.selected_box and isinstance(self.selected_box, CanvasTextBox):
             self.selected_box.refresh_clean_outline()
@@ -6155,7 +7178,7 @@ class PPTCloneApp(QMainWindow):
         mode = InpaintThread._normalize_box_clean_mode(self.cmb_clean_mode.currentData())
         if InpaintThread._normalize_box_clean_mode(m.get("clean_mode")) == mode:
             return
-        self.push_undo_current_slide()
+        self.push_undo_selected_box()
         m["clean_mode"] = mode
         if self.selected_box and isinstance(self.selected_box, CanvasTextBox):
             self.selected_box.refresh_clean_outline()
@@ -6170,23 +7193,28 @@ class PPTCloneApp(QMainWindow):
         src = self._get_selected_model()
         if not src:
             return
-        self.push_undo_current_slide()
         keys = [
             "use_custom_bg", "bg_color", "bg_alpha",
             "font_family", "font_size", "bold", "align", "text_color",
         ]
+        # 样式值只有标量和 [r,g,b] 列表：取一次源样式，逐框浅拷贝列表即可，不必每框每键 deepcopy
+        style = {k: src.get(k) for k in keys}
         boxes = self.box_data.get(self.current_img, [])
-        for b in boxes:
-            if not isinstance(b, dict):
-                continue
-            if b is src:
-                continue
-            for k in keys:
-                b[k] = copy.deepcopy(src.get(k))
+        # 只处理样式确实不同的框；全都一致时不入撤销栈、不重刷画布
+        targets = [
+            b for b in boxes
+            if isinstance(b, dict) and b is not src and any(b.get(k) != v for k, v in style.items())
+        ]
+        if not targets:
+            return
+        self.push_undo_current_slide()
+        for b in targets:
+            b.update({k: (list(v) if isinstance(v, list) else v) for k, v in style.items()})
+        changed = {id(b) for b in targets}
 
-        # 画布上同步刷新
-        for it in self.scene.items():
-            if isinstance(it, CanvasTextBox) and isinstance(it.model, dict):
+        # 画布上同步刷新（只刷样式有变化的框）
+        for it in self._canvas_boxes():
+            if isinstance(it.model, dict) and id(it.model) in changed:
                 it.apply_style_from_model()
         self.view.viewport().update()
     def sync_text_change(self):
@@ -6228,7 +7256,17 @@ class PPTCloneApp(QMainWindow):
 
         # 从场景中删除
         self.scene.removeItem(self.selected_box)
+        try:
+            self._scene_boxes.remove(self.selected_box)
+        except ValueError:
+            pass
         self.selected_box = None
+        # 后面框的 model_index 随删除前移：只重设序号，不重建图元
+        pos = {id(b): i for i, b in enumerate(self.box_data.get(self.current_img, []) or [])}
+        for it in self._canvas_boxes():
+            i = pos.get(id(it.model))
+            if i is not None:
+                it.model_index = i
         try:
             self.view.viewport().update()
         except Exception:
@@ -6250,7 +7288,9 @@ class PPTCloneApp(QMainWindow):
         self.btn_pick_custom_color.setEnabled(has_sel)
 
         if self.selected_box and isinstance(self.selected_box, CanvasTextBox):
-            self.push_undo_current_slide()
+            if bool(self.selected_box.use_custom_bg) == enabled:
+                return
+            self.push_undo_selected_box()
             self.selected_box.use_custom_bg = enabled
             self.selected_box._sync_model_bg()
             self.selected_box.update_background()
@@ -6268,7 +7308,7 @@ class PPTCloneApp(QMainWindow):
         color = QColorDialog.getColor(initial_color, self, self._t("选择文本框背景色", "Choose background color"))
 
         if color.isValid():
-            self.push_undo_current_slide()
+            self.push_undo_selected_box()
             self.selected_box.custom_bg_color = color
             self.selected_box.use_custom_bg = True
             self.selected_box._sync_model_bg()
@@ -6353,7 +7393,7 @@ class PPTCloneApp(QMainWindow):
             return int(max(6, min(MAX_PT, int(round(float(pt))))))
         except Exception:
             # Fallback: simple height-based estimate (still in pt at 96 DPI mapping).
-            est = int(round(max(6.0, min(float(MAX_PT), (h * 72.0 / 96.0) * 0.8))))
+            est = int(round(max(6.0, min(float(MAX_PT), (h * PT_PER_PX) * 0.8))))
             return int(est)
 
     def _prepare_boxes_for_ppt_export(self, image_path: str, boxes):
@@ -6366,15 +7406,20 @@ class PPTCloneApp(QMainWindow):
         if not isinstance(src_boxes, (list, tuple)) or not src_boxes:
             return list(src_boxes) if isinstance(src_boxes, (list, tuple)) else []
 
-        ppt_scale = 1.0
-        try:
-            from PIL import Image
+        # 只有需要重新拟合字号的框才用得到缩放比例；画布里打开过的页通常已全部有字号，
+        # 此时不必为读尺寸再打开一次图片。
+        ppt_scale = None
 
-            p = self._get_export_image_path(image_path)
-            with Image.open(p) as img:
-                _, _, ppt_scale = PPTExporter._scale_to_ppt_limit(*img.size)
-        except Exception:
-            ppt_scale = 1.0
+        def get_ppt_scale():
+            nonlocal ppt_scale
+            if ppt_scale is None:
+                ppt_scale = 1.0
+                try:
+                    p = self._get_export_image_path(image_path)
+                    _, _, ppt_scale = PPTExporter._scale_to_ppt_limit(*PPTExporter.image_size(p))
+                except Exception:
+                    ppt_scale = 1.0
+            return ppt_scale
 
         out = []
         for item in src_boxes:
@@ -6382,7 +7427,7 @@ class PPTCloneApp(QMainWindow):
                 out.append(item)
                 continue
 
-            m = copy.deepcopy(item)
+            m = copy_box(item)
             rect = m.get("rect")
             if not (isinstance(rect, (list, tuple)) and len(rect) == 4):
                 out.append(m)
@@ -6394,10 +7439,6 @@ class PPTCloneApp(QMainWindow):
                 out.append(m)
                 continue
 
-            # Compute in the same "scaled slide" coordinate system as PPTExporter.
-            w_s = max(1, int(round(float(w) * float(ppt_scale))))
-            h_s = max(1, int(round(float(h) * float(ppt_scale))))
-
             # If font_size is missing/invalid, or looks like it hit the old 200pt cap on a tall box,
             # re-fit with the higher cap.
             fs_raw = m.get("font_size")
@@ -6405,15 +7446,20 @@ class PPTCloneApp(QMainWindow):
                 fs = int(fs_raw) if fs_raw is not None else None
             except Exception:
                 fs = None
+            if fs is not None and not (LEGACY_FONT_CAP_MIN <= fs <= LEGACY_FONT_CAP_MAX):
+                out.append(m)
+                continue
+
+            # Compute in the same "scaled slide" coordinate system as PPTExporter.
+            ppt_scale_f = float(get_ppt_scale())
+            w_s = max(1, int(round(float(w) * ppt_scale_f)))
+            h_s = max(1, int(round(float(h) * ppt_scale_f)))
 
+            # Heuristic: existing 200pt often means "capped" for big titles; only override when
+            # the box height clearly allows a much larger size.
             need_fit = fs is None
             try:
-                # Heuristic: existing 200pt often means "capped" for big titles; only override when
-                # the box height clearly allows a much larger size.
-                if (not need_fit) and fs is not None and fs >= 200 and fs <= 205:
-                    h_pt_est = float(h_s) * 72.0 / 96.0
-                    if h_pt_est > (float(fs) + 30.0):
-                        need_fit = True
+                need_fit = need_fit or font_size_hit_legacy_cap(fs, h_s)
             except Exception:
                 pass
 
@@ -6446,11 +7492,65 @@ class PPTCloneApp(QMainWindow):
             kwargs["text_bg_color"] = None
         return PPTExporter(**kwargs)
 
+    def _export_ppt_reusing_preview(self, output_path: str) -> bool:
+        """导出 PPT；内容签名与上次预览一致且预览文件仍在时直接复制预览文件，不再重新构建。"""
+        try:
+            preview = self._reusable_preview_ppt(self._ppt_content_signature())
+            if preview:
+                if os.path.abspath(preview) != os.path.abspath(output_path):
+                    shutil.copyfile(preview, output_path)
+                return True
+        except Exception as e:
+            logger.debug(f"复用预览 PPT 失败，重新导出: {e}")
+        return self._export_ppt_to_path(output_path)
+
+    @staticmethod
+    def _file_stamp(path: str):
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def _reusable_preview_ppt(self, sig):
+        """上次生成的预览 PPT 可复用时返回其路径，否则返回 None。
+
+        预览文件会在 PowerPoint 里打开，用户可能编辑并保存过；除内容签名外还要求文件的
+        (mtime, 大小) 与生成时一致，避免把程序不知道的修改当成导出结果。
+        """
+        last = self._last_preview_ppt
+        if sig is None or not last or last[0] != sig:
+            return None
+        try:
+            if self._file_stamp(last[1]) != last[2]:
+                return None
+        except OSError:
+            return None
+        return last[1]
+
+    @staticmethod
+    def _read_file_bytes(path: str):
+        with open(path, "rb") as f:
+            return f.read()
+
     def _export_ppt_to_path(self, output_path: str) -> bool:
         export_items = self._collect_ppt_export_items()
         exporter = self._build_ppt_exporter(export_items)
-        for _, export_path, boxes in export_items:
-            exporter.add_image_with_text_boxes(export_path, boxes)
+        # Presentation 只能在本线程里逐页构建；后续几页的图片读取交给后台 I/O 线程，与当前页的 XML 构建重叠
+        pool = self._get_io_pool()
+        rest = iter(export_items)
+        window = deque()
+        for item in rest:
+            window.append((item, pool.submit(self._read_file_bytes, item[1])))
+            if len(window) >= EXPORT_PREFETCH_PAGES:
+                break
+        while window:
+            (_, export_path, boxes), fut = window.popleft()
+            nxt = next(rest, None)
+            if nxt is not None:
+                window.append((nxt, pool.submit(self._read_file_bytes, nxt[1])))
+            try:
+                data = fut.result()
+            except Exception:
+                data = None  # 交给导出器自己读，并按原逻辑报错
+            exporter.add_image_with_text_boxes(export_path, boxes, image_bytes=data)
         return exporter.save(output_path)
 
     def export_ppt(self):
@@ -6468,7 +7568,7 @@ class PPTCloneApp(QMainWindow):
             return
 
         try:
-            if self._export_ppt_to_path(save_path):
+            if self._export_ppt_reusing_preview(save_path):
                 QMessageBox.information(self, self._t("成功", "Success"), self._t(f"PPT已导出到:\n{save_path}", f"PPT exported to:\n{save_path}"))
             else:
                 QMessageBox.warning(self, self._t("失败", "Failed"), self._t("PPT导出失败", "Failed to export PPT."))
@@ -6510,12 +7610,57 @@ class PPTCloneApp(QMainWindow):
         # 拖动中：只更新文本框背景，不重建场景（避免卡顿）
         self.update_all_text_boxes_background()
 
-        # 只有在非拖动状态时才触发场景重建
-        if not (hasattr(self, "slider_global_alpha") and
-                self.slider_global_alpha and
-                self.slider_global_alpha.isSliderDown()):
+        # 只有在非拖动状态时才触发场景重建（信号来自 slider_global_alpha 本身，控件必然存在）
+        if not self.slider_global_alpha.isSliderDown():
             self._schedule_scene_rebuild()
 
+    def _invalidate_ui(self, *tags):
+        """标记需要刷新的 UI 部分，在事件循环空闲时统一刷新一次。
+
+        tags: "thumbs"（缩略图）/ "background"（仅替换当前页底图）/ "scene"（保持视图重建当前页）/
+        "slide"（重新切换到当前页）/ "redraw"（强制整画布重绘）
+        """
+        self._dirty_ui.update(tags)
+        if not self._dirty_ui_timer.isActive():
+            self._dirty_ui_timer.start()
+
+    def _flush_dirty_ui(self):
+        dirty, self._dirty_ui = self._dirty_ui, set()
+        if "thumbs" in dirty:
+            self._refresh_thumb_images()
+        if "slide" in dirty:
+            # switch_slide 本身会重建场景并刷新状态栏
+            self.switch_slide(self.list_thumb.currentRow())
+        elif "scene" in dirty or ("background" in dirty and not self._replace_scene_background()):
+            try:
+                self._rebuild_scene_keep_view()
+            except Exception:
+                pass
+        if "redraw" in dirty:
+            self._redraw_canvas_now()
+
+    def _replace_scene_background(self) -> bool:
+        """原图/去字图切换时只替换底图图元的 pixmap，文本框图元保持不动。
+
+        背景层缺失或尺寸变化时返回 False，由调用方整页重建。
+        """
+        try:
+            if not self.current_img:
+                return False
+            pm = self._bg_pixmap_item
+            if pm is None or pm.scene() is not self.scene:
+                return False
+            pix = self._load_slide_pixmap(self._get_display_image_path(self.current_img))
+            cur = self._current_pixmap
+            if pix.isNull() or cur is None or pix.size() != cur.size():
+                return False
+            self._current_pixmap = pix
+            self._current_pixmap_key = self.current_img
+            self._apply_background_lod(pix)
+            return True
+        except Exception:
+            return False
+
     def _schedule_scene_rebuild(self):
         """短延迟兜底：重建当前页场景，修复透明度拖动时偶发的底图消失/不刷新。"""
         try:
@@ -6575,8 +7720,8 @@ class PPTCloneApp(QMainWindow):
             # 恢复选中
             if sel_idx is not None and sel_idx >= 0:
                 try:
-                    for it in self.scene.items():
-                        if isinstance(it, CanvasTextBox) and int(getattr(it, "model_index", -1)) == sel_idx:
+                    for it in self._canvas_boxes():
+                        if int(getattr(it, "model_index", -1)) == sel_idx:
                             self.on_item_clicked(it)
                             break
                 except Exception:
@@ -6631,29 +7776,22 @@ class PPTCloneApp(QMainWindow):
     def update_all_text_boxes_background(self):
         """更新画布上所有文本框的背景色"""
         if hasattr(self, 'scene') and self.scene:
-            # QGraphicsScene.items() 可能返回 group 子项而不是 group 本身；这里向上找 parentItem
-            # 以确保切换全局背景色时所有文本框都能被刷新。
+            # 直接遍历已登记的文本框；scene.items() 会返回 group 的全部子项，需要逐个向上找 parentItem
             count = 0
-            seen = set()
-            for item in self.scene.items():
-                cur = item
-                while cur is not None:
-                    if isinstance(cur, CanvasTextBox):
-                        key = id(cur)
-                        if key not in seen:
-                            cur.update_background()
-                            seen.add(key)
-                            count += 1
-                        break
-                    try:
-                        cur = cur.parentItem()
-                    except Exception:
-                        cur = None
+            for box in self._canvas_boxes():
+                box.update_background()
+                count += 1
         logger.debug(f"已更新 {count} 个文本框的背景色")
         self._force_canvas_redraw()
 
     def _force_canvas_redraw(self):
-        """强制整个画布重绘（用于解决透明度调整后偶发的“底图未刷新/消失”问题）"""
+        """强制整个画布重绘（用于解决透明度调整后偶发的“底图未刷新/消失”问题）。
+
+        滑块拖动时每个 valueChanged 都会调用；这里只打脏标记，同一轮事件里的多次请求合并为一次同步重绘。
+        """
+        self._invalidate_ui("redraw")
+
+    def _redraw_canvas_now(self):
         try:
             # 透明度频繁变化时，Qt 偶发不重绘底图；先确保背景层还在
             self._ensure_scene_background()
@@ -6675,8 +7813,7 @@ class PPTCloneApp(QMainWindow):
             pass
 
     # ==================== ROI selection (for OCR / IOPaint) ====================
-    def _draw_roi_overlay(self):
-        """Draw ROI overlay rectangle for the current slide (if any)."""
+    def _remove_roi_item(self):
         try:
             if self._roi_item is not None:
                 self.scene.removeItem(self._roi_item)
@@ -6684,27 +7821,41 @@ class PPTCloneApp(QMainWindow):
             pass
         self._roi_item = None
 
-        if not self.current_img:
-            return
-        roi = (getattr(self, "roi_by_image", {}) or {}).get(self.current_img)
-        if not (isinstance(roi, (list, tuple)) and len(roi) == 4):
+    def _set_roi_item_rect(self, x, y, w, h):
+        """显示 ROI 矩形：已有图元时只 setRect，拖动框选时不再每次删除重建图元。"""
+        item = self._roi_item
+        try:
+            alive = item is not None and item.scene() is self.scene
+        except RuntimeError:
+            # scene.clear() 之后 C++ 对象已被销毁
+            alive = False
+        if alive:
+            item.setRect(x, y, w, h)
             return
+        self._roi_item = None
+        pen = QPen(QColor(210, 50, 38), 2, Qt.DashLine)
+        pen.setCosmetic(True)
+        item = QGraphicsRectItem(x, y, w, h)
+        item.setPen(pen)
+        item.setBrush(Qt.NoBrush)
+        item.setZValue(10_000)
+        item.setAcceptedMouseButtons(Qt.NoButton)
+        self.scene.addItem(item)
+        self._roi_item = item
+
+    def _draw_roi_overlay(self):
+        """Draw ROI overlay rectangle for the current slide (if any)."""
+        roi = (getattr(self, "roi_by_image", {}) or {}).get(self.current_img) if self.current_img else None
         try:
             x, y, w, h = [int(v) for v in roi]
         except Exception:
+            self._remove_roi_item()
             return
         if w <= 0 or h <= 0:
+            self._remove_roi_item()
             return
         try:
-            pen = QPen(QColor(210, 50, 38), 2, Qt.DashLine)
-            pen.setCosmetic(True)
-            item = QGraphicsRectItem(x, y, w, h)
-            item.setPen(pen)
-            item.setBrush(Qt.NoBrush)
-            item.setZValue(10_000)
-            item.setAcceptedMouseButtons(Qt.NoButton)
-            self.scene.addItem(item)
-            self._roi_item = item
+            self._set_roi_item_rect(x, y, w, h)
         except Exception:
             self._roi_item = None
 
@@ -6738,7 +7889,7 @@ class PPTCloneApp(QMainWindow):
             pass
 
     def toggle_roi_select_mode(self, *args):
-        self.set_roi_select_mode(not bool(getattr(self, "roi_select_mode", False)))
+        self.set_roi_select_mode(not bool(self.roi_select_mode))
 
     def clear_roi_current(self, *args):
         if not self.current_img:
@@ -6761,7 +7912,7 @@ class PPTCloneApp(QMainWindow):
         if not self.current_img:
             return
         try:
-            pos = self.view.mapToScene(event.position().toPoint() if hasattr(event, "position") else event.pos())
+            pos = self.view.event_scene_pos(event)
             self._roi_drag_start = QPointF(pos.x(), pos.y())
         except Exception:
             self._roi_drag_start = None
@@ -6770,7 +7921,7 @@ class PPTCloneApp(QMainWindow):
         if self._roi_drag_start is None or not self.current_img:
             return
         try:
-            pos = self.view.mapToScene(event.position().toPoint() if hasattr(event, "position") else event.pos())
+            pos = self.view.event_scene_pos(event)
             x1 = float(self._roi_drag_start.x())
             y1 = float(self._roi_drag_start.y())
             x2 = float(pos.x())
@@ -6780,20 +7931,7 @@ class PPTCloneApp(QMainWindow):
             w = int(round(abs(x2 - x1)))
             h = int(round(abs(y2 - y1)))
             # draw temp overlay (do not commit)
-            try:
-                if self._roi_item is not None:
-                    self.scene.removeItem(self._roi_item)
-            except Exception:
-                pass
-            pen = QPen(QColor(210, 50, 38), 2, Qt.DashLine)
-            pen.setCosmetic(True)
-            item = QGraphicsRectItem(x, y, w, h)
-            item.setPen(pen)
-            item.setBrush(Qt.NoBrush)
-            item.setZValue(10_000)
-            item.setAcceptedMouseButtons(Qt.NoButton)
-            self.scene.addItem(item)
-            self._roi_item = item
+            self._set_roi_item_rect(x, y, w, h)
         except Exception:
             pass
 
@@ -6802,7 +7940,7 @@ class PPTCloneApp(QMainWindow):
             self.set_roi_select_mode(False)
             return
         try:
-            pos = self.view.mapToScene(event.position().toPoint() if hasattr(event, "position") else event.pos())
+            pos = self.view.event_scene_pos(event)
             x1 = float(self._roi_drag_start.x())
             y1 = float(self._roi_drag_start.y())
             x2 = float(pos.x())
@@ -6813,7 +7951,7 @@ class PPTCloneApp(QMainWindow):
             h = int(round(abs(y2 - y1)))
 
             # Clamp to image bounds
-            pix = QPixmap(self._get_display_image_path(self.current_img))
+            pix = self._current_slide_pixmap()
             if not pix.isNull():
                 x = max(0, min(x, pix.width() - 1))
                 y = max(0, min(y, pix.height() - 1))
@@ -6851,14 +7989,14 @@ class PPTCloneApp(QMainWindow):
         """画布鼠标点击事件（用于吸管取色）"""
         if self.eyedropper_mode and self.current_img is not None:
             # 获取点击位置
-            pos = self.view.mapToScene(event.pos())
+            pos = self.view.event_scene_pos(event)
             x, y = int(pos.x()), int(pos.y())
 
             # 从当前图片获取颜色
             try:
                 # Sample from what user currently sees (original vs inpainted preview).
                 img_path = self._get_display_image_path(self.current_img)
-                img = _imread_any(img_path)
+                img = self._load_page_bgr(img_path)
                 if img is not None:
                     h, w = img.shape[:2]
                     if 0 <= x < w and 0 <= y < h:
@@ -6870,7 +8008,7 @@ class PPTCloneApp(QMainWindow):
                         if hasattr(self, 'picking_for_selected') and self.picking_for_selected:
                             # 为选中的文本框设置颜色
                             if self.selected_box and isinstance(self.selected_box, CanvasTextBox):
-                                self.push_undo_current_slide()
+                                self.push_undo_selected_box()
                                 self.selected_box.custom_bg_color = picked_color
                                 self.selected_box.use_custom_bg = True
                                 self.selected_box._sync_model_bg()
@@ -6910,6 +8048,38 @@ class PPTCloneApp(QMainWindow):
             except Exception as e:
                 logger.warning(f"吸管取色失败: {e}")
 
+    def _ppt_content_signature(self):
+        """导出内容签名（页面/底图文件/文本框/全局背景设置）；用于判断预览 PPT 是否需要重新生成。"""
+        try:
+            import hashlib
+
+            pages = []
+            for img_path in self.images:
+                export_path = self._get_export_image_path(img_path)
+                try:
+                    st = os.stat(export_path)
+                    stamp = (st.st_mtime_ns, st.st_size)
+                except Exception:
+                    stamp = None
+                pages.append([export_path, stamp, self.box_data.get(img_path, [])])
+            color = self.text_bg_color
+            payload = {
+                "pages": pages,
+                "use_text_bg": bool(self.use_text_bg),
+                "text_bg_color": [color.red(), color.green(), color.blue()],
+                "text_bg_alpha": int(getattr(self, "text_bg_alpha", 200)),
+            }
+            raw = json.dumps(
+                payload,
+                ensure_ascii=False,
+                sort_keys=True,
+                default=lambda o: o.tolist() if hasattr(o, "tolist") else str(o),
+            )
+            return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+        except Exception as e:
+            logger.debug(f"计算导出内容签名失败: {e}")
+            return None
+
     def _build_preview_ppt_path(self) -> str:
         import tempfile
         import time
@@ -6980,9 +8150,20 @@ class PPTCloneApp(QMainWindow):
 
         try:
             import time
-            temp_path = self._build_preview_ppt_path()
+            # 内容未变化且上次生成的预览文件仍在：直接打开，不重新导出
+            sig = self._ppt_content_signature()
+            temp_path = self._reusable_preview_ppt(sig)
+            ok = temp_path is not None
+            if not ok:
+                temp_path = self._build_preview_ppt_path()
+                ok = self._export_ppt_to_path(temp_path)
+                if ok:
+                    try:
+                        self._last_preview_ppt = (sig, temp_path, self._file_stamp(temp_path))
+                    except OSError:
+                        self._last_preview_ppt = None
 
-            if self._export_ppt_to_path(temp_path):
+            if ok:
                 # 记录创建时间，避免被过早清理导致“文件不存在”
                 self._temp_preview_ppts[temp_path] = time.time()
                 self._wait_until_file_ready(temp_path)
@@ -7023,6 +8204,9 @@ class PPTCloneApp(QMainWindow):
         MIN_AGE_SEC = PREVIEW_FILE_MIN_AGE_SEC
 
         items = getattr(self, "_temp_preview_ppts", {}) or {}
+        if not items:
+            # 定时器每分钟触发一次，没有待清理的预览文件时什么都不做
+            return
         if not isinstance(items, dict):
             # 兼容旧数据结构
             items = {p: 0 for p in list(items)}
@@ -7041,10 +8225,13 @@ class PPTCloneApp(QMainWindow):
                 keep[p] = ts
                 continue
 
+            # 直接删除，不先 exists 再 remove（少一次 stat）；文件已不在视为清理完成
             try:
-                if p and os.path.exists(p):
+                if p:
                     os.remove(p)
-                    continue
+                continue
+            except FileNotFoundError:
+                continue
             except Exception:
                 # 仍被占用：保留，等下次再试
                 keep[p] = ts or now
@@ -7061,6 +8248,13 @@ class PPTCloneApp(QMainWindow):
                 if not th.wait(3000):  # 等待最多3秒
                     logger.warning(f"线程 {th_name} 未能在3秒内停止")
 
+        try:
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=False, cancel_futures=True)
+                self._io_pool = None
+        except Exception:
+            pass
+
         # 尽量清理预览产生的临时文件（无法保证在 Office 仍占用时删除成功）
         try:
             self._cleanup_preview_ppts()
@@ -7073,11 +8267,14 @@ class PPTCloneApp(QMainWindow):
             pass
         try:
             if hasattr(self, "slide_assets_dir") and self.slide_assets_dir and os.path.exists(self.slide_assets_dir):
-                for name in os.listdir(self.slide_assets_dir):
-                    try:
-                        os.remove(os.path.join(self.slide_assets_dir, name))
-                    except Exception:
-                        pass
+                # scandir 的目录项自带类型信息：只删文件，不再对子目录逐个尝试 remove
+                with os.scandir(self.slide_assets_dir) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_file(follow_symlinks=False):
+                                os.remove(entry.path)
+                        except Exception:
+                            pass
                 try:
                     os.rmdir(self.slide_assets_dir)
                 except Exception:
@@ -7108,6 +8305,10 @@ class PPTCloneApp(QMainWindow):
         super().closeEvent(event)
 
 if __name__ == "__main__":
+    # 打包成 exe 后 PDF 渲染进程池的子进程需要从这里分流
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     # 配置日志格式
     logging.basicConfig(
         level=logging.DEBUG,
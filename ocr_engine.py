@@ -52,6 +52,57 @@ def check_gpu_available() -> bool:
     return False
 
 
+def _as_ocr_input(image):
+    """裁剪视图（img[y0:y1, x0:x1]）只有行跨度不同，OpenCV/PaddleOCR 预处理可直接读，不必整块复制；
+    仅在像素/通道本身不连续（如负步长、通道切片）时才复制为连续数组。"""
+    st = image.strides
+    row_ok = st[-1] == image.itemsize and (image.ndim < 3 or st[-2] == image.shape[-1] * image.itemsize)
+    if row_ok and st[0] > 0:
+        return image
+    return np.ascontiguousarray(image)
+
+
+def _poly_to_rect(poly):
+    """单个多边形 -> (x, y, w, h)"""
+    points = np.asarray(poly)
+    x = int(np.min(points[:, 0]))
+    y = int(np.min(points[:, 1]))
+    w = int(np.max(points[:, 0]) - x)
+    h = int(np.max(points[:, 1]) - y)
+    return x, y, w, h
+
+
+def _poly_to_list(poly):
+    """多边形转纯 Python 列表存入结果：3.x 的 dt_polys 是 ndarray，含 ndarray 的框字典
+    无法用 == 比较（撤销快照按 == 判断页面是否变化/是否重复），也不能直接写 JSON。"""
+    if isinstance(poly, np.ndarray):
+        return poly.tolist()
+    if isinstance(poly, tuple):
+        return [_poly_to_list(p) for p in poly]
+    if isinstance(poly, list):
+        return [_poly_to_list(p) if isinstance(p, (np.ndarray, tuple)) else p for p in poly]
+    return poly
+
+
+def _polys_to_rects(polys):
+    """整页多边形一次性转外接矩形：堆成 (N, K, 2) 后做一次 min/max，避免逐框的小数组归约。
+
+    点数不一致（不规则多边形）或格式异常时返回 None，由调用方逐个回退到 _poly_to_rect。
+    """
+    try:
+        arr = np.asarray(polys, dtype=np.float32)
+    except Exception:
+        return None
+    if arr.ndim != 3 or arr.shape[0] == 0 or arr.shape[2] < 2:
+        return None
+    mins = arr[:, :, :2].min(axis=1)
+    maxs = arr[:, :, :2].max(axis=1)
+    xy = mins.astype(np.int64)
+    # 与逐框版本一致：w/h = int(max - int(min))
+    wh = (maxs - xy).astype(np.int64)
+    return np.concatenate([xy, wh], axis=1).tolist()
+
+
 class OCREngine:
     """OCR引擎"""
 
@@ -125,6 +176,7 @@ class OCREngine:
         for params in params_list:
             try:
                 self.ocr = PaddleOCR(**params)
+                self._bind_version_impl()
                 print("[OK] OCR 引擎初始化成功！\n")
                 return
             except Exception as e:
@@ -133,12 +185,33 @@ class OCREngine:
 
         raise RuntimeError(f"OCR 初始化失败: {last_error}")
 
-    def recognize(self, image_path: str) -> List[Dict]:
+    def _bind_version_impl(self):
+        """按 PaddleOCR 版本一次性绑定调用与解析实现（版本在引擎生命周期内不变，识别时无需再分支）"""
+        if self.version >= 3:
+            # 3.x 使用 predict()，接受单张或列表输入，返回字典格式
+            self._invoke = self.ocr.predict
+            self._invoke_batch = lambda paths: list(self.ocr.predict(paths) or [])
+            self._parse = self._parse_v3
+        else:
+            # 2.x 使用 ocr()，不支持列表输入，逐张识别
+            self._invoke = lambda path: self.ocr.ocr(path, cls=False)
+            self._invoke_batch = self._ocr_each_v2
+            self._parse = self._parse_v2
+
+    def _ocr_each_v2(self, image_paths) -> List:
+        """2.x 逐张调用 ocr()，返回每张图片的首个结果"""
+        page_results = []
+        for image_path in image_paths:
+            result = self.ocr.ocr(image_path, cls=False)
+            page_results.append(result[0] if result else None)
+        return page_results
+
+    def recognize(self, image_path) -> List[Dict]:
         """
         识别图片中的文字
 
         Args:
-            image_path: 图片路径
+            image_path: 图片路径，或 BGR 格式的 numpy 数组（如选区裁剪图，直接传入可省去写临时文件）
 
         Returns:
             识别结果列表，每项包含:
@@ -147,90 +220,129 @@ class OCREngine:
             - confidence: 置信度
             - rect: (x, y, w, h) 矩形框
         """
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"图片不存在: {image_path}")
+        if isinstance(image_path, np.ndarray):
+            image_path = _as_ocr_input(image_path)
+            print(f"识别图像: {image_path.shape[1]}x{image_path.shape[0]}")
+        else:
+            if not os.path.exists(image_path):
+                raise FileNotFoundError(f"图片不存在: {image_path}")
 
-        print(f"识别图片: {os.path.basename(image_path)}")
+            print(f"识别图片: {os.path.basename(image_path)}")
 
-        # PaddleOCR 3.x 使用 predict()，2.x 使用 ocr()
-        if self.version >= 3:
-            result = self.ocr.predict(image_path)
-        else:
-            result = self.ocr.ocr(image_path, cls=False)
+        # PaddleOCR 3.x 使用 predict()，2.x 使用 ocr()（已在初始化时绑定）
+        result = self._invoke(image_path)
+
+        page_result = result[0] if result else None
+        return self._parse_page_result(page_result)
 
-        # 解析结果
+    def recognize_batch(self, image_paths: List) -> List[List[Dict]]:
+        """
+        批量识别多张图片，返回与 image_paths 顺序一致的结果列表
+
+        每项可以是路径或已解码的 BGR numpy 数组（与 recognize 相同）。
+        PaddleOCR 3.x 的 predict() 接受列表，一次调用即可分摊每次调用的
+        预处理/调度开销；2.x 的 ocr() 不支持列表输入，逐张识别。
+        """
+        image_paths = [
+            _as_ocr_input(p) if isinstance(p, np.ndarray) else p
+            for p in (image_paths or [])
+        ]
+        for image_path in image_paths:
+            if not isinstance(image_path, np.ndarray) and not os.path.exists(image_path):
+                raise FileNotFoundError(f"图片不存在: {image_path}")
+        if not image_paths:
+            return []
+
+        print(f"批量识别 {len(image_paths)} 张图片")
+
+        page_results = self._invoke_batch(image_paths)
+
+        out = []
+        for idx, image_path in enumerate(image_paths):
+            if isinstance(image_path, np.ndarray):
+                print(f"识别图像: {image_path.shape[1]}x{image_path.shape[0]}")
+            else:
+                print(f"识别图片: {os.path.basename(image_path)}")
+            page_result = page_results[idx] if idx < len(page_results) else None
+            out.append(self._parse_page_result(page_result))
+        return out
+
+    def _parse_page_result(self, page_result) -> List[Dict]:
+        """解析单张图片的识别结果（3.x 为字典，2.x 为 [bbox, (text, score)] 列表）"""
+        if not page_result:
+            print("未检测到文字")
+            return []
+
+        # 逐框日志先攒在本地，整页结束后一次性输出（逐框 print 在 Windows 控制台上非常慢）
+        log_lines = []
+        text_boxes = self._parse(page_result, log_lines)
+
+        log_lines.append(f"[OK] 识别完成，共 {len(text_boxes)} 个文本框\n")
+        print("\n".join(log_lines))
+        return text_boxes
+
+    def _parse_v3(self, page_result, log_lines) -> List[Dict]:
+        """解析 PaddleOCR 3.x 的字典格式结果"""
         text_boxes = []
+        dt_polys = page_result.get("dt_polys", [])
+        rec_texts = page_result.get("rec_texts", [])
+        rec_scores = page_result.get("rec_scores", [])
 
-        # PaddleOCR 3.x 返回字典格式
-        if self.version >= 3:
-            if not result or len(result) == 0:
-                print("未检测到文字")
-                return []
-
-            page_result = result[0]
-            dt_polys = page_result.get("dt_polys", [])
-            rec_texts = page_result.get("rec_texts", [])
-            rec_scores = page_result.get("rec_scores", [])
-
-            for idx, (poly, text) in enumerate(zip(dt_polys, rec_texts)):
-                try:
-                    # poly 是四点坐标列表
-                    points = np.array(poly)
-                    x = int(np.min(points[:, 0]))
-                    y = int(np.min(points[:, 1]))
-                    w = int(np.max(points[:, 0]) - x)
-                    h = int(np.max(points[:, 1]) - y)
-
-                    confidence = rec_scores[idx] if idx < len(rec_scores) else 1.0
-
-                    text_boxes.append({
-                        'bbox': poly,
-                        'text': text,
-                        'confidence': float(confidence),
-                        'rect': (x, y, w, h)
-                    })
+        rects = _polys_to_rects(dt_polys)
 
-                    print(f"  [{idx+1}] {text} ({confidence:.2f})")
+        for idx, (poly, text) in enumerate(zip(dt_polys, rec_texts)):
+            try:
+                x, y, w, h = rects[idx] if rects is not None else _poly_to_rect(poly)
 
-                except Exception as e:
-                    print(f"  [!] 解析第 {idx+1} 个文本框失败: {e}")
-                    continue
+                confidence = rec_scores[idx] if idx < len(rec_scores) else 1.0
 
-        # PaddleOCR 2.x 返回列表格式
-        else:
-            if not result or not result[0]:
-                print("未检测到文字")
-                return []
-
-            for idx, line in enumerate(result[0]):
-                try:
-                    bbox = line[0]  # 四点坐标
-                    text_info = line[1]  # (文本, 置信度)
-
-                    text = str(text_info[0])
-                    confidence = float(text_info[1])
-
-                    # 计算矩形框
-                    points = np.array(bbox)
-                    x = int(np.min(points[:, 0]))
-                    y = int(np.min(points[:, 1]))
-                    w = int(np.max(points[:, 0]) - x)
-                    h = int(np.max(points[:, 1]) - y)
-
-                    text_boxes.append({
-                        'bbox': bbox,
-                        'text': text,
-                        'confidence': confidence,
-                        'rect': (x, y, w, h)
-                    })
+                text_boxes.append({
+                    'bbox': _poly_to_list(poly),
+                    'text': text,
+                    'confidence': float(confidence),
+                    'rect': (x, y, w, h)
+                })
+
+                log_lines.append(f"  [{idx+1}] {text} ({confidence:.2f})")
+
+            except Exception as e:
+                log_lines.append(f"  [!] 解析第 {idx+1} 个文本框失败: {e}")
+                continue
+
+        return text_boxes
 
-                    print(f"  [{idx+1}] {text} ({confidence:.2f})")
+    def _parse_v2(self, page_result, log_lines) -> List[Dict]:
+        """解析 PaddleOCR 2.x 的 [bbox, (text, score)] 列表格式结果"""
+        text_boxes = []
+        try:
+            rects = _polys_to_rects([line[0] for line in page_result])
+        except Exception:
+            rects = None
+
+        for idx, line in enumerate(page_result):
+            try:
+                bbox = line[0]  # 四点坐标
+                text_info = line[1]  # (文本, 置信度)
+
+                text = str(text_info[0])
+                confidence = float(text_info[1])
+
+                # 计算矩形框（整页已一次性算好；堆叠失败时逐框回退）
+                x, y, w, h = rects[idx] if rects is not None else _poly_to_rect(bbox)
 
-                except Exception as e:
-                    print(f"  [!] 解析第 {idx+1} 个文本框失败: {e}")
-                    continue
+                text_boxes.append({
+                    'bbox': _poly_to_list(bbox),
+                    'text': text,
+                    'confidence': confidence,
+                    'rect': (x, y, w, h)
+                })
+
+                log_lines.append(f"  [{idx+1}] {text} ({confidence:.2f})")
+
+            except Exception as e:
+                log_lines.append(f"  [!] 解析第 {idx+1} 个文本框失败: {e}")
+                continue
 
-        print(f"[OK] 识别完成，共 {len(text_boxes)} 个文本框\n")
         return text_boxes
 
 
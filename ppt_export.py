@@ -1,20 +1,406 @@
 """
 PPT导出功能 - 可编辑文本版本
 """
+import pptx
 from pptx import Presentation
-from pptx.util import Pt
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
-from pptx.dml.color import RGBColor
-from pptx.oxml.ns import qn
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 import os
+import io
+import struct
+import zipfile
+import threading
+import contextlib
+import re
+import functools
+import concurrent.futures
+from xml.sax.saxutils import escape
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 
+# Windows字体目录
+FONT_DIR = "C:/Windows/Fonts"
+
+# 常见字体文件名映射
+FONT_FILE_MAP = {
+    "微软雅黑": ["msyh.ttc", "msyh.ttf"],
+    "宋体": ["simsun.ttc", "simsun.ttf"],
+    "黑体": ["simhei.ttf"],
+    "Arial": ["arial.ttf"],
+}
+
+
+# 保存 PPT 时的文件写缓冲大小
+SAVE_BUFFER_SIZE = 1 << 20
+
+# 已压缩的图片格式：写入 pptx 时原样存储（ZIP_STORED），deflate 既压不小又很耗 CPU
+STORED_MEDIA_EXTS = frozenset((".jpg", ".jpeg", ".png", ".gif", ".webp"))
+
+# 统一幻灯片尺寸时并行读取各页图片尺寸：页数达到下限才开线程池
+SIZE_PROBE_PARALLEL_MIN = 8
+SIZE_PROBE_WORKERS = min(4, os.cpu_count() or 1)
+
+# 字号适配时的字形度量参考像素：字宽/行高随像素大小线性缩放，只在该字号下测量一次
+FONT_METRIC_REF_PX = 64
+
+# Pillow 多行文本的默认行间额外间距（像素，不随字号缩放）
+MULTILINE_SPACING_PX = 4
+
+# 文本框对齐方式查找表（模块级，不在逐框循环里分支判断）：对齐名 -> DrawingML algn 值
+_ALIGN_MAP = {
+    "left": "l",
+    "center": "ctr",
+    "right": "r",
+}
+
+# 可编辑文本框的完整 <p:sp> 模板：一次 parse_xml 生成整个图元，不再逐个调用 python-pptx 属性 setter。
+# 结构与 add_textbox + 原先的各项设置一致：不自动调整大小、不换行、四边距 1pt、顶部对齐、无边框
+_TEXTBOX_SP_XML = (
+    "<p:sp " + nsdecls("a", "p") + ">"
+    '<p:nvSpPr><p:cNvPr id="{id}" name="TextBox {name_id}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>{fill}<a:ln><a:noFill/></a:ln></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none" lIns="12700" tIns="12700" rIns="12700" bIns="12700" rtlCol="0" anchor="t">'
+    "<a:noAutofit/></a:bodyPr><a:lstStyle/>{paragraphs}</p:txBody></p:sp>"
+)
+# 加粗/颜色只在非默认值（非加粗、黑色）时写出，默认值由主题继承
+_TEXTBOX_PPR_XML = (
+    '<a:pPr algn="{algn}"><a:defRPr sz="{sz}"{b}>{fill}'
+    '<a:latin typeface="{face}"/><a:ea typeface="{face}"/></a:defRPr></a:pPr>'
+)
+_TEXT_FILL_XML = '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+_SOLID_FILL_XML = '<a:solidFill><a:srgbClr val="{color}"><a:alpha val="{alpha}"/></a:srgbClr></a:solidFill>'
+
+# CJK 统一汉字范围，统计中文字符数时一次正则扫描完成
+_CJK_RE = re.compile("[\u4e00-\u9fff]")
+
+# XML 不允许的控制字符，按 python-pptx 的做法转义为 _xHHHH_
+_XML_CONTROL_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _rects_to_xywh(rects, img_w, img_h, tol=2):
+    """PPTExporter._rect_to_xywh 的整页向量化版本：(N, 4) 数组按 xywh/xyxy 两种解释一次性判定。
+
+    判定规则与逐框版本相同：只有 xyxy 合理时按 xyxy；xywh 合理（含两者都合理）时按 xywh；
+    都不合理时按 xywh 取整并修正为非负位置、至少 1px 的尺寸。
+    """
+    x, y, a, b = rects[:, 0], rects[:, 1], rects[:, 2], rects[:, 3]
+    pos_ok = (x >= 0) & (y >= 0)
+    xywh_ok = pos_ok & (a > 0) & (b > 0) & (x + a <= img_w + tol) & (y + b <= img_h + tol)
+    if xywh_ok.all():
+        # 常见情况：整页都是合法的 xywh，跳过 xyxy 判定
+        return rects
+    w2 = a - x
+    h2 = b - y
+    xyxy_ok = pos_ok & (w2 > 0) & (h2 > 0) & (a <= img_w + tol) & (b <= img_h + tol)
+    use_xyxy = xyxy_ok & ~xywh_ok
+    bad = ~(xyxy_ok | xywh_ok)
+    return np.stack([
+        np.where(bad, np.maximum(0, np.rint(x)), x),
+        np.where(bad, np.maximum(0, np.rint(y)), y),
+        np.where(use_xyxy, w2, np.where(bad, np.maximum(1, np.rint(a)), a)),
+        np.where(use_xyxy, h2, np.where(bad, np.maximum(1, np.rint(b)), b)),
+    ], axis=1)
+
+
+@functools.lru_cache(maxsize=256)
+def _paragraph_ppr_xml(algn, sz, bold, color_rgb, family):
+    """段落格式 <a:pPr> 片段；同一份 PPT 里样式组合通常只有少数几种，每种只格式化/转义一次"""
+    return _TEXTBOX_PPR_XML.format(
+        algn=algn,
+        sz=sz,
+        b=' b="1"' if bold else "",
+        fill=_TEXT_FILL_XML.format(color="%02X%02X%02X" % color_rgb) if color_rgb != (0, 0, 0) else "",
+        face=escape(family, {'"': "&quot;"}),
+    )
+
+
+def _run_xml(line):
+    """一行文本 -> <a:r>/<a:br/> 序列；垂直制表符（软回车）转为 <a:br/>，与 python-pptx 的 text setter 一致"""
+    parts = []
+    for i, seg in enumerate(line.split("\v")):
+        if i:
+            parts.append("<a:br/>")
+        if seg:
+            seg = _XML_CONTROL_CHARS.sub(lambda m: "_x%04X_" % ord(m.group()), escape(seg))
+            parts.append("<a:r><a:t>" + seg + "</a:t></a:r>")
+    return "".join(parts)
+
+
+def _rgb_tuple(value):
+    """[r, g, b] -> (r, g, b) 整数元组；一次 map(int, ...) 在 C 层完成转换，格式不对返回 None"""
+    if isinstance(value, (list, tuple)) and len(value) == 3:
+        try:
+            return tuple(map(int, value))
+        except Exception:
+            return None
+    return None
+
+
+# JPEG 中携带图像尺寸的 SOF 段标记（排除 DHT/JPG/DAC）
+_JPEG_SOF_MARKERS = frozenset((0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+                               0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF))
+# 从文件读取尺寸时只读开头这么多字节（JPEG 的 SOF 一般位于 EXIF/ICC 段之后）
+IMAGE_HEADER_PROBE_BYTES = 64 * 1024
+
+
+def _probe_image_size(data):
+    """只解析文件头取 (w, h)：支持 PNG/JPEG/WebP，不解码像素；无法识别时返回 None"""
+    try:
+        if data[:8] == b"\x89PNG\r\n\x1a\n" and data[12:16] == b"IHDR":
+            return struct.unpack(">II", data[16:24])
+        if data[:2] == b"\xff\xd8":
+            i, n = 2, len(data)
+            while i + 9 < n:
+                if data[i] != 0xFF:
+                    return None
+                marker = data[i + 1]
+                if marker == 0xFF:
+                    i += 1
+                    continue
+                if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+                    i += 2
+                    continue
+                if marker in _JPEG_SOF_MARKERS:
+                    h, w = struct.unpack(">HH", data[i + 5:i + 9])
+                    return (w, h)
+                i += 2 + struct.unpack(">H", data[i + 2:i + 4])[0]
+            return None
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            chunk = data[12:16]
+            if chunk == b"VP8 ":
+                w, h = struct.unpack("<HH", data[26:30])
+                return (w & 0x3FFF, h & 0x3FFF)
+            if chunk == b"VP8L":
+                bits = struct.unpack("<I", data[21:25])[0]
+                return (1 + (bits & 0x3FFF), 1 + ((bits >> 14) & 0x3FFF))
+            if chunk == b"VP8X":
+                w = int.from_bytes(data[24:27], "little") + 1
+                h = int.from_bytes(data[27:30], "little") + 1
+                return (w, h)
+    except (struct.error, IndexError):
+        pass
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _image_size_cached(path, mtime_ns, file_size):
+    with open(path, "rb") as f:
+        size = _probe_image_size(f.read(IMAGE_HEADER_PROBE_BYTES))
+    if size is not None:
+        return size
+    with Image.open(path) as img:
+        return img.size
+
+
+def _image_size(path):
+    """图片 (w, h)；按 (路径, mtime, 文件大小) 缓存，页图没变时反复导出/预览不再打开图片。读取失败抛异常"""
+    st = os.stat(path)
+    return _image_size_cached(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_template_bytes():
+    """python-pptx 自带的默认模板只读一次；之后每次导出都从内存里的副本打开，不再重复找文件/读盘"""
+    path = os.path.join(os.path.dirname(pptx.__file__), "templates", "default.pptx")
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _new_presentation():
+    try:
+        return Presentation(io.BytesIO(_default_template_bytes()))
+    except Exception:
+        return Presentation()
+
+
+def _zip_pkg_writer_class():
+    """python-pptx 内部的 zip 写出器类；不同版本位置不同，找不到时返回 None"""
+    try:
+        from pptx.opc.serialized import _ZipPkgWriter      # python-pptx >= 0.6.22
+        return _ZipPkgWriter
+    except ImportError:
+        pass
+    try:
+        from pptx.opc.phys_pkg import _ZipPkgWriter        # python-pptx 0.6.21
+        return _ZipPkgWriter
+    except ImportError:
+        return None
+
+
+def _write_stored_media(self, pack_uri, blob):
+    """_ZipPkgWriter.write 的替身：ppt/media 下已压缩的图片用 ZIP_STORED，其余部件（XML 等）仍 deflate"""
+    name = pack_uri.membername
+    stored = name.startswith("ppt/media/") and os.path.splitext(name)[1].lower() in STORED_MEDIA_EXTS
+    self._zipf.writestr(name, blob, compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED)
+
+
+# 保存期间临时替换写出器方法，串行化以免并发保存互相还原
+_SAVE_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def _stored_media_saving():
+    """仅在本次保存期间让 python-pptx 原样存储图片（python-pptx 没有公开压缩方式的选项），退出时还原。
+
+    找不到写出器类（python-pptx 内部结构变化）时提示一次并按默认方式保存。
+    """
+    with _SAVE_LOCK:
+        writer = _zip_pkg_writer_class()
+        if writer is None or not hasattr(writer, "write"):
+            print("[INFO] 未找到 python-pptx 的 zip 写出器，图片按默认方式压缩保存")
+            yield
+            return
+        original = writer.__dict__.get("write")
+        writer.write = _write_stored_media
+        try:
+            yield
+        finally:
+            if original is not None:
+                writer.write = original
+            else:
+                del writer.write
+
+
+@functools.lru_cache(maxsize=128)
+def _load_font(font_path, px):
+    """(font_path, px) -> FreeTypeFont；模块级共享，多次导出/预览之间不再重复解析字体文件"""
+    return ImageFont.truetype(font_path, px)
+
+
+@functools.lru_cache(maxsize=16)
+def _font_advance_table(font_path):
+    """font_path -> (字符步进宽度表, 多行行距)，均为 FONT_METRIC_REF_PX 下的像素值；宽度表按需补充
+
+    行距与 Pillow 多行 textbbox 一致取 "A" 的包围盒底边（行间额外的 MULTILINE_SPACING_PX 不随字号缩放，单独计算）。
+    """
+    font = _load_font(font_path, FONT_METRIC_REF_PX)
+    return {}, font.getbbox("A")[3]
+
+
+@functools.lru_cache(maxsize=4096)
+def _line_ink_ref(font_path, line):
+    """参考字号下单行文字墨迹的 (上, 下) 边界，与原先 textbbox 测得的高度同口径"""
+    _, top, _, bottom = _load_font(font_path, FONT_METRIC_REF_PX).getbbox(line)
+    return top, bottom
+
+
+def _text_extent_ref(font_path, text):
+    """参考字号下文本的 (宽, 高, 固定高度)。
+
+    宽取最长一行的步进宽度之和；高为各行墨迹包围盒的并集高度（与 textbbox 一致），
+    固定高度是多行之间不随字号缩放的行间距之和。
+    """
+    adv, line_spacing = _font_advance_table(font_path)
+    missing = set(text) - adv.keys()
+    if missing:
+        font = _load_font(font_path, FONT_METRIC_REF_PX)
+        for c in missing:
+            adv[c] = font.getlength(c)
+    lines = text.split("\n")
+    w = max(sum(adv[c] for c in line) for line in lines)
+    top = bottom = None
+    for i, line in enumerate(lines):
+        t, b = _line_ink_ref(font_path, line)
+        t += i * line_spacing
+        b += i * line_spacing
+        top = t if top is None else min(top, t)
+        bottom = b if bottom is None else max(bottom, b)
+    return w, bottom - top, (len(lines) - 1) * MULTILINE_SPACING_PX
+
+
+@functools.lru_cache(maxsize=4096)
+def _fit_font_size(text, box_w_px, box_h_px, min_pt, max_pt, dpi, padding_x, padding_y, font_path):
+    """PPTExporter.fit_font_size 的计算主体；参数均为不可变值，重复的 (文本, 框尺寸) 直接命中缓存"""
+    avail_w = max(1, box_w_px - padding_x)
+    avail_h = max(1, box_h_px - padding_y)
+
+    if not font_path:
+        # 如果找不到字体，使用基于高度的估算
+        est = int(avail_h * 72 / dpi * 0.8)
+        return max(min_pt, min(est, max_pt))
+
+    # 参考字号下测一次文本尺寸；文字尺寸与像素大小成正比，宽/高约束可直接解出最大字号
+    try:
+        ref_w, ref_h, fixed_h = _text_extent_ref(font_path, text)
+    except Exception:
+        ref_w = ref_h = 0
+    if ref_w <= 0 or ref_h <= 0:
+        est = int(avail_h * 72 / dpi * 0.8)
+        return max(min_pt, min(est, max_pt))
+
+    px = min(avail_w * FONT_METRIC_REF_PX / ref_w,
+             max(0, avail_h - fixed_h) * FONT_METRIC_REF_PX / ref_h)
+
+    # 上限基于高度估算，但不要太激进
+    lo = min_pt
+    hi = min(max_pt, max(min_pt, int(avail_h * 72 / dpi * 1.2)))
+    best = max(lo, min(int(px * 72 / dpi), hi))
+
+    # 字形 hinting 使尺寸并非严格线性：从估算值起逐档向上/向下用真实 textbbox 校正到“能放下的最大字号”，
+    # 结果与原先的逐档二分查找一致。估算值通常就是答案或只差 1 档（测量 1~3 次），
+    # 少数情况差 2~3 档；不限制步数，向下校正截断会返回放不下的字号
+    def fits(pt):
+        return _text_fits(text, font_path, max(1, int(round(pt * dpi / 72))), avail_w, avail_h)
+
+    if fits(best):
+        while best < hi and fits(best + 1):
+            best += 1
+    else:
+        while best > lo and not fits(best):
+            best -= 1
+
+    return max(min_pt, min(best, max_pt))
+
+
+@functools.lru_cache(maxsize=1)
+def _measure_draw():
+    """测量文字用的画布，进程内共用一个"""
+    return ImageDraw.Draw(Image.new("RGB", (8, 8)))
+
+
+def _text_fits(text, font_path, px, avail_w, avail_h):
+    """text 在 px 像素字号下的墨迹包围盒是否放得进 avail_w x avail_h；测量失败按放得下处理
+
+    字号的主体估算已改用 getlength 步进宽度（见 _text_extent_ref），这里只做估算值附近的一两次校正，
+    仍用 textbbox：getmetrics 的 ascent+descent 含整套字体的上下留白，比墨迹高出约三成，
+    换用后 OCR 紧贴文字的框会选出明显偏小的字号；逐行 getlength + getbbox 拼多行包围盒也不比
+    一次 textbbox 快，且步进宽度与墨迹宽度不同，个别字号会差 1pt。
+    """
+    try:
+        left, top, right, bottom = _measure_draw().textbbox((0, 0), text, font=_load_font(font_path, px))
+    except Exception:
+        return True
+    return right - left <= avail_w and bottom - top <= avail_h
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_font_paths():
+    """启动后首次使用时一次性探测全部已知字体：字体名 -> 路径或 None（运行期间字体目录视为不变）"""
+    paths = {}
+    for font_name, filenames in FONT_FILE_MAP.items():
+        paths[font_name] = None
+        for filename in filenames:
+            path = os.path.join(FONT_DIR, filename)
+            if os.path.exists(path):
+                paths[font_name] = path
+                break
+    return paths
+
+
+def _find_font_file(font_name):
+    """查找字体文件路径（查表，不再逐次 os.path.exists）"""
+    return _probe_font_paths().get(font_name)
+
+
 class PPTExporter:
     """PPT导出器"""
 
     # 96 DPI: 1px = 914400 / 96 = 9525 EMU
     PIXELS_TO_EMU = 9525
+    # 1pt = 12700 EMU
+    EMU_PER_PT = 12700
     MAX_PPT_PIXELS = 5000
 
     def __init__(self, text_bg_color=None, text_bg_alpha=200, slide_size_px=None, allow_upscale=False):
@@ -27,7 +413,7 @@ class PPTExporter:
             slide_size_px: 固定幻灯片尺寸 (width_px, height_px)。混合尺寸导出时应预先传入。
             allow_upscale: 当图片小于固定幻灯片尺寸时，是否放大填充。
         """
-        self.prs = Presentation()
+        self.prs = _new_presentation()
         self.text_bg_color = text_bg_color  # 例如: (255, 255, 255) 白色
         try:
             self.text_bg_alpha = int(text_bg_alpha)
@@ -36,6 +422,8 @@ class PPTExporter:
         self.dimensions_set = False  # 标记是否已设置尺寸
         self.slide_size_px = self._normalize_slide_size(slide_size_px)
         self.allow_upscale = bool(allow_upscale)
+        # 逐文本框调试输出（默认关闭：大页面上每框几次 print 会明显拖慢导出）
+        self.verbose = False
 
     @classmethod
     def _scale_to_ppt_limit(cls, img_width, img_height):
@@ -52,18 +440,36 @@ class PPTExporter:
             scaled_height = img_height
         return scaled_width, scaled_height, float(ppt_scale)
 
+    @staticmethod
+    def image_size(image_path):
+        """页图 (w, h)，按文件 mtime/大小缓存"""
+        return _image_size(image_path)
+
     @classmethod
     def presentation_size_for_images(cls, image_paths):
-        max_w = 1
-        max_h = 1
-        for image_path in image_paths or []:
+        def probe(image_path):
             try:
-                with Image.open(image_path) as img:
-                    scaled_w, scaled_h, _ = cls._scale_to_ppt_limit(*img.size)
-                max_w = max(max_w, scaled_w)
-                max_h = max(max_h, scaled_h)
+                return _image_size(image_path)
             except Exception:
+                return None
+
+        image_paths = list(image_paths or [])
+        # 各页只读文件头、互不相关；页数多时并行读取，慢盘/网络盘上不再逐页排队等 I/O
+        if len(image_paths) >= SIZE_PROBE_PARALLEL_MIN:
+            workers = min(SIZE_PROBE_WORKERS, len(image_paths))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ppt-size") as pool:
+                sizes = list(pool.map(probe, image_paths))
+        else:
+            sizes = [probe(p) for p in image_paths]
+
+        max_w = 1
+        max_h = 1
+        for size in sizes:
+            if size is None:
                 continue
+            scaled_w, scaled_h, _ = cls._scale_to_ppt_limit(*size)
+            max_w = max(max_w, scaled_w)
+            max_h = max(max_h, scaled_h)
         return max_w, max_h
 
     def _normalize_slide_size(self, slide_size_px):
@@ -131,13 +537,15 @@ class PPTExporter:
         # 容错：允许轻微越界（例如四舍五入导致的 1-2px 偏差）
         tol = 2
 
-        # 作为 (x, y, w, h) 的合法性判断
+        # 作为 (x, y, w, h) 的合法性判断；本项目约定为 xywh，合法时直接返回（绝大多数框走这里）
         xywh_ok = (
             a > 0 and b > 0
             and x >= 0 and y >= 0
             and (x + a) <= (img_w + tol)
             and (y + b) <= (img_h + tol)
         )
+        if xywh_ok:
+            return x, y, a, b
 
         # 作为 (x1, y1, x2, y2) 的合法性判断
         w2 = a - x
@@ -149,13 +557,10 @@ class PPTExporter:
             and b <= (img_h + tol)
         )
 
-        # 若只有一种解释合理，则选择它；都合理时默认按 xywh（本项目约定）
-        if xyxy_ok and not xywh_ok:
+        # xywh 不合理而 xyxy 合理时按 xyxy
+        if xyxy_ok:
             return x, y, w2, h2
 
-        if xywh_ok:
-            return x, y, a, b
-
         # 都不合理，按 xywh 回退并做基本修正，避免生成异常/巨大文本框
         x = max(0, int(round(x)))
         y = max(0, int(round(y)))
@@ -163,7 +568,7 @@ class PPTExporter:
         h = max(1, int(round(b)))
         return x, y, w, h
 
-    def add_image_with_text_boxes(self, image_path: str, text_boxes: list, title: str = ""):
+    def add_image_with_text_boxes(self, image_path: str, text_boxes: list, title: str = "", image_bytes=None):
         """
         添加带可编辑文本框的图片页（按图片原始大小）
 
@@ -171,15 +576,23 @@ class PPTExporter:
             image_path: 图片路径
             text_boxes: 文本框列表，每项包含 rect, text, confidence
             title: 页面标题（不使用）
+            image_bytes: 已读好的图片文件内容（可选；调用方可在后台线程预读，省去这里的磁盘读取）
         """
         # 创建空白页
         blank_layout = self.prs.slide_layouts[6]  # 空白布局
         slide = self.prs.slides.add_slide(blank_layout)
 
-        # 获取图片尺寸
+        # 图片只读一次进内存：取尺寸和插入 PPT 共用同一份字节，不再各自打开/读取文件
         try:
-            with Image.open(image_path) as img:
-                img_width, img_height = img.size
+            if image_bytes is None:
+                with open(image_path, "rb") as f:
+                    image_bytes = f.read()
+            image_stream = io.BytesIO(image_bytes)
+            size = _probe_image_size(image_bytes)
+            if size is None:
+                with Image.open(image_stream) as img:
+                    size = img.size
+            img_width, img_height = size
         except Exception as e:
             print(f"无法读取图片尺寸: {e}")
             return
@@ -201,8 +614,9 @@ class PPTExporter:
 
         # 添加图片
         try:
+            image_stream.seek(0)
             slide.shapes.add_picture(
-                image_path,
+                image_stream,
                 img_left, img_top,
                 width=ppt_img_width,
                 height=ppt_img_height
@@ -211,76 +625,67 @@ class PPTExporter:
             print(f"添加图片失败: {e}")
             return
 
-        # 添加可编辑的文本框
-        for item in text_boxes:
-            rect = item.get('rect') if isinstance(item, dict) else None
-            if rect is None:
-                continue
-
-            # 直接使用传入的坐标（已经在主程序中还原过了）
-            x, y, w, h = self._rect_to_xywh(rect, img_width, img_height)
+        # 添加可编辑的文本框：图元 id 从当前最大值起顺序分配，不再每个文本框扫描一遍 spTree
+        sp_tree = slide.shapes._spTree
+        shape_id = slide.shapes._next_shape_id
+        items = [item for item in text_boxes if isinstance(item, dict) and item.get('rect') is not None]
 
-            content_scale = float(layout["content_scale"])
-            x = int(round(float(x) * content_scale)) + int(layout["left"])
-            y = int(round(float(y) * content_scale)) + int(layout["top"])
-            w = max(1, int(round(float(w) * content_scale)))
-            h = max(1, int(round(float(h) * content_scale)))
-
-            text = item.get('text', "")
+        # 直接使用传入的坐标（已经在主程序中还原过了）；整页的框一次性归一化并缩放到幻灯片像素
+        rects = [item['rect'] for item in items]
+        try:
+            arr = np.asarray(rects, dtype=np.float64).reshape(len(rects), 4)
+        except Exception:
+            arr = None
+        # None 坐标会被 asarray 转成 NaN 而不报错：只有全部为有限值时才走向量化路径
+        if arr is not None and np.isfinite(arr).all():
+            xywh = _rects_to_xywh(arr, img_width, img_height)
+        else:
+            # 个别 rect 格式不对（长度不为 4、含 None/NaN 等）时逐框处理，无法解析的框跳过
+            kept, rows = [], []
+            for item, r in zip(items, rects):
+                try:
+                    row = np.asarray(self._rect_to_xywh(r, img_width, img_height), dtype=np.float64)
+                except Exception:
+                    row = None
+                if row is None or not np.isfinite(row).all():
+                    print(f"  [!] 跳过坐标无效的文本框: {r}")
+                    continue
+                kept.append(item)
+                rows.append(row)
+            items = kept
+            xywh = np.array(rows, dtype=np.float64).reshape(len(rows), 4)
+
+        content_scale = float(layout["content_scale"])
+        px = np.empty((len(items), 4), dtype=np.int64)
+        px[:, 0] = np.rint(xywh[:, 0] * content_scale) + int(layout["left"])
+        px[:, 1] = np.rint(xywh[:, 1] * content_scale) + int(layout["top"])
+        # 宽高至少 1px：OCR 可能会出现 0/负数宽高，避免生成异常文本框
+        px[:, 2:] = np.maximum(1, np.rint(xywh[:, 2:] * content_scale))
+        # 像素 -> EMU 同样整页一次换算；保留 OCR 的原始框大小（像素->EMU 1:1 映射），不增加余量，
+        # 避免 PowerPoint 自动调整文本框大小导致“变大”
+        emu = (px * pixels_to_emu).tolist()
+        px = px.tolist()
+
+        # items 已筛过只含 dict，循环内不再逐项 isinstance 判断
+        for item, (x, y, w, h), (ppt_x, ppt_y, ppt_w, ppt_h) in zip(items, px, emu):
+            g = item.get
+            text = g('text', "")
 
             # 调试：打印文本内容
-            print(f"  添加文本框: {text} (位置: {x}, {y}, 大小: {w}x{h})")
-
-            # OCR 可能会出现 0/负数宽高，跳过避免生成异常或巨大文本框
-            if w <= 0 or h <= 0:
-                continue
+            if self.verbose:
+                print(f"  添加文本框: {text} (位置: {x}, {y}, 大小: {w}x{h})")
 
-            ppt_x = int(x * pixels_to_emu)
-            ppt_y = int(y * pixels_to_emu)
-            # 使用原始宽度和高度，不增加余量
-            ppt_w = int(w * pixels_to_emu)
-            ppt_h = int(h * pixels_to_emu)
-
-            # 避免 PowerPoint 自动调整文本框大小导致“变大”
-            # 这里保留 OCR 的原始框大小（像素->EMU 1:1 映射）
-            ppt_w = max(1, ppt_w)
-            ppt_h = max(1, ppt_h)
-
-            # 创建文本框
-            textbox = slide.shapes.add_textbox(ppt_x, ppt_y, ppt_w, ppt_h)
-            text_frame = textbox.text_frame
-
-            # 设置文本
-            text_frame.auto_size = MSO_AUTO_SIZE.NONE  # 禁用"根据文本自动调整形状大小"
-            text_frame.text = str(text)  # 确保是字符串
-            text_frame.word_wrap = False  # 禁用自动换行，保持单行
-            text_frame.margin_left = Pt(1)
-            text_frame.margin_right = Pt(1)
-            text_frame.margin_top = Pt(1)
-            text_frame.margin_bottom = Pt(1)
-            text_frame.vertical_anchor = MSO_ANCHOR.TOP  # 顶部对齐，不使用垂直居中
-
-            # 设置段落格式
-            p = text_frame.paragraphs[0]
             # 对齐
-            align = (item.get("align") if isinstance(item, dict) else "left") or "left"
-            align = str(align).lower()
-            if align == "center":
-                p.alignment = PP_ALIGN.CENTER
-            elif align == "right":
-                p.alignment = PP_ALIGN.RIGHT
-            else:
-                p.alignment = PP_ALIGN.LEFT
+            align = g("align") or "left"
+            algn = _ALIGN_MAP.get(str(align).lower(), "l")
 
             # 使用二分查找法计算最佳字体大小，确保文本完全适配在文本框内
             # 注意：这里的 w, h 已经是缩放后的像素尺寸
-            font_size = None
-            if isinstance(item, dict):
-                fs = item.get("font_size")
-                try:
-                    font_size = int(fs) if fs is not None else None
-                except Exception:
-                    font_size = None
+            fs = g("font_size")
+            try:
+                font_size = int(fs) if fs is not None else None
+            except Exception:
+                font_size = None
             if font_size is None:
                 # 计算字体大小，并应用额外缩小系数
                 # 因为 PPT 的文本渲染引擎与画布预览不同，实际显示会偏大
@@ -288,106 +693,71 @@ class PPTExporter:
                 font_size = int(calculated_size * 0.70)
             elif layout["layout_scale"] != 1.0:
                 font_size = max(1, int(round(float(font_size) * float(layout["layout_scale"]))))
-            p.font.size = Pt(int(font_size))
 
-            print(f"    文本框尺寸: {w}x{h}px, 字体: {font_size}pt")
+            if self.verbose:
+                print(f"    文本框尺寸: {w}x{h}px, 字体: {font_size}pt")
 
-            # 字体（默认微软雅黑）
-            family = "微软雅黑"
-            if isinstance(item, dict) and item.get("font_family"):
-                family = str(item.get("font_family"))
-            p.font.name = family
-            try:
-                from pptx.oxml.shared import OxmlElement
-                rPr = p._element.get_or_add_rPr()
-                ea = OxmlElement('a:ea')
-                ea.set('typeface', family)
-                rPr.append(ea)
-            except:
-                pass
+            # 字体（默认微软雅黑）：latin 与 ea 同时指定，中文字符也使用该字体
+            family = g("font_family")
+            family = str(family) if family else "微软雅黑"
 
             # 加粗
-            if isinstance(item, dict):
-                p.font.bold = bool(item.get("bold", False))
+            bold = bool(g("bold", False))
 
             # 文字颜色
-            color_rgb = (0, 0, 0)
-            if isinstance(item, dict):
-                tc = item.get("text_color", [0, 0, 0])
-                if isinstance(tc, (list, tuple)) and len(tc) == 3:
-                    try:
-                        color_rgb = (int(tc[0]), int(tc[1]), int(tc[2]))
-                    except Exception:
-                        color_rgb = (0, 0, 0)
-            p.font.color.rgb = RGBColor(*color_rgb)
-
-            print(f"    字体: {font_size}pt")
+            color_rgb = _rgb_tuple(g("text_color")) or (0, 0, 0)
 
             # 设置文本框样式：支持每个文本框单独背景色（use_custom_bg + bg_color=[r,g,b]）
-            box_bg_color = None
-            if isinstance(item, dict):
-                bg = item.get("bg_color")
-                if item.get("use_custom_bg") and isinstance(bg, (list, tuple)) and len(bg) == 3:
-                    try:
-                        box_bg_color = (int(bg[0]), int(bg[1]), int(bg[2]))
-                    except Exception:
-                        box_bg_color = None
+            use_custom_bg = g("use_custom_bg")
+            box_bg_color = _rgb_tuple(g("bg_color")) if use_custom_bg else None
 
             # 单框背景色优先，其次全局背景色
             if box_bg_color is None:
                 box_bg_color = self.text_bg_color
 
             if box_bg_color:
-                textbox.fill.solid()
-                r, g, b = box_bg_color
-                textbox.fill.fore_color.rgb = RGBColor(r, g, b)
-                # 透明度（alpha:0-255 -> transparency:0-1）
+                # 透明度（alpha:0-255 -> DrawingML 0..100000）
                 alpha = self.text_bg_alpha
                 # 只有“单框自定义背景”才使用单框 alpha；全局背景使用全局 alpha
-                if isinstance(item, dict) and item.get("use_custom_bg"):
+                if use_custom_bg:
                     try:
-                        alpha = int(item.get("bg_alpha", self.text_bg_alpha))
+                        alpha = int(g("bg_alpha", self.text_bg_alpha))
                     except Exception:
                         alpha = self.text_bg_alpha
                 alpha = max(0, min(alpha, 255))
-                self._set_shape_fill_alpha(textbox, alpha)
+                fill = _SOLID_FILL_XML.format(
+                    color="%02X%02X%02X" % tuple(box_bg_color),
+                    alpha=int(alpha / 255.0 * 100000),
+                )
             else:
-                textbox.fill.background()
+                fill = "<a:noFill/>"
 
-            # 无边框
-            # 边框
-            # Border is intentionally disabled for this project.
-            textbox.line.fill.background()
+            # 每行一个段落，段落格式（对齐/字号/加粗/颜色/字体）逐段相同
+            ppr = _paragraph_ppr_xml(algn, int(font_size) * 100, bold, color_rgb, family)
+            paragraphs = "".join(
+                "<a:p>" + ppr + _run_xml(line) + "</a:p>" for line in str(text).split("\n")
+            )
 
-        print(f"[OK] 已添加页面 (图片尺寸: {img_width}x{img_height}, 共 {len(text_boxes)} 个文本框)")
+            # 创建文本框：整段 XML 一次解析后挂到 spTree
+            try:
+                sp = parse_xml(_TEXTBOX_SP_XML.format_map({
+                    "id": shape_id,
+                    "name_id": shape_id - 1,
+                    "x": ppt_x, "y": ppt_y, "cx": ppt_w, "cy": ppt_h,
+                    "fill": fill,
+                    "paragraphs": paragraphs,
+                }))
+            except Exception as e:
+                print(f"  [!] 生成文本框失败: {e}")
+                continue
+            sp_tree.append(sp)
+            shape_id += 1
 
-    def _set_shape_fill_alpha(self, shape, alpha_0_255: int):
-        """设置 shape 填充透明度（python-pptx 没有公开 API，只能改 XML）"""
-        try:
-            from pptx.oxml.xmlchemy import OxmlElement
-            spPr = shape._element.spPr
-            solidFill = spPr.find(qn("a:solidFill"))
-            if solidFill is None:
-                return
-            # 常见是 a:srgbClr，也可能是 a:schemeClr
-            clr = solidFill.find(qn("a:srgbClr"))
-            if clr is None:
-                clr = solidFill.find(qn("a:schemeClr"))
-            if clr is None:
-                return
-            alpha = clr.find(qn("a:alpha"))
-            if alpha is None:
-                alpha = OxmlElement("a:alpha")
-                clr.append(alpha)
-            # DrawingML: val=0..100000（不透明度百分比*1000）
-            val = int(max(0, min(255, int(alpha_0_255))) / 255.0 * 100000)
-            alpha.set("val", str(val))
-        except Exception:
-            pass
+        print(f"[OK] 已添加页面 (图片尺寸: {img_width}x{img_height}, 共 {len(text_boxes)} 个文本框)")
 
     def fit_font_size(self, text, box_w_px, box_h_px, min_pt=6, max_pt=200, dpi=96, padding_x=6, padding_y=2):
         """
-        使用二分查找法计算最佳字体大小，确保文字能完全适配文本框
+        按参考字号下的文本尺寸线性求出字号估算值，再在估算值附近逐档测量校正，确保文字能完全适配文本框
 
         Args:
             text: 文本内容
@@ -411,70 +781,17 @@ class PPTExporter:
         if box_w_px <= 0 or box_h_px <= 0:
             return max(min_pt, min(12, max_pt))
 
-        avail_w = max(1, box_w_px - padding_x)
-        avail_h = max(1, box_h_px - padding_y)
-
         # 尝试获取微软雅黑字体
         font_path = self._get_font_path("微软雅黑")
-        if not font_path:
-            # 如果找不到字体，使用基于高度的估算
-            est = int(avail_h * 72 / dpi * 0.8)
-            return max(min_pt, min(est, max_pt))
+        return _fit_font_size(text, box_w_px, box_h_px, min_pt, max_pt, dpi, padding_x, padding_y, font_path)
 
-        # 创建临时画布用于测量文字
-        draw = ImageDraw.Draw(Image.new("RGB", (8, 8)))
-
-        def fits(pt):
-            """测试指定字体大小是否能适配文本框"""
-            px = max(1, int(round(pt * dpi / 72)))
-            try:
-                font = ImageFont.truetype(font_path, px)
-            except:
-                return True
-            try:
-                bbox = draw.textbbox((0, 0), text, font=font)
-                w = bbox[2] - bbox[0]
-                h = bbox[3] - bbox[1]
-            except:
-                return True
-            return w <= avail_w and h <= avail_h
-
-        # 二分查找最大的适配字体大小
-        # 初始上限基于高度估算，但不要太激进
-        hi = min(max_pt, max(min_pt, int(avail_h * 72 / dpi * 1.2)))
-        lo = min_pt
-        best = min_pt
-
-        for _ in range(15):  # 增加迭代次数以获得更精确的结果
-            mid = (lo + hi) // 2
-            if fits(mid):
-                best = mid
-                lo = mid + 1
-            else:
-                hi = mid - 1
-
-        return max(min_pt, min(best, max_pt))
+    def _get_font(self, font_path, px):
+        """获取（缓存的）FreeTypeFont 对象"""
+        return _load_font(font_path, int(px))
 
     def _get_font_path(self, font_name):
         """获取字体文件路径"""
-        # Windows字体目录
-        font_dir = "C:/Windows/Fonts"
-
-        # 常见字体文件名映射
-        font_map = {
-            "微软雅黑": ["msyh.ttc", "msyh.ttf"],
-            "宋体": ["simsun.ttc", "simsun.ttf"],
-            "黑体": ["simhei.ttf"],
-            "Arial": ["arial.ttf"],
-        }
-
-        if font_name in font_map:
-            for filename in font_map[font_name]:
-                path = os.path.join(font_dir, filename)
-                if os.path.exists(path):
-                    return path
-
-        return None
+        return _find_font_file(font_name)
 
     def calculate_font_and_spacing(self, text, box_width, box_height):
         """
@@ -492,15 +809,15 @@ class PPTExporter:
             return 12, 0
 
         # 转换为点数
-        width_pt = box_width / Pt(1)
-        height_pt = box_height / Pt(1)
+        width_pt = box_width / self.EMU_PER_PT
+        height_pt = box_height / self.EMU_PER_PT
 
         # 去除边距后的可用空间
         available_width = width_pt - 2  # 左右边距各1pt
         available_height = height_pt - 2  # 上下边距各1pt
 
         # 统计中英文字符
-        chinese_count = sum(1 for c in text if '\u4e00' <= c <= '\u9fff')
+        chinese_count = len(_CJK_RE.findall(text))
         english_count = len(text) - chinese_count
         total_chars = len(text)
 
@@ -560,7 +877,6 @@ class PPTExporter:
         """
         try:
             from pptx.oxml.shared import OxmlElement
-            from pptx.util import Pt
 
             # 获取段落的运行元素
             for run in paragraph.runs:
@@ -581,7 +897,9 @@ class PPTExporter:
             output_path: 输出路径
         """
         try:
-            self.prs.save(output_path)
+            # python-pptx 按 zip 成员逐块写出；用 1 MiB 写缓冲代替默认 8 KiB，大幅减少写系统调用
+            with open(output_path, "wb", buffering=SAVE_BUFFER_SIZE) as f, _stored_media_saving():
+                self.prs.save(f)
             print(f"[OK] PPT已保存: {output_path}")
             return True
         except Exception as e:
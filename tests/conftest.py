@@ -0,0 +1,6 @@
+import os
+import sys
+
+# 测试不需要真实窗口：Qt 走离屏平台，项目根目录加入导入路径
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,29 @@
+"""PDF 页面渲染：主进程补渲染用调用方打开的文档，不留在渲染进程用的全局缓存里。"""
+import pytest
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("cv2")
+pytest.importorskip("PySide6")
+
+import main  # noqa: E402
+
+
+def test_render_with_open_doc_leaves_worker_cache_empty(tmp_path):
+    pdf_path = str(tmp_path / "in.pdf")
+    src = fitz.open()
+    page = src.new_page(width=200, height=100)
+    page.insert_text((20, 50), "hello")
+    src.save(pdf_path)
+    src.close()
+
+    doc = fitz.open(pdf_path)
+    try:
+        out = main._render_pdf_page(doc, 0, 2.0, str(tmp_path / "p1.png"), str(tmp_path / "p1.jpg"))
+    finally:
+        doc.close()
+
+    assert out.endswith("p1.png")
+    assert (tmp_path / "p1.png").stat().st_size > 0
+    assert main._PDF_WORKER_DOCS == {}
+    # 文档已关闭，源文件可以直接删除（Windows 上仍被打开时会失败）
+    (tmp_path / "in.pdf").unlink()
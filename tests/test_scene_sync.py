@@ -0,0 +1,83 @@
+"""OCR 结果增量同步到画布：删除框、再刷新识别结果后，保留下来的图元仍绑定正确的 model/序号。"""
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("PySide6")
+
+from PySide6.QtGui import QPixmap  # noqa: E402
+from PySide6.QtWidgets import QApplication, QGraphicsScene, QGraphicsView, QTextEdit  # noqa: E402
+
+import main  # noqa: E402
+
+App = main.PPTCloneApp
+
+
+class _Win:
+    """只带增量同步/删除所需状态的窗口替身（完整窗口依赖 qtawesome 等界面资源）。"""
+
+    _add_scene_box = App._add_scene_box
+    _canvas_boxes = App._canvas_boxes
+    _sync_scene_boxes_by_identity = App._sync_scene_boxes_by_identity
+    delete_box = App.delete_box
+
+    def __init__(self, image_path, boxes):
+        self.scene = QGraphicsScene()
+        self.view = QGraphicsView(self.scene)
+        self._bg_pixmap_item = self.scene.addPixmap(QPixmap(400, 300))
+        self.current_img = image_path
+        self.box_data = {image_path: boxes}
+        self._scene_boxes = []
+        self.selected_box = None
+        self.txt_edit = QTextEdit()
+        self.use_text_bg = False
+        for i, b in enumerate(boxes):
+            self._add_scene_box(main.CanvasTextBox(b, "", i, self))
+
+    def push_undo_current_slide(self, image_path=None):
+        pass
+
+    def _draw_roi_overlay(self):
+        pass
+
+    def _reset_right_panel_state(self):
+        pass
+
+
+def _box(text, y):
+    return {"text": text, "rect": [10, y, 120, 20], "bbox": [[10, y], [130, y], [130, y + 20], [10, y + 20]]}
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+def _items_by_index(win):
+    return sorted(win._canvas_boxes(), key=lambda it: it.model_index)
+
+
+def test_delete_then_ocr_refresh_keeps_items_bound(qapp):
+    boxes = [_box("a", 10), _box("b", 40), _box("c", 70), _box("d", 100)]
+    win = _Win("p.png", boxes)
+    b_item, c_item, d_item = [it for it in win._canvas_boxes() if it.model is not boxes[0]]
+
+    # 删除第一个框：后面的图元原地前移序号，仍绑定原来的 model
+    win.selected_box = next(it for it in win._canvas_boxes() if it.model is boxes[0])
+    win.delete_box()
+    assert [it.model["text"] for it in _items_by_index(win)] == ["b", "c", "d"]
+    assert [it.model_index for it in (b_item, c_item, d_item)] == [0, 1, 2]
+
+    # 选区识别替换了 "c"，并在前面插入了一个新框
+    data = win.box_data["p.png"]
+    new_first, new_c = _box("new", 5), _box("c2", 70)
+    win.box_data["p.png"] = [new_first, data[0], new_c, data[2]]
+    assert win._sync_scene_boxes_by_identity("p.png")
+
+    items = _items_by_index(win)
+    assert [it.model_index for it in items] == [0, 1, 2, 3]
+    for i, it in enumerate(items):
+        assert it.model is win.box_data["p.png"][i]
+    # 未变化的框复用原图元，被替换的框换了新图元
+    assert items[1] is b_item and items[3] is d_item
+    assert c_item.scene() is None
+    assert items[2] is not c_item
@@ -0,0 +1,83 @@
+"""撤销快照：OCR 结果页（PaddleOCR 3.x，dt_polys 为 ndarray）的共用与去重。"""
+import types
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+pytest.importorskip("PySide6")
+
+import main  # noqa: E402
+from ocr_engine import OCREngine  # noqa: E402
+
+
+def _ocr_page():
+    """按 PaddleOCR 3.x 的字典结果走一遍解析，得到与界面里一致的框列表。"""
+    page_result = {
+        "dt_polys": [
+            np.array([[10, 20], [110, 20], [110, 50], [10, 50]], dtype=np.int16),
+            np.array([[10, 60], [90, 60], [90, 80], [10, 80]], dtype=np.int16),
+        ],
+        "rec_texts": ["标题", "正文"],
+        "rec_scores": [np.float32(0.98), np.float32(0.91)],
+    }
+    engine = OCREngine.__new__(OCREngine)
+    return engine._parse_v3(page_result, [])
+
+
+def _fake_app(box_data):
+    return types.SimpleNamespace(box_data=box_data, undo_stack=[], redo_stack=[])
+
+
+def test_ocr_page_bbox_is_plain_list():
+    boxes = _ocr_page()
+    assert len(boxes) == 2
+    assert all(type(b["bbox"]) is list for b in boxes)
+    assert boxes[0]["bbox"] == [[10, 20], [110, 20], [110, 50], [10, 50]]
+    assert tuple(boxes[0]["rect"]) == (10, 20, 100, 30)
+
+
+def test_full_snapshot_shares_unchanged_ocr_page():
+    app = _fake_app({"a.png": _ocr_page(), "b.png": _ocr_page()})
+    first = main.PPTCloneApp._snapshot_box_data_shared(app)
+    app.undo_stack.append({"kind": "full", "box_data": first})
+
+    app.box_data["b.png"][0]["text"] = "改过"
+    second = main.PPTCloneApp._snapshot_box_data_shared(app)
+
+    assert second["a.png"] is first["a.png"]
+    assert second["b.png"] is not first["b.png"]
+    assert second["b.png"][0]["text"] == "改过"
+    assert first["b.png"][0]["text"] == "标题"
+
+
+def test_identical_ocr_page_snapshot_is_not_pushed_twice():
+    app = _fake_app({"a.png": _ocr_page()})
+
+    def slide_snap():
+        return {
+            "kind": "slide",
+            "image_path": "a.png",
+            "boxes": main.copy_boxes(app.box_data["a.png"]),
+            "roi": None,
+            "current_index": 0,
+        }
+
+    main.PPTCloneApp._push_undo_snapshot(app, slide_snap())
+    main.PPTCloneApp._push_undo_snapshot(app, slide_snap())
+    assert len(app.undo_stack) == 1
+
+    app.box_data["a.png"][1]["text"] = "改过"
+    main.PPTCloneApp._push_undo_snapshot(app, slide_snap())
+    assert len(app.undo_stack) == 2
+
+
+def test_identical_full_snapshot_is_not_pushed_twice():
+    app = _fake_app({"a.png": _ocr_page()})
+
+    def full_snap():
+        return {"kind": "full", "box_data": main.PPTCloneApp._snapshot_box_data_shared(app), "current_index": 0}
+
+    main.PPTCloneApp._push_undo_snapshot(app, full_snap())
+    main.PPTCloneApp._push_undo_snapshot(app, full_snap())
+    assert len(app.undo_stack) == 1